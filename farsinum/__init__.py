@@ -7,8 +7,31 @@ Farsinum: کتابخانه جامع پایتون برای کار با زبان 
 
 __version__ = "0.4.0" # افزایش نسخه
 
-from .numeral_converter import to_persian_numerals, to_english_numerals
-from .number_to_words import number_to_persian_words
+from .numeral_converter import (
+    to_persian_numerals,
+    to_english_numerals,
+    format_persian_number,
+    format_persian_numbers,
+    parse_persian_number,
+    parse_persian_numbers,
+    PERSIAN_THOUSANDS_SEPARATOR,
+    PERSIAN_DECIMAL_SEPARATOR
+)
+from .number_to_words import (
+    number_to_persian_words,
+    number_to_persian_words_many,
+    extend_persian_scales,
+    persian_words_to_number,
+    persian_words_to_number_many,
+    spell_out_numbers,
+    spell_out_numbers_stream,
+    DecimalWordsFormatter,
+    OrdinalWordsFormatter,
+    CurrencyWordsFormatter,
+    decimal_to_persian_words,
+    ordinal_to_persian_words,
+    currency_to_persian_words
+)
 from .text_normalizer import (
     persian_text_normalizer,
     normalize_characters,
@@ -16,15 +39,48 @@ from .text_normalizer import (
     standardize_quotes,
     standardize_ellipsis,
     add_zwnj_to_common_suffixes,
+    Normalizer,
+    normalize_stream,
+    normalize_file,
+    normalize_many,
+    needs_normalization,
+    NormalizationCache,
+    configure_normalization_cache,
     ZWNJ
 )
-from .text_analyzer import count_words, count_sentences, count_paragraphs
+from .text_analyzer import count_words, count_sentences, count_paragraphs, analyze_text, TextStats, count_file
+from .tokenizer import iter_tokens, iter_words
 from .date_converter import (
     gregorian_to_jalali,
     jalali_to_gregorian,
     today_jalali,
+    gregorian_to_jalali_ymd,
+    jalali_to_gregorian_ymd,
+    gregorian_to_jalali_many,
+    jalali_to_gregorian_many,
+    DateParser,
+    sniff_date_format,
+    jalali_strftime,
+    jalali_strptime,
+    tehran_timezone,
+    gregorian_to_jalali_datetime,
+    JalaliTimestampFormatter,
+    JalaliLogFormatter,
+    jalali_add_days,
+    jalali_add_months,
+    jalali_days_between,
+    jalali_period_start,
+    jalali_period_end,
+    iter_jalali_range,
+    DateMention,
+    extract_dates,
+    convert_dates_in_text,
+    convert_dates_in_stream,
+    JALALI,
+    GREGORIAN,
     DEFAULT_GREGORIAN_FORMAT,
     DEFAULT_JALALI_FORMAT,
+    DEFAULT_JALALI_DATETIME_FORMAT,
     COMMON_JALALI_FORMAT_WITH_DAY_NAME
 )
 from .sentiment_analyzer import ( # اضافه کردن ماژول جدید
@@ -63,17 +119,32 @@ from .longtail_keyword_generator import ( # اضافه کردن ماژول جد
 # توابعی که می‌خواهیم با from farsinum import * در دسترس باشند
 __all__ = [
     # Numeral Converter
-    "to_persian_numerals", "to_english_numerals",
+    "to_persian_numerals", "to_english_numerals", "format_persian_number", "format_persian_numbers",
+    "parse_persian_number", "parse_persian_numbers",
+    "PERSIAN_THOUSANDS_SEPARATOR", "PERSIAN_DECIMAL_SEPARATOR",
     # Number to Words
-    "number_to_persian_words",
+    "number_to_persian_words", "number_to_persian_words_many", "extend_persian_scales",
+    "persian_words_to_number", "persian_words_to_number_many", "spell_out_numbers", "spell_out_numbers_stream",
+    "DecimalWordsFormatter", "OrdinalWordsFormatter", "CurrencyWordsFormatter",
+    "decimal_to_persian_words", "ordinal_to_persian_words", "currency_to_persian_words",
     # Text Normalizer
     "persian_text_normalizer", "normalize_characters", "cleanup_spacing",
     "standardize_quotes", "standardize_ellipsis", "add_zwnj_to_common_suffixes", "ZWNJ",
+    "Normalizer", "normalize_stream", "normalize_file", "normalize_many", "needs_normalization",
+    "NormalizationCache", "configure_normalization_cache",
     # Text Analyzer
-    "count_words", "count_sentences", "count_paragraphs",
+    "count_words", "count_sentences", "count_paragraphs", "analyze_text", "TextStats", "count_file",
+    # Tokenizer
+    "iter_tokens", "iter_words",
     # Date Converter
     "gregorian_to_jalali", "jalali_to_gregorian", "today_jalali",
-    "DEFAULT_GREGORIAN_FORMAT", "DEFAULT_JALALI_FORMAT", "COMMON_JALALI_FORMAT_WITH_DAY_NAME",
+    "gregorian_to_jalali_ymd", "jalali_to_gregorian_ymd", "gregorian_to_jalali_many", "jalali_to_gregorian_many",
+    "DateParser", "sniff_date_format", "jalali_strftime", "jalali_strptime",
+    "tehran_timezone", "gregorian_to_jalali_datetime", "JalaliTimestampFormatter", "JalaliLogFormatter",
+    "jalali_add_days", "jalali_add_months", "jalali_days_between", "jalali_period_start", "jalali_period_end",
+    "iter_jalali_range", "DateMention", "extract_dates", "convert_dates_in_text", "convert_dates_in_stream",
+    "JALALI", "GREGORIAN",
+    "DEFAULT_GREGORIAN_FORMAT", "DEFAULT_JALALI_FORMAT", "DEFAULT_JALALI_DATETIME_FORMAT", "COMMON_JALALI_FORMAT_WITH_DAY_NAME",
     # Sentiment Analyzer
     "analyze_sentiment_simple", "SentimentLabel", "SentimentScore",
     # Version
@@ -0,0 +1,59 @@
+# farsinum/_batching.py
+
+"""اجرای دسته‌ای مشترک توابع *_many (نرمال‌سازی، عدد به حروف و حروف به عدد)."""
+
+import itertools
+import os
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from typing import Callable, Deque, Iterable, List, Optional, Sequence
+
+
+def map_in_batches(
+    convert_batch: Callable[[List], List],
+    items: Iterable,
+    workers: Optional[int],
+    chunksize: int,
+    parallel_threshold: int,
+    local_convert_batch: Optional[Callable[[List], List]] = None,
+    initializer: Optional[Callable[..., None]] = None,
+    initargs: Sequence = ()
+) -> List:
+    """
+    convert_batch را روی دسته‌های chunksize تایی ورودی اجرا و نتایج را به ترتیب ورودی برمی‌گرداند.
+
+    ورودی به صورت تنبل خوانده می‌شود؛ اگر حداقل parallel_threshold مورد داشته باشد و workers بیشتر از ۱
+    باشد، دسته‌ها بین پردازه‌ها پخش می‌شوند (در هر لحظه حداکثر دو دسته برای هر پردازه در جریان است).
+
+    Args:
+        convert_batch: تابع سطح ماژول (قابل pickle) که در پردازه‌های کارگر اجرا می‌شود.
+        local_convert_batch: تابع معادل برای اجرا در همین پردازه (پیش‌فرض: convert_batch).
+        initializer، initargs: یک بار در شروع هر پردازه کارگر اجرا می‌شود؛ وضعیتی که کارگرها باید
+                                ببینند (مثلا تنظیمات ماژول) باید از این راه فرستاده شود، چون پردازه‌هایی
+                                که با spawn ساخته می‌شوند وضعیت پردازه اصلی را به ارث نمی‌برند.
+    """
+    if chunksize <= 0:
+        raise ValueError("chunksize باید عددی مثبت باشد.")
+    if workers is None:
+        workers = os.cpu_count() or 1
+
+    iterator = iter(items)
+    head = list(itertools.islice(iterator, parallel_threshold))
+    if workers <= 1 or len(head) < parallel_threshold:
+        convert = local_convert_batch or convert_batch
+        results = convert(head)
+        for batch in iter(lambda: list(itertools.islice(iterator, chunksize)), []):
+            results.extend(convert(batch))
+        return results
+
+    results = []
+    batches = iter(lambda source=itertools.chain(head, iterator): list(itertools.islice(source, chunksize)), [])
+    with ProcessPoolExecutor(max_workers=workers, initializer=initializer, initargs=tuple(initargs)) as executor:
+        in_flight: Deque = deque()
+        for batch in batches:
+            in_flight.append(executor.submit(convert_batch, batch))
+            if len(in_flight) >= workers * 2:
+                results.extend(in_flight.popleft().result())
+        while in_flight:
+            results.extend(in_flight.popleft().result())
+    return results
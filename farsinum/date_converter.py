@@ -1,45 +1,614 @@
 # farsinum/date_converter.py
 
 import datetime
-import jdatetime
-from typing import Union, Optional, Tuple
-from .numeral_converter import to_persian_numerals # برای نمایش تاریخ با ارقام فارسی
+import itertools
+import logging
+import re
+import sys
+import threading
+import warnings
+from typing import TYPE_CHECKING, Callable, Dict, Iterable, Iterator, List, TextIO, Union, Optional, Tuple
+from .numeral_converter import _numpy_module, to_persian_numerals # برای نمایش تاریخ با ارقام فارسی
+
+if TYPE_CHECKING: # jdatetime وابستگی اجرایی نیست؛ اشیای آن فقط به عنوان ورودی پذیرفته می‌شوند
+    import jdatetime
 
 # فرمت‌های رایج برای ورودی و خروجی
 DEFAULT_GREGORIAN_FORMAT = "%Y-%m-%d"
 DEFAULT_JALALI_FORMAT = "%Y/%m/%d" # فرمت رایج فارسی
 COMMON_JALALI_FORMAT_WITH_DAY_NAME = "%A %d %B %Y" # شنبه ۱ فروردین ۱۴۰۳
 
-def _parse_gregorian_date(date_input: Union[str, datetime.date, datetime.datetime]) -> datetime.date:
-    """
-    ورودی تاریخ میلادی را تجزیه کرده و به شیء datetime.date تبدیل می‌کند.
-    """
-    if isinstance(date_input, datetime.datetime):
-        return date_input.date()
-    if isinstance(date_input, datetime.date):
-        return date_input
-    if isinstance(date_input, str):
-        # تلاش برای تجزیه با فرمت‌های رایج
-        formats_to_try = [
-            DEFAULT_GREGORIAN_FORMAT,
-            "%Y/%m/%d",
-            "%d-%m-%Y",
-            "%d/%m/%Y",
-            "%Y%m%d"
-        ]
-        for fmt in formats_to_try:
-            try:
-                return datetime.datetime.strptime(date_input, fmt).date()
-            except ValueError:
-                continue
-        raise ValueError(f"فرمت تاریخ میلادی '{date_input}' قابل تشخیص نیست. از فرمت YYYY-MM-DD استفاده کنید.")
-    raise TypeError("ورودی تاریخ میلادی باید رشته، datetime.date یا datetime.datetime باشد.")
+# --- هسته محاسباتی تبدیل تاریخ ---
+# تبدیل‌ها فقط با حساب روی «شماره روز» (ordinal میلادی، مانند datetime.date.toordinal) انجام می‌شوند
+# و هیچ شیء میانی ساخته نمی‌شود. قاعده کبیسه و بازه سال‌ها دقیقا همان jdatetime است
+# (الگوریتم jalali.c از FarsiWeb: دوره‌های ۳۳ ساله با ۸ سال کبیسه).
+
+JALALI_MIN_YEAR = 1
+JALALI_MAX_YEAR = 9377
+_JALALI_LEAP_REMAINDERS = frozenset((1, 5, 9, 13, 17, 22, 26, 30))
+_JALALI_DAYS_BEFORE_MONTH = (0, 0, 31, 62, 93, 124, 155, 186, 216, 246, 276, 306, 336)
+_GREGORIAN_DAYS_IN_MONTH = (0, 31, 28, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31)
+_GREGORIAN_DAYS_BEFORE_MONTH = (0, 0, 31, 59, 90, 120, 151, 181, 212, 243, 273, 304, 334)
+_JALALI_EPOCH_YEAR = 979
+_JALALI_EPOCH_ORDINAL = 584102 # ۹۷۹/۰۱/۰۱ شمسی = 1600-03-20 میلادی
+_JALALI_CYCLE_DAYS = 12053 # ۳۳ سال
+_JALALI_MIN_ORDINAL = 226895 # ۰۰۰۱/۰۱/۰۱ شمسی = 0622-03-21 میلادی
+_JALALI_MAX_ORDINAL = 3651773 # ۹۳۷۷/۱۲/۳۰ شمسی = 9999-03-20 میلادی
+
+
+def _is_jalali_leap(year: int) -> bool:
+    return year % 33 in _JALALI_LEAP_REMAINDERS
+
+
+def _is_gregorian_leap(year: int) -> bool:
+    return year % 4 == 0 and (year % 100 != 0 or year % 400 == 0)
+
+
+def _jalali_to_ordinal(year: int, month: int, day: int) -> int:
+    """شماره روز (ordinal میلادی) یک تاریخ شمسی معتبر."""
+    k = year - _JALALI_EPOCH_YEAR
+    return (
+        _JALALI_EPOCH_ORDINAL + 365 * k + (k // 33) * 8 + (k % 33 + 3) // 4
+        + _JALALI_DAYS_BEFORE_MONTH[month] + day - 1
+    )
+
+
+def _ordinal_to_jalali(ordinal: int) -> Tuple[int, int, int]:
+    """تاریخ شمسی (سال، ماه، روز) متناظر با یک شماره روز در بازه پشتیبانی‌شده."""
+    cycles, days = divmod(ordinal - _JALALI_EPOCH_ORDINAL, _JALALI_CYCLE_DAYS)
+    year = _JALALI_EPOCH_YEAR + 33 * cycles + 4 * (days // 1461)
+    days %= 1461
+    if days >= 366:
+        days -= 1
+        year += days // 365
+        days %= 365
+    if days < 186:
+        return year, days // 31 + 1, days % 31 + 1
+    days -= 186
+    return year, days // 30 + 7, days % 30 + 1
+
+
+def _gregorian_to_ordinal(year: int, month: int, day: int) -> int:
+    """شماره روز یک تاریخ میلادی معتبر (برابر datetime.date(year, month, day).toordinal())."""
+    y = year - 1
+    days_before_month = _GREGORIAN_DAYS_BEFORE_MONTH[month] + (month > 2 and _is_gregorian_leap(year))
+    return y * 365 + y // 4 - y // 100 + y // 400 + days_before_month + day
+
+
+def _ordinal_to_gregorian(ordinal: int) -> Tuple[int, int, int]:
+    """تاریخ میلادی (سال، ماه، روز) متناظر با یک شماره روز (برابر datetime.date.fromordinal)."""
+    n = ordinal - 1
+    n400, n = divmod(n, 146097)
+    n100, n = divmod(n, 36524)
+    n4, n = divmod(n, 1461)
+    n1, n = divmod(n, 365)
+    year = n400 * 400 + n100 * 100 + n4 * 4 + n1 + 1
+    if n1 == 4 or n100 == 4: # آخرین روز یک سال کبیسه
+        return year - 1, 12, 31
+    leap = _is_gregorian_leap(year)
+    month = (n + 50) >> 5 # تخمین ماه؛ حداکثر یکی بیشتر از مقدار درست است
+    preceding = _GREGORIAN_DAYS_BEFORE_MONTH[month] + (month > 2 and leap)
+    if preceding > n:
+        month -= 1
+        preceding = _GREGORIAN_DAYS_BEFORE_MONTH[month] + (month > 2 and leap)
+    return year, month, n - preceding + 1
+
+
+def _jalali_month_days(year: int, month: int) -> int:
+    if month <= 6:
+        return 31
+    if month <= 11:
+        return 30
+    return 30 if _is_jalali_leap(year) else 29
+
+
+def _check_jalali_date(year: int, month: int, day: int) -> None:
+    """اعتبارسنجی تاریخ شمسی با همان قواعد jdatetime.date."""
+    if not (JALALI_MIN_YEAR <= year <= JALALI_MAX_YEAR):
+        raise ValueError(f"سال شمسی {year} خارج از بازه {JALALI_MIN_YEAR} تا {JALALI_MAX_YEAR} است.")
+    if not 1 <= month <= 12:
+        raise ValueError(f"ماه شمسی {month} نامعتبر است (باید بین ۱ تا ۱۲ باشد).")
+    if not 1 <= day <= _jalali_month_days(year, month):
+        raise ValueError(f"روز {day} برای ماه {month} سال {year} شمسی نامعتبر است.")
+
+
+def _check_gregorian_date(year: int, month: int, day: int) -> None:
+    if not (datetime.MINYEAR <= year <= datetime.MAXYEAR):
+        raise ValueError(f"سال میلادی {year} خارج از بازه {datetime.MINYEAR} تا {datetime.MAXYEAR} است.")
+    if not 1 <= month <= 12:
+        raise ValueError(f"ماه میلادی {month} نامعتبر است (باید بین ۱ تا ۱۲ باشد).")
+    month_days = 29 if month == 2 and _is_gregorian_leap(year) else _GREGORIAN_DAYS_IN_MONTH[month]
+    if not 1 <= day <= month_days:
+        raise ValueError(f"روز {day} برای ماه {month} سال {year} میلادی نامعتبر است.")
+
+
+def _jalali_from_ordinal_checked(ordinal: int) -> Tuple[int, int, int]:
+    if not (_JALALI_MIN_ORDINAL <= ordinal <= _JALALI_MAX_ORDINAL):
+        raise ValueError("تاریخ خارج از بازه پشتیبانی‌شده تقویم شمسی (۱ تا ۹۳۷۷) است.")
+    return _ordinal_to_jalali(ordinal)
+
+
+def gregorian_to_jalali_ymd(year: int, month: int, day: int) -> Tuple[int, int, int]:
+    """
+    تاریخ میلادی (سال، ماه، روز) را فقط با محاسبه عددی به تاریخ شمسی (سال، ماه، روز) تبدیل می‌کند.
+
+    سریع‌ترین راه تبدیل در حلقه‌های بزرگ است: هیچ شیء datetime یا jdatetime ساخته نمی‌شود و
+    نتیجه در کل بازه پشتیبانی‌شده (سال‌های شمسی ۱ تا ۹۳۷۷) دقیقا برابر jdatetime است.
+
+    Raises:
+        ValueError: اگر تاریخ میلادی نامعتبر یا خارج از بازه تقویم شمسی باشد.
+
+    Example:
+        >>> gregorian_to_jalali_ymd(2024, 2, 29)
+        (1402, 12, 10)
+    """
+    _check_gregorian_date(year, month, day)
+    return _jalali_from_ordinal_checked(_gregorian_to_ordinal(year, month, day))
+
+
+def jalali_to_gregorian_ymd(year: int, month: int, day: int) -> Tuple[int, int, int]:
+    """
+    تاریخ شمسی (سال، ماه، روز) را فقط با محاسبه عددی به تاریخ میلادی (سال، ماه، روز) تبدیل می‌کند.
+
+    Raises:
+        ValueError: اگر تاریخ شمسی نامعتبر باشد (مثلا ۳۰ اسفند در سال غیرکبیسه).
+
+    Example:
+        >>> jalali_to_gregorian_ymd(1402, 1, 1)
+        (2023, 3, 21)
+    """
+    _check_jalali_date(year, month, day)
+    return _ordinal_to_gregorian(_jalali_to_ordinal(year, month, day))
+
+
+# --- موتور قالب‌بندی شمسی (strftime) ---
+# هر قالب خروجی یک بار به یک الگوی str.format و فهرستی از «تولیدکننده‌ها» (emitter) کامپایل و کش
+# می‌شود؛ تولیدکننده‌ها مقدار هر دستور را از تاپل فیلدهای تاریخ می‌سازند. خروجی دقیقا برابر strftime
+# کتابخانه jdatetime است، اما ارقام فارسی از جدول‌های آماده می‌آیند و نیازی به ترجمه کل خروجی نیست.
+
+_JALALI_MONTHS_FA = ("فروردین", "اردیبهشت", "خرداد", "تیر", "مرداد", "شهریور", "مهر", "آبان", "آذر", "دی", "بهمن", "اسفند")
+_JALALI_MONTHS_SHORT_FA = ("فرو", "ارد", "خرد", "تیر", "مرد", "شهر", "مهر", "آبا", "آذر", "دی", "بهم", "اسف")
+_JALALI_WEEKDAYS_FA = ("شنبه", "یک\u200cشنبه", "دوشنبه", "سه\u200cشنبه", "چهارشنبه", "پنج\u200cشنبه", "جمعه")
+_JALALI_MONTHS_EN = (
+    "Farvardin", "Ordibehesht", "Khordad", "Tir", "Mordad", "Shahrivar", "Mehr", "Aban", "Azar", "Dey", "Bahman", "Esfand"
+)
+_JALALI_MONTHS_SHORT_EN = ("Far", "Ord", "Kho", "Tir", "Mor", "Sha", "Meh", "Aba", "Aza", "Dey", "Bah", "Esf")
+_JALALI_WEEKDAYS_EN = ("Saturday", "Sunday", "Monday", "Tuesday", "Wednesday", "Thursday", "Friday")
+_JALALI_WEEKDAYS_SHORT_EN = ("Sat", "Sun", "Mon", "Tue", "Wed", "Thu", "Fri")
+# (ماه‌ها، نام کوتاه ماه‌ها، روزهای هفته، نام کوتاه روزها، (ق.ظ، ب.ظ))؛ در فارسی نام کوتاه روز همان نام کامل است
+_JALALI_NAMES_FA = (_JALALI_MONTHS_FA, _JALALI_MONTHS_SHORT_FA, _JALALI_WEEKDAYS_FA, _JALALI_WEEKDAYS_FA, ("قبل از ظهر", "بعد از ظهر"))
+_JALALI_NAMES_EN = (_JALALI_MONTHS_EN, _JALALI_MONTHS_SHORT_EN, _JALALI_WEEKDAYS_EN, _JALALI_WEEKDAYS_SHORT_EN, ("AM", "PM"))
+FA_LOCALE = "fa_IR"
+
+_RE_STRFTIME_DIRECTIVE = re.compile(r"%-?[A-Za-z%-]")
+# دستورهای ترکیبی مثل jdatetime به دستورهای ساده‌تر باز می‌شوند
+_COMPOSITE_DIRECTIVES = {"%c": "%a %b %d %H:%M:%S %Y", "%x": "%m/%d/%y", "%X": "%H:%M:%S"}
+
+# ترتیب فیلدها در تاپلی که به تولیدکننده‌ها داده می‌شود
+(_FIELD_YEAR, _FIELD_MONTH, _FIELD_DAY, _FIELD_ORDINAL, _FIELD_HOUR, _FIELD_MINUTE, _FIELD_SECOND,
+ _FIELD_MICROSECOND, _FIELD_UTCOFFSET, _FIELD_TZNAME) = range(10)
+
+
+class _NumberStrings(dict):
+    """کش رشته عددهای قالب‌بندی‌شده (مثلا "%02d") با ارقام انگلیسی یا فارسی؛ هر عدد یک بار ساخته می‌شود."""
+
+    __slots__ = ("pattern", "persian")
+
+    def __init__(self, pattern: str, persian: bool):
+        super().__init__()
+        self.pattern = pattern
+        self.persian = persian
+
+    def __missing__(self, number: int) -> str:
+        text = self.pattern % number
+        if self.persian:
+            text = to_persian_numerals(text)
+        if len(self) < 10000:
+            self[number] = text
+        return text
+
+
+def _format_utcoffset(offset: Optional[datetime.timedelta]) -> str:
+    """مانند %z در jdatetime: +HHMM (ثانیه‌ها نادیده گرفته می‌شوند) یا رشته خالی."""
+    if offset is None:
+        return ""
+    seconds = int(offset.total_seconds())
+    if not -86400 < seconds < 86400:
+        raise ValueError("اختلاف منطقه زمانی باید کمتر از ۲۴ ساعت باشد.")
+    sign = "-" if seconds < 0 else "+"
+    minutes = abs(seconds) // 60
+    return "%s%02d%02d" % (sign, minutes // 60, minutes % 60)
+
+
+def _jalali_week_number(fields: tuple) -> int:
+    # مانند jdatetime: (روز سال + روز هفته اول فروردین - ۱) // ۷ + ۱
+    yday = _JALALI_DAYS_BEFORE_MONTH[fields[_FIELD_MONTH]] + fields[_FIELD_DAY]
+    first_weekday = (fields[_FIELD_ORDINAL] - yday + 2) % 7
+    return (yday + first_weekday - 1) // 7 + 1
+
+
+_JALALI_EMITTERS: Dict[Tuple[bool, bool], Dict[str, Callable[[tuple], str]]] = {}
+
+
+def _jalali_emitters(persian_names: bool, persian_digits: bool) -> Dict[str, Callable[[tuple], str]]:
+    """جدول تولیدکننده‌های هر دستور strftime برای یک زبان نام‌ها و یک خط ارقام."""
+    key = (persian_names, persian_digits)
+    if key in _JALALI_EMITTERS:
+        return _JALALI_EMITTERS[key]
+    months, months_short, weekdays, weekdays_short, ampm = _JALALI_NAMES_FA if persian_names else _JALALI_NAMES_EN
+    plain = _NumberStrings("%d", persian_digits)
+    two = _NumberStrings("%02d", persian_digits)
+    three = _NumberStrings("%03d", persian_digits)
+    six = _NumberStrings("%06d", persian_digits)
+    digits = to_persian_numerals if persian_digits else str
+    days_before_month = _JALALI_DAYS_BEFORE_MONTH
+    emitters = {
+        "%Y": lambda f: plain[f[0]],
+        "%y": lambda f: two[f[0] % 100],
+        "%m": lambda f: two[f[1]],
+        "%-m": lambda f: plain[f[1]],
+        "%d": lambda f: two[f[2]],
+        "%-d": lambda f: plain[f[2]],
+        "%j": lambda f: three[days_before_month[f[1]] + f[2]],
+        "%w": lambda f: plain[(f[3] + 1) % 7],
+        "%W": lambda f: plain[_jalali_week_number(f)],
+        "%a": lambda f: weekdays_short[(f[3] + 1) % 7],
+        "%A": lambda f: weekdays[(f[3] + 1) % 7],
+        "%b": lambda f: months_short[f[1] - 1],
+        "%B": lambda f: months[f[1] - 1],
+        "%H": lambda f: two[f[4]],
+        "%-H": lambda f: plain[f[4]],
+        "%I": lambda f: two[f[4] % 12 or 12],
+        "%-I": lambda f: plain[f[4] % 12 or 12],
+        "%M": lambda f: two[f[5]],
+        "%-M": lambda f: plain[f[5]],
+        "%S": lambda f: two[f[6]],
+        "%-S": lambda f: plain[f[6]],
+        "%f": lambda f: six[f[7]],
+        "%p": lambda f: ampm[f[4] >= 12],
+        "%z": lambda f: digits(_format_utcoffset(f[8])),
+        "%Z": lambda f: digits(f[9] or ""),
+    }
+    _JALALI_EMITTERS[key] = emitters
+    return emitters
+
+
+# دستورهایی که به زمان (و منطقه زمانی) وابسته‌اند؛ بقیه در طول یک روز ثابت می‌مانند
+_TIME_DIRECTIVES = frozenset(("%H", "%-H", "%I", "%-I", "%M", "%-M", "%S", "%-S", "%f", "%p", "%z", "%Z"))
+_JALALI_STRFTIME_CACHE: Dict[Tuple[str, bool, bool], Tuple[str, Tuple[Callable[[tuple], str], ...]]] = {}
+
+
+def _jalali_format_parts(
+    output_format: str, persian_names: bool, persian_digits: bool
+) -> List[Union[str, Tuple[str, Callable[[tuple], str]]]]:
+    """قالب خروجی را به فهرستی از متن‌های ثابت و (دستور، تولیدکننده) تجزیه می‌کند."""
+    emitter_table = _jalali_emitters(persian_names, persian_digits)
+    parts: List[Union[str, Tuple[str, Callable[[tuple], str]]]] = []
+
+    def add_literal(text: str) -> None:
+        if text: # مانند ترجمه کل خروجی: ارقام متن ثابت قالب هم فارسی می‌شوند
+            parts.append(to_persian_numerals(text) if persian_digits else text)
+
+    def compile_into(fmt: str) -> None:
+        position = 0
+        for match in _RE_STRFTIME_DIRECTIVE.finditer(fmt):
+            add_literal(fmt[position:match.start()])
+            directive = match.group()
+            if directive in _COMPOSITE_DIRECTIVES:
+                compile_into(_COMPOSITE_DIRECTIVES[directive])
+            elif directive == "%%":
+                add_literal("%")
+            elif directive in emitter_table:
+                parts.append((directive, emitter_table[directive]))
+            else: # دستور ناشناخته مثل jdatetime بدون تغییر می‌ماند
+                add_literal(directive)
+            position = match.end()
+        add_literal(fmt[position:])
+
+    compile_into(output_format)
+    return parts
+
+
+def _build_template(
+    parts: List[Union[str, Tuple[str, Callable[[tuple], str]]]], day_fields: Optional[tuple] = None
+) -> Tuple[str, Tuple[Callable[[tuple], str], ...]]:
+    """
+    (الگوی str.format، تولیدکننده‌ها) را از بخش‌های قالب می‌سازد. با day_fields دستورهای مربوط به
+    تاریخ همین حالا مقدار می‌گیرند و فقط دستورهای زمان برای هر فراخوانی باقی می‌مانند.
+    """
+    template: List[str] = []
+    emitters: List[Callable[[tuple], str]] = []
+    for part in parts:
+        if isinstance(part, str):
+            text = part
+        elif day_fields is not None and part[0] not in _TIME_DIRECTIVES:
+            text = part[1](day_fields)
+        else:
+            template.append("{%d}" % len(emitters))
+            emitters.append(part[1])
+            continue
+        template.append(text.replace("{", "{{").replace("}", "}}"))
+    return "".join(template), tuple(emitters)
+
+
+def _compile_jalali_strftime(
+    output_format: str, persian_names: bool, persian_digits: bool
+) -> Tuple[str, Tuple[Callable[[tuple], str], ...]]:
+    """قالب خروجی را به (الگوی str.format، تولیدکننده‌ها) تبدیل می‌کند؛ نتیجه کش می‌شود."""
+    key = (output_format, persian_names, persian_digits)
+    compiled = _JALALI_STRFTIME_CACHE.get(key)
+    if compiled is None:
+        compiled = _build_template(_jalali_format_parts(output_format, persian_names, persian_digits))
+        if len(_JALALI_STRFTIME_CACHE) < 256:
+            _JALALI_STRFTIME_CACHE[key] = compiled
+    return compiled
+
+
+def _render(compiled: Tuple[str, Tuple[Callable[[tuple], str], ...]], fields: tuple) -> str:
+    template, emitters = compiled
+    return template.format(*[emit(fields) for emit in emitters])
+
+
+def _date_fields(year: int, month: int, day: int, ordinal: int) -> tuple:
+    return (year, month, day, ordinal, 0, 0, 0, 0, None, None)
+
+
+# --- تجزیه رشته‌های تاریخ (strptime) ---
+# هر قالب ورودی (مثل "%d %B %Y") یک بار برای هر تقویم به یک regex و فهرستی از «تطبیق‌دهنده‌ها»
+# (فیلد مقصد و تابع تبدیل هر گروه) کامپایل و کش می‌شود. \d در regex ارقام فارسی و عربی را هم
+# می‌پذیرد و int() آن‌ها را مستقیما تبدیل می‌کند. نام ماه‌ها و روزها به فارسی (با یا بدون نیم‌فاصله،
+# با ی/ک عربی یا فارسی) و انگلیسی (بدون حساسیت به حروف بزرگ و کوچک) پذیرفته می‌شوند.
+
+JALALI = "jalali"
+GREGORIAN = "gregorian"
+_GREGORIAN_MONTHS_EN = (
+    "January", "February", "March", "April", "May", "June", "July", "August", "September", "October", "November",
+    "December"
+)
+_GREGORIAN_MONTHS_SHORT_EN = ("Jan", "Feb", "Mar", "Apr", "May", "Jun", "Jul", "Aug", "Sep", "Oct", "Nov", "Dec")
+_GREGORIAN_WEEKDAYS_EN = ("Monday", "Tuesday", "Wednesday", "Thursday", "Friday", "Saturday", "Sunday")
+_GREGORIAN_WEEKDAYS_SHORT_EN = ("Mon", "Tue", "Wed", "Thu", "Fri", "Sat", "Sun")
+# نام‌هایی که هر دستور در هر تقویم می‌پذیرد
+_PARSE_NAMES = {
+    JALALI: {
+        "%B": (_JALALI_MONTHS_FA, _JALALI_MONTHS_EN), "%b": (_JALALI_MONTHS_SHORT_FA, _JALALI_MONTHS_SHORT_EN),
+        "%A": (_JALALI_WEEKDAYS_FA, _JALALI_WEEKDAYS_EN), "%a": (_JALALI_WEEKDAYS_FA, _JALALI_WEEKDAYS_SHORT_EN),
+    },
+    GREGORIAN: {
+        "%B": (_GREGORIAN_MONTHS_EN,), "%b": (_GREGORIAN_MONTHS_SHORT_EN,),
+        "%A": (_GREGORIAN_WEEKDAYS_EN,), "%a": (_GREGORIAN_WEEKDAYS_SHORT_EN,),
+    },
+}
+# سال دورقمی (%y) مانند jdatetime و time.strptime: ۰۰ تا ۶۸ قرن جاری و ۶۹ تا ۹۹ قرن قبل
+_TWO_DIGIT_YEAR_BASES = {JALALI: (1400, 1300), GREGORIAN: (2000, 1900)}
+_NAME_CHAR_PATTERNS = {"\u200c": "[\u200c\\s]*", "ی": "[یي]", "ک": "[کك]"}
+_RE_NAME_SEPARATORS = re.compile("[\u200c\\s]+")
+
+_SLOT_YEAR, _SLOT_MONTH, _SLOT_DAY, _SLOT_YDAY = range(4)
+_NUMERIC_PARSE_DIRECTIVES = {
+    "%Y": (_SLOT_YEAR, r"(\d{4})"), "%m": (_SLOT_MONTH, r"(\d{1,2})"), "%-m": (_SLOT_MONTH, r"(\d{1,2})"),
+    "%d": (_SLOT_DAY, r"(\d{1,2})"), "%-d": (_SLOT_DAY, r"(\d{1,2})"), "%j": (_SLOT_YDAY, r"(\d{1,3})"),
+}
+# قالب‌هایی که در حالت تشخیص خودکار به ترتیب امتحان می‌شوند
+SNIFFED_DATE_FORMATS = ("%Y-%m-%d", "%Y/%m/%d", "%d-%m-%Y", "%d/%m/%Y", "%Y%m%d")
+_RE_WHITESPACE = re.compile(r"\s+")
+
+_CompiledDateParser = Tuple["re.Pattern[str]", Tuple[Tuple[Optional[int], Optional[Callable[[str], int]]], ...]]
+_DATE_FORMAT_PARSERS: Dict[Tuple[str, str], _CompiledDateParser] = {}
+
+
+def _name_key(name: str) -> str:
+    return _RE_NAME_SEPARATORS.sub("", name).replace("ي", "ی").replace("ك", "ک").lower()
+
+
+def _name_matcher(name_lists: Tuple[Tuple[str, ...], ...]) -> Tuple[str, Callable[[str], int]]:
+    """regex و تابع تبدیل (نام -> شماره ۱ تا n) برای فهرست‌های نام یک دستور."""
+    numbers: Dict[str, int] = {}
+    for names in name_lists:
+        for number, name in enumerate(names, 1):
+            numbers[_name_key(name)] = number
+    alternatives = sorted({name for names in name_lists for name in names}, key=len, reverse=True)
+    pattern = "|".join("".join(_NAME_CHAR_PATTERNS.get(char) or re.escape(char) for char in name) for name in alternatives)
+    return "((?i:%s))" % pattern, lambda text: numbers[_name_key(text)]
+
+
+def _compile_date_parser(date_format: str, calendar: str) -> _CompiledDateParser:
+    """قالب ورودی را به (regex، (فیلد مقصد، تابع تبدیل) برای هر گروه) تبدیل می‌کند."""
+    pattern: List[str] = []
+    slots: List[Tuple[Optional[int], Optional[Callable[[str], int]]]] = []
+    seen = set()
+
+    def add_literal(text: str) -> None: # هر دنباله فاصله در قالب با هر تعداد فاصله تطبیق می‌خورد
+        pattern.append(r"\s+".join(re.escape(part) for part in _RE_WHITESPACE.split(text)))
+
+    position = 0
+    for match in _RE_STRFTIME_DIRECTIVE.finditer(date_format):
+        add_literal(date_format[position:match.start()])
+        position = match.end()
+        directive = match.group()
+        if directive == "%%":
+            pattern.append("%")
+            continue
+        if directive in _NUMERIC_PARSE_DIRECTIVES:
+            slot, field_pattern = _NUMERIC_PARSE_DIRECTIVES[directive]
+            convert: Optional[Callable[[str], int]] = int
+        elif directive == "%y":
+            recent, previous = _TWO_DIGIT_YEAR_BASES[calendar]
+            slot, field_pattern = _SLOT_YEAR, r"(\d{2})"
+            convert = lambda text: int(text) + (recent if int(text) <= 68 else previous)
+        elif directive in ("%B", "%b"):
+            slot = _SLOT_MONTH
+            field_pattern, convert = _name_matcher(_PARSE_NAMES[calendar][directive])
+        elif directive in ("%A", "%a"): # نام روز هفته فقط تطبیق داده می‌شود
+            slot, convert = None, None
+            field_pattern = _name_matcher(_PARSE_NAMES[calendar][directive])[0]
+        else:
+            raise ValueError(f"دستور '{directive}' در قالب ورودی تاریخ پشتیبانی نمی‌شود.")
+        if slot is not None:
+            if slot in seen:
+                raise ValueError(f"فیلد '{directive}' بیش از یک بار در قالب '{date_format}' آمده است.")
+            seen.add(slot)
+        pattern.append(field_pattern)
+        slots.append((slot, convert))
+    add_literal(date_format[position:])
+    if _SLOT_YEAR not in seen or not (
+        (_SLOT_MONTH in seen and _SLOT_DAY in seen and _SLOT_YDAY not in seen)
+        or seen == {_SLOT_YEAR, _SLOT_YDAY}
+    ):
+        raise ValueError(
+            f"قالب ورودی '{date_format}' باید سال (%Y یا %y) و ماه و روز (%m/%B و %d) یا روز سال (%j) را داشته باشد."
+        )
+    return re.compile("".join(pattern)), tuple(slots)
+
+
+def _date_parser(date_format: str, calendar: str = JALALI) -> _CompiledDateParser:
+    key = (date_format, calendar)
+    try:
+        return _DATE_FORMAT_PARSERS[key]
+    except KeyError:
+        parser = _compile_date_parser(date_format, calendar)
+        if len(_DATE_FORMAT_PARSERS) < 256:
+            _DATE_FORMAT_PARSERS[key] = parser
+        return parser
+
+
+def _year_day_to_month_day(year: int, yday: int, calendar: str) -> Tuple[int, int]:
+    if calendar == JALALI:
+        if not 1 <= yday <= 365 + _is_jalali_leap(year):
+            raise ValueError(f"روز {yday} سال {year} شمسی نامعتبر است.")
+        if yday <= 186:
+            return (yday - 1) // 31 + 1, (yday - 1) % 31 + 1
+        return (yday - 187) // 30 + 7, (yday - 187) % 30 + 1
+    if not 1 <= yday <= 365 + _is_gregorian_leap(year):
+        raise ValueError(f"روز {yday} سال {year} میلادی نامعتبر است.")
+    _, month, day = _ordinal_to_gregorian(_gregorian_to_ordinal(year, 1, 1) + yday - 1)
+    return month, day
+
+
+def _match_date(parser: _CompiledDateParser, text: str, calendar: str) -> Optional[Tuple[int, int, int]]:
+    regex, slots = parser
+    match = regex.fullmatch(text)
+    if match is None:
+        return None
+    values: List[Optional[int]] = [None, None, None, None]
+    for (slot, convert), group in zip(slots, match.groups()):
+        if slot is not None:
+            values[slot] = convert(group) # type: ignore[misc]
+    year, month, day, yday = values
+    if yday is not None:
+        month, day = _year_day_to_month_day(year, yday, calendar) # type: ignore[arg-type]
+    return year, month, day # type: ignore[return-value]
+
+
+def sniff_date_format(text: str) -> str:
+    """
+    قالب یک رشته تاریخ عددی را از میان SNIFFED_DATE_FORMATS تشخیص می‌دهد (بدون try/except).
+
+    Raises:
+        ValueError: اگر رشته با هیچ‌کدام از قالب‌ها مطابقت نداشته باشد.
+
+    Example:
+        >>> sniff_date_format("۱۶/۰۷/۱۴۰۲")
+        '%d/%m/%Y'
+    """
+    if not isinstance(text, str):
+        raise TypeError("ورودی باید از نوع رشته باشد.")
+    stripped = text.strip()
+    for date_format in SNIFFED_DATE_FORMATS:
+        if _date_parser(date_format)[0].fullmatch(stripped):
+            return date_format
+    raise ValueError(
+        f"فرمت تاریخ '{text}' قابل تشخیص نیست. از فرمت YYYY/MM/DD یا YYYY-MM-DD (با ارقام فارسی یا انگلیسی) استفاده کنید."
+    )
+
+
+class DateParser:
+    """
+    تجزیه‌گر رشته‌های تاریخ (شمسی یا میلادی) به تاپل (سال، ماه، روز).
+
+    بدون date_format، قالب عددی از اولین ورودی تشخیص داده می‌شود و تجزیه‌گر کامپایل‌شده آن برای ورودی‌های
+    بعدی همان منبع استفاده می‌شود؛ فقط وقتی ورودی با آن قالب نخواند دوباره تشخیص انجام می‌شود.
+    با date_format (حالت سخت‌گیرانه) تشخیص کاملا کنار گذاشته می‌شود و هر ورودی باید دقیقا با آن قالب بخواند.
+    قالب می‌تواند نام ماه و روز هفته (%B، %b، %A، %a)، روز سال (%j) و سال دورقمی (%y) هم داشته باشد.
+    اعتبار تقویمی تاریخ (مثلا ۳۰ اسفند) بررسی نمی‌شود؛ این کار با توابع تبدیل است.
+
+    Args:
+        date_format: قالب ورودی یا None برای تشخیص خودکار.
+        calendar: "jalali" (پیش‌فرض) یا "gregorian"؛ نام‌های ماه و روز و تفسیر %y و %j به آن بستگی دارد.
+
+    Example:
+        >>> parser = DateParser()
+        >>> parser.parse("1402/07/16"), parser.date_format
+        ((1402, 7, 16), '%Y/%m/%d')
+        >>> DateParser("%A %d %B %Y").parse("یکشنبه ۱۶ مهر ۱۴۰۲")
+        (1402, 7, 16)
+    """
+
+    __slots__ = ("date_format", "strict", "calendar", "_parser")
+
+    def __init__(self, date_format: Optional[str] = None, calendar: str = JALALI):
+        if calendar not in _TWO_DIGIT_YEAR_BASES:
+            raise ValueError(f"تقویم '{calendar}' پشتیبانی نمی‌شود (jalali یا gregorian).")
+        self.date_format = date_format
+        self.strict = date_format is not None
+        self.calendar = calendar
+        self._parser = _date_parser(date_format, calendar) if date_format is not None else None
+
+    def parse(self, text: str) -> Tuple[int, int, int]:
+        if not isinstance(text, str):
+            raise TypeError("ورودی باید از نوع رشته باشد.")
+        stripped = text.strip()
+        # تجزیه‌گر در متغیر محلی نگه داشته می‌شود تا تغییر هم‌زمان self._parser نتیجه این فراخوانی را عوض نکند
+        parser = self._parser
+        if parser is not None:
+            fields = _match_date(parser, stripped, self.calendar)
+            if fields is not None:
+                return fields
+            if self.strict:
+                raise ValueError(f"تاریخ '{text}' با قالب '{self.date_format}' مطابقت ندارد.")
+        date_format = sniff_date_format(stripped)
+        parser = _date_parser(date_format, self.calendar)
+        self._parser = parser
+        self.date_format = date_format
+        return _match_date(parser, stripped, self.calendar) # type: ignore[return-value]
+
+
+# تجزیه‌گرهای مشترک فراخوانی‌های تکی (آخرین قالب دیده‌شده اول امتحان می‌شود)؛ هر رشته (thread)
+# نمونه‌های خودش را دارد تا تشخیص قالب در یک رشته وضعیت تجزیه‌گر رشته دیگر را تغییر ندهد
+_THREAD_DATE_PARSERS = threading.local()
+
+
+def _shared_date_parser(calendar: str) -> DateParser:
+    try:
+        parsers = _THREAD_DATE_PARSERS.parsers
+    except AttributeError:
+        parsers = _THREAD_DATE_PARSERS.parsers = {JALALI: DateParser(), GREGORIAN: DateParser(calendar=GREGORIAN)}
+    return parsers[calendar]
+
+
+def _date_input_parser(input_format: Optional[str], calendar: str) -> DateParser:
+    return _shared_date_parser(calendar) if input_format is None else DateParser(input_format, calendar)
+
+
+def _gregorian_input_to_ordinal(g_date, parser: Optional[DateParser] = None) -> int:
+    """شماره روز یک ورودی میلادی (رشته، date/datetime یا تاپل (سال، ماه، روز))."""
+    if isinstance(g_date, datetime.date): # datetime.datetime هم زیرکلاس date است
+        return g_date.toordinal()
+    if isinstance(g_date, str):
+        year, month, day = (parser or _shared_date_parser(GREGORIAN)).parse(g_date)
+    elif isinstance(g_date, tuple) and len(g_date) == 3:
+        year, month, day = g_date
+    else:
+        raise TypeError("ورودی تاریخ میلادی باید رشته، datetime.date یا datetime.datetime باشد.")
+    _check_gregorian_date(year, month, day)
+    return _gregorian_to_ordinal(year, month, day)
 
 def gregorian_to_jalali(
     g_date: Union[str, datetime.date, datetime.datetime],
     output_format: Optional[str] = DEFAULT_JALALI_FORMAT,
     use_persian_numerals: bool = True,
-    locale: str = "fa_IR" # برای نام ماه‌ها و روزهای فارسی
+    locale: str = "fa_IR", # برای نام ماه‌ها و روزهای فارسی
+    input_format: Optional[str] = None
 ) -> str:
     """
     تاریخ میلادی را به تاریخ شمسی (جلالی) تبدیل می‌کند.
@@ -50,6 +619,8 @@ def gregorian_to_jalali(
                        اگر None باشد، یک تاپل (سال، ماه، روز) شمسی برمی‌گرداند.
         use_persian_numerals: اگر True باشد، اعداد در خروجی به فارسی تبدیل می‌شوند.
         locale: لوکیل برای نام ماه‌ها و روزهای هفته (پیش‌فرض 'fa_IR').
+        input_format: قالب ورودی رشته‌ای (مثلا "%d.%m.%Y")؛ اگر داده شود تشخیص خودکار قالب
+                      انجام نمی‌شود و ورودی باید دقیقا با آن بخواند (حالت سخت‌گیرانه).
 
     Returns:
         رشته تاریخ شمسی فرمت شده یا تاپل (سال، ماه، روز) شمسی.
@@ -64,73 +635,57 @@ def gregorian_to_jalali(
         >>> gregorian_to_jalali("2024-02-29", output_format=None)
         (1402, 12, 10)
     """
-    parsed_g_date = _parse_gregorian_date(g_date)
-    j_date_obj = jdatetime.date.fromgregorian(date=parsed_g_date)
+    ordinal = _gregorian_input_to_ordinal(g_date, _date_input_parser(input_format, GREGORIAN))
+    year, month, day = _jalali_from_ordinal_checked(ordinal)
 
     if output_format is None:
-        return j_date_obj.year, j_date_obj.month, j_date_obj.day
+        return year, month, day
 
-    # تنظیم لوکیل برای jdatetime (اگر لازم باشد و jdatetime از آن پشتیبانی کند)
-    # jdatetime به طور پیش‌فرض از نام‌های فارسی برای ماه‌ها و روزها استفاده می‌کند.
-    # آرگومان locale بیشتر برای سازگاری با strftime استاندارد است.
-    # jdatetime.set_locale(locale) # ممکن است در نسخه‌های جدیدتر نیازی نباشد یا روش دیگری داشته باشد
+    # قالب یک بار کامپایل و کش می‌شود؛ ارقام فارسی و نام‌ها مستقیما توسط موتور قالب‌بندی تولید می‌شوند
+    compiled = _compile_jalali_strftime(output_format, locale == FA_LOCALE, use_persian_numerals)
+    return _render(compiled, _date_fields(year, month, day, ordinal))
 
-    # jdatetime.date.strftime از لوکیل سیستم برای نام ماه‌ها و روزها استفاده می‌کند
-    # برای اطمینان از فارسی بودن، می‌توانیم خودمان یک نگاشت داشته باشیم یا از فرمت‌های عددی استفاده کنیم
-    # و سپس با to_persian_numerals اعداد را فارسی کنیم.
-    # اما strftime خود jdatetime معمولا فارسی است.
-    
-    formatted_jalali_date = j_date_obj.strftime(output_format, locale=locale)
 
-    if use_persian_numerals:
-        return to_persian_numerals(formatted_jalali_date)
-    return formatted_jalali_date
+_JalaliDateInput = Union[str, Tuple[int, int, int], "jdatetime.date", "jdatetime.datetime"]
 
 
-def _parse_jalali_date_str(j_date_str: str) -> Tuple[int, int, int]:
+def _jdatetime_types() -> tuple:
     """
-    رشته تاریخ شمسی را تجزیه کرده و به (سال، ماه، روز) تبدیل می‌کند.
-    اعداد فارسی و انگلیسی را پشتیبانی می‌کند.
+    کلاس‌های date و datetime کتابخانه jdatetime، فقط اگر قبلا (توسط کاربر) وارد شده باشد.
+
+    شیء jdatetime بدون وارد شدن آن ماژول وجود ندارد، پس نیازی به وارد کردن آن نیست.
     """
-    from .numeral_converter import to_english_numerals # وارد کردن در صورت نیاز
-    
-    j_date_str_en_numerals = to_english_numerals(j_date_str)
-
-    formats_to_try = [
-        DEFAULT_JALALI_FORMAT, # %Y/%m/%d
-        "%Y-%m-%d",
-        # فرمت‌های دیگر را می‌توان اضافه کرد
-    ]
-    # تلاش برای جدا کردن با جداکننده‌های رایج
-    parts = []
-    if '/' in j_date_str_en_numerals:
-        parts = j_date_str_en_numerals.split('/')
-    elif '-' in j_date_str_en_numerals:
-        parts = j_date_str_en_numerals.split('-')
-    
-    if len(parts) == 3:
-        try:
-            year, month, day = int(parts[0]), int(parts[1]), int(parts[2])
-            # اعتبارسنجی اولیه مقادیر (jdatetime خودش اعتبارسنجی دقیق‌تر را انجام می‌دهد)
-            if not (1000 <= year <= 1500 and 1 <= month <= 12 and 1 <= day <= 31):
-                raise ValueError("مقادیر تاریخ شمسی نامعتبر است.")
-            return year, month, day
-        except ValueError:
-            pass # ادامه به تلاش با strptime
-
-    # اگر جداکننده‌ها کار نکردند یا فرمت متفاوت بود، از strptime کتابخانه jdatetime استفاده می‌کنیم
-    # این بخش نیاز به jdatetime.datetime.strptime دارد که تاریخ شمسی را تجزیه کند.
-    # اما jdatetime.datetime.strptime مستقیماً رشته را به شیء jdatetime.datetime تبدیل می‌کند.
-    # ما فقط به سال، ماه، روز نیاز داریم.
-    # فعلا روی فرمت‌های ساده با جداکننده تمرکز می‌کنیم.
-    # برای پشتیبانی کامل از strptime برای شمسی، باید jdatetime.datetime.strptime را استفاده کرد.
-    
-    raise ValueError(f"فرمت تاریخ شمسی '{j_date_str}' قابل تشخیص نیست. از فرمت YYYY/MM/DD یا YYYY-MM-DD با اعداد فارسی یا انگلیسی استفاده کنید.")
+    jdatetime = sys.modules.get("jdatetime")
+    if jdatetime is None:
+        return ()
+    return jdatetime.date, jdatetime.datetime
+
+
+def _jalali_input_to_ordinal(
+    j_date: _JalaliDateInput,
+    parser: Optional[DateParser] = None
+) -> int:
+    """ورودی تاریخ شمسی (رشته، تاپل یا شیء jdatetime) را اعتبارسنجی و به شماره روز تبدیل می‌کند."""
+    if isinstance(j_date, _jdatetime_types()):
+        # اشیای jdatetime قبلا اعتبارسنجی شده‌اند
+        return _jalali_to_ordinal(j_date.year, j_date.month, j_date.day)
+    if isinstance(j_date, tuple) and len(j_date) == 3:
+        year, month, day = j_date
+    elif isinstance(j_date, str):
+        year, month, day = (parser or _shared_date_parser(JALALI)).parse(j_date)
+    else:
+        raise TypeError("ورودی تاریخ شمسی باید رشته، تاپل (سال، ماه، روز)، jdatetime.date یا jdatetime.datetime باشد.")
+    try:
+        _check_jalali_date(year, month, day)
+    except ValueError as e: # برای خطاهای مربوط به تاریخ نامعتبر شمسی
+        raise ValueError(f"تاریخ شمسی ورودی نامعتبر است: {e}")
+    return _jalali_to_ordinal(year, month, day)
 
 
 def jalali_to_gregorian(
-    j_date: Union[str, Tuple[int, int, int], jdatetime.date, jdatetime.datetime],
-    output_format: Optional[str] = DEFAULT_GREGORIAN_FORMAT
+    j_date: _JalaliDateInput,
+    output_format: Optional[str] = DEFAULT_GREGORIAN_FORMAT,
+    input_format: Optional[str] = None
 ) -> Union[str, datetime.date]:
     """
     تاریخ شمسی (جلالی) را به تاریخ میلادی تبدیل می‌کند.
@@ -142,6 +697,7 @@ def jalali_to_gregorian(
                 - شیء jdatetime.date یا jdatetime.datetime
         output_format: فرمت رشته خروجی میلادی (مانند "%Y-%m-%d").
                        اگر None باشد، شیء datetime.date برمی‌گرداند.
+        input_format: قالب ورودی رشته‌ای برای حالت سخت‌گیرانه (مانند gregorian_to_jalali).
 
     Returns:
         رشته تاریخ میلادی فرمت شده یا شیء datetime.date.
@@ -156,33 +712,75 @@ def jalali_to_gregorian(
         >>> jalali_to_gregorian("1402-12-10") # سال کبیسه شمسی
         '2024-02-29'
     """
-    j_date_obj: jdatetime.date
-    if isinstance(j_date, (jdatetime.date, jdatetime.datetime)):
-        if isinstance(j_date, jdatetime.datetime):
-            j_date_obj = j_date.date()
-        else:
-            j_date_obj = j_date # type: ignore
-    elif isinstance(j_date, tuple) and len(j_date) == 3:
-        try:
-            j_date_obj = jdatetime.date(j_date[0], j_date[1], j_date[2])
-        except ValueError as e: # برای خطاهای مربوط به تاریخ نامعتبر شمسی
-            raise ValueError(f"تاریخ شمسی ورودی نامعتبر است: {e}")
-    elif isinstance(j_date, str):
-        year, month, day = _parse_jalali_date_str(j_date)
-        try:
-            j_date_obj = jdatetime.date(year, month, day)
-        except ValueError as e:
-            raise ValueError(f"تاریخ شمسی ورودی نامعتبر است: {e}")
-    else:
-        raise TypeError("ورودی تاریخ شمسی باید رشته، تاپل (سال، ماه، روز)، jdatetime.date یا jdatetime.datetime باشد.")
-
-    g_date_obj = j_date_obj.togregorian()
+    g_date_obj = datetime.date.fromordinal(_jalali_input_to_ordinal(j_date, _date_input_parser(input_format, JALALI)))
 
     if output_format is None:
         return g_date_obj
     
     return g_date_obj.strftime(output_format)
 
+def jalali_strftime(
+    j_date: _JalaliDateInput,
+    output_format: str = DEFAULT_JALALI_FORMAT,
+    use_persian_numerals: bool = True,
+    locale: str = FA_LOCALE
+) -> str:
+    """
+    تاریخ شمسی را بدون strftime کتابخانه jdatetime قالب‌بندی می‌کند (خروجی یکسان با آن).
+
+    قالب یک بار کامپایل و کش می‌شود؛ نام ماه‌ها و روزها (فارسی برای لوکیل fa_IR و در غیر این صورت
+    انگلیسی) و ارقام فارسی یا انگلیسی مستقیما تولید می‌شوند. برای jdatetime.datetime دستورهای زمان
+    (%H، %M، %S، %p، %z و ...) هم مقدار دارند.
+
+    Args:
+        j_date: تاریخ شمسی (رشته، تاپل (سال، ماه، روز)، jdatetime.date یا jdatetime.datetime).
+        output_format: قالب خروجی به سبک strftime.
+        use_persian_numerals: اگر True باشد ارقام خروجی فارسی هستند.
+        locale: لوکیل نام‌ها.
+
+    Example:
+        >>> jalali_strftime((1402, 7, 16), "%A %d %B %Y")
+        'یک‌شنبه ۱۶ مهر ۱۴۰۲'
+    """
+    jdatetime_types = _jdatetime_types()
+    if jdatetime_types and isinstance(j_date, jdatetime_types[1]):
+        ordinal = _jalali_to_ordinal(j_date.year, j_date.month, j_date.day)
+        fields = (
+            j_date.year, j_date.month, j_date.day, ordinal, j_date.hour, j_date.minute, j_date.second,
+            j_date.microsecond, j_date.utcoffset(), j_date.tzname()
+        )
+    else:
+        ordinal = _jalali_input_to_ordinal(j_date)
+        year, month, day = _ordinal_to_jalali(ordinal)
+        fields = _date_fields(year, month, day, ordinal)
+    return _render(_compile_jalali_strftime(output_format, locale == FA_LOCALE, use_persian_numerals), fields)
+
+
+def jalali_strptime(text: str, input_format: str) -> Tuple[int, int, int]:
+    """
+    رشته تاریخ شمسی را با قالب داده‌شده تجزیه و اعتبارسنجی می‌کند.
+
+    نام ماه‌ها و روزها به فارسی یا انگلیسی و ارقام فارسی، عربی یا انگلیسی پذیرفته می‌شوند.
+
+    Returns:
+        تاپل (سال، ماه، روز) شمسی.
+
+    Raises:
+        ValueError: اگر رشته با قالب نخواند یا تاریخ نامعتبر باشد.
+
+    Example:
+        >>> jalali_strptime("یکشنبه ۱۶ مهر ۱۴۰۲", "%A %d %B %Y")
+        (1402, 7, 16)
+    """
+    if not isinstance(text, str):
+        raise TypeError("ورودی باید از نوع رشته باشد.")
+    fields = _match_date(_date_parser(input_format, JALALI), text.strip(), JALALI)
+    if fields is None:
+        raise ValueError(f"تاریخ '{text}' با قالب '{input_format}' مطابقت ندارد.")
+    _check_jalali_date(*fields)
+    return fields
+
+
 def today_jalali(
     output_format: Optional[str] = DEFAULT_JALALI_FORMAT,
     use_persian_numerals: bool = True,
@@ -208,3 +806,811 @@ def today_jalali(
     """
     now_gregorian = datetime.date.today()
     return gregorian_to_jalali(now_gregorian, output_format, use_persian_numerals, locale)
+
+
+# --- محاسبات تاریخ شمسی ---
+# همه محاسبات روی شماره روز (ordinal) انجام می‌شوند؛ ورودی‌ها مانند jalali_to_gregorian می‌توانند رشته،
+# تاپل یا شیء jdatetime باشند و خروجی همیشه تاپل (سال، ماه، روز) است.
+
+JALALI_PERIODS = ("week", "month", "quarter", "year")
+
+
+def jalali_add_days(j_date: _JalaliDateInput, days: int) -> Tuple[int, int, int]:
+    """
+    تعدادی روز (مثبت یا منفی) به تاریخ شمسی اضافه می‌کند.
+
+    Example:
+        >>> jalali_add_days((1402, 12, 29), 1)
+        (1403, 1, 1)
+    """
+    return _jalali_from_ordinal_checked(_jalali_input_to_ordinal(j_date) + days)
+
+
+def jalali_add_months(j_date: _JalaliDateInput, months: int) -> Tuple[int, int, int]:
+    """
+    تعدادی ماه (مثبت یا منفی) به تاریخ شمسی اضافه می‌کند.
+
+    اگر روز در ماه مقصد وجود نداشته باشد، به آخرین روز آن ماه محدود می‌شود.
+
+    Example:
+        >>> jalali_add_months((1402, 6, 31), 1)
+        (1402, 7, 30)
+        >>> jalali_add_months((1403, 12, 30), 12) # ۱۴۰۴ کبیسه نیست
+        (1404, 12, 29)
+    """
+    year, month, day = _ordinal_to_jalali(_jalali_input_to_ordinal(j_date))
+    year, month = divmod(year * 12 + month - 1 + months, 12)
+    month += 1
+    if not (JALALI_MIN_YEAR <= year <= JALALI_MAX_YEAR):
+        raise ValueError("تاریخ خارج از بازه پشتیبانی‌شده تقویم شمسی (۱ تا ۹۳۷۷) است.")
+    return year, month, min(day, _jalali_month_days(year, month))
+
+
+def jalali_days_between(start: _JalaliDateInput, end: _JalaliDateInput) -> int:
+    """
+    تعداد روزهای بین دو تاریخ شمسی (end منهای start؛ اگر end قبل از start باشد منفی است).
+
+    Example:
+        >>> jalali_days_between((1403, 1, 1), (1404, 1, 1)) # ۱۴۰۳ کبیسه است
+        366
+    """
+    return _jalali_input_to_ordinal(end) - _jalali_input_to_ordinal(start)
+
+
+def _jalali_period_bounds(j_date: _JalaliDateInput, period: str) -> Tuple[int, int]:
+    """شماره روز اول و آخر هفته (شنبه تا جمعه)، ماه، فصل یا سالی که تاریخ در آن است."""
+    ordinal = _jalali_input_to_ordinal(j_date)
+    if period == "week":
+        first = ordinal - (ordinal + 1) % 7 # شنبه = ۰
+        return first, first + 6
+    year, month, _ = _ordinal_to_jalali(ordinal)
+    if period == "month":
+        first_month = last_month = month
+    elif period == "quarter":
+        first_month = month - (month - 1) % 3
+        last_month = first_month + 2
+    elif period == "year":
+        first_month, last_month = 1, 12
+    else:
+        raise ValueError(f"بازه '{period}' نامعتبر است (باید یکی از {', '.join(JALALI_PERIODS)} باشد).")
+    return (
+        _jalali_to_ordinal(year, first_month, 1),
+        _jalali_to_ordinal(year, last_month, _jalali_month_days(year, last_month))
+    )
+
+
+def jalali_period_start(j_date: _JalaliDateInput, period: str = "month") -> Tuple[int, int, int]:
+    """
+    اولین روز هفته (شنبه)، ماه، فصل (سه‌ماهه) یا سالی که تاریخ شمسی در آن است.
+
+    Args:
+        j_date: تاریخ شمسی.
+        period: یکی از "week"، "month"، "quarter" یا "year".
+
+    Example:
+        >>> jalali_period_start((1402, 8, 20), "quarter")
+        (1402, 7, 1)
+    """
+    return _jalali_from_ordinal_checked(_jalali_period_bounds(j_date, period)[0])
+
+
+def jalali_period_end(j_date: _JalaliDateInput, period: str = "month") -> Tuple[int, int, int]:
+    """
+    آخرین روز هفته (جمعه)، ماه، فصل (سه‌ماهه) یا سالی که تاریخ شمسی در آن است.
+
+    Example:
+        >>> jalali_period_end((1403, 11, 5), "quarter") # ۱۴۰۳ کبیسه است
+        (1403, 12, 30)
+    """
+    return _jalali_from_ordinal_checked(_jalali_period_bounds(j_date, period)[1])
+
+
+def iter_jalali_range(
+    start: _JalaliDateInput,
+    end: _JalaliDateInput,
+    step: int = 1
+) -> Iterator[Tuple[int, int, int]]:
+    """
+    تاریخ‌های شمسی از start تا قبل از end را (مانند range) به صورت تنبل برمی‌گرداند.
+
+    فقط شماره روز ابتدا و انتها محاسبه می‌شود و هر تاریخ هنگام مصرف ساخته می‌شود، پس ساختن
+    بازه‌ای چندساله هزینه‌ای ندارد.
+
+    Args:
+        start: تاریخ شروع (شامل).
+        end: تاریخ پایان (غیرشامل).
+        step: فاصله بر حسب روز؛ منفی برای پیمایش رو به عقب (مثلا ۷ برای هفته‌ای).
+
+    Yields:
+        تاپل (سال، ماه، روز).
+
+    Example:
+        >>> list(iter_jalali_range((1402, 12, 28), (1403, 1, 2)))
+        [(1402, 12, 28), (1402, 12, 29), (1403, 1, 1)]
+    """
+    if step == 0:
+        raise ValueError("step نباید صفر باشد.")
+    ordinals = range(_jalali_input_to_ordinal(start), _jalali_input_to_ordinal(end), step)
+    return map(_ordinal_to_jalali, ordinals)
+
+
+# --- تاریخ و زمان شمسی، منطقه زمانی و لاگ ---
+
+DEFAULT_JALALI_DATETIME_FORMAT = "%Y/%m/%d %H:%M:%S"
+_TEHRAN_TZ: Optional[datetime.tzinfo] = None
+# آخرین روز تبدیل‌شده (شماره روز، (سال، ماه، روز))؛ برچسب‌های زمانی پشت‌سرهم معمولا در یک روزند
+_LAST_JALALI_DAY: Tuple[int, Tuple[int, int, int]] = (0, (0, 0, 0))
+
+
+def tehran_timezone() -> datetime.tzinfo:
+    """
+    منطقه زمانی Asia/Tehran را برمی‌گرداند.
+
+    در صورت امکان از zoneinfo (پایتون ۳.۹ به بعد) استفاده می‌شود تا تغییرات تاریخی (مثل ساعت تابستانی
+    تا سال ۱۴۰۱) درست باشد؛ در غیر این صورت اختلاف ثابت ‎+03:30 برگردانده می‌شود.
+    """
+    global _TEHRAN_TZ
+    if _TEHRAN_TZ is None:
+        try:
+            from zoneinfo import ZoneInfo
+            _TEHRAN_TZ = ZoneInfo("Asia/Tehran")
+        except (ImportError, KeyError): # پایتون قدیمی‌تر یا نبود داده tzdata (ZoneInfoNotFoundError)
+            _TEHRAN_TZ = datetime.timezone(datetime.timedelta(hours=3, minutes=30), "+0330")
+    return _TEHRAN_TZ
+
+
+def _to_local_datetime(value: Union[datetime.datetime, float], tz: Optional[datetime.tzinfo]) -> datetime.datetime:
+    """datetime یا برچسب زمانی POSIX را به زمان محلی tz می‌برد (datetime بدون منطقه زمانی تغییر نمی‌کند)."""
+    if isinstance(value, datetime.datetime):
+        if tz is not None and value.tzinfo is not None:
+            return value.astimezone(tz)
+        return value
+    if isinstance(value, (int, float)) and not isinstance(value, bool):
+        return datetime.datetime.fromtimestamp(value, tz)
+    raise TypeError("ورودی باید datetime.datetime یا برچسب زمانی POSIX (عدد) باشد.")
+
+
+def _jalali_day(ordinal: int) -> Tuple[int, int, int]:
+    global _LAST_JALALI_DAY
+    cached_ordinal, jalali = _LAST_JALALI_DAY
+    if cached_ordinal != ordinal:
+        jalali = _jalali_from_ordinal_checked(ordinal)
+        _LAST_JALALI_DAY = (ordinal, jalali)
+    return jalali
+
+
+def gregorian_to_jalali_datetime(
+    g_datetime: Union[datetime.datetime, float],
+    output_format: Optional[str] = DEFAULT_JALALI_DATETIME_FORMAT,
+    use_persian_numerals: bool = True,
+    locale: str = FA_LOCALE,
+    tz: Optional[datetime.tzinfo] = None
+) -> Union[str, Tuple[int, int, int, int, int, int, int]]:
+    """
+    تاریخ و زمان میلادی را (با حفظ ساعت) به تاریخ و زمان شمسی تبدیل می‌کند.
+
+    Args:
+        g_datetime: datetime.datetime (با یا بدون منطقه زمانی) یا برچسب زمانی POSIX (مثل time.time()).
+        output_format: قالب خروجی (دستورهای تاریخ و زمان، از جمله %z و %Z).
+                       اگر None باشد تاپل (سال، ماه، روز، ساعت، دقیقه، ثانیه، میکروثانیه) برمی‌گرداند.
+        use_persian_numerals: اگر True باشد ارقام خروجی فارسی هستند.
+        locale: لوکیل نام ماه‌ها و روزها.
+        tz: منطقه زمانی مقصد (مثلا tehran_timezone())؛ datetimeهای دارای منطقه زمانی و برچسب‌های زمانی
+            به آن برده می‌شوند و datetime بدون منطقه زمانی، زمان محلی همان tz فرض می‌شود.
+            اگر None باشد، منطقه زمانی خود ورودی (یا زمان محلی سیستم برای برچسب زمانی) حفظ می‌شود.
+
+    Example:
+        >>> utc = datetime.datetime(2023, 10, 8, 9, 30, tzinfo=datetime.timezone.utc)
+        >>> gregorian_to_jalali_datetime(utc, "%Y/%m/%d %H:%M %z", use_persian_numerals=False, tz=tehran_timezone())
+        '1402/07/16 13:00 +0330'
+    """
+    local = _to_local_datetime(g_datetime, tz)
+    ordinal = local.toordinal()
+    year, month, day = _jalali_day(ordinal)
+    if output_format is None:
+        return year, month, day, local.hour, local.minute, local.second, local.microsecond
+    fields = (
+        year, month, day, ordinal, local.hour, local.minute, local.second, local.microsecond, local.utcoffset(),
+        local.tzname()
+    )
+    return _render(_compile_jalali_strftime(output_format, locale == FA_LOCALE, use_persian_numerals), fields)
+
+
+class JalaliTimestampFormatter:
+    """
+    قالب‌بند سریع برچسب‌های زمانی شمسی برای حجم بالا (مثلا خطوط لاگ).
+
+    قالب یک بار کامپایل می‌شود و بخش تاریخ آن برای هر روز فقط یک بار ساخته می‌شود؛ برای برچسب‌های
+    همان روز فقط دستورهای زمان (%H، %M، %S و ...) محاسبه می‌شوند. اگر قالب %f نداشته باشد، برای
+    برچسب‌های زمانی عددی پشت‌سرهم در یک ثانیه خروجی قبلی دوباره استفاده می‌شود.
+
+    Args:
+        output_format: قالب خروجی.
+        tz: منطقه زمانی (پیش‌فرض Asia/Tehran).
+        use_persian_numerals: اگر True باشد ارقام خروجی فارسی هستند.
+        locale: لوکیل نام ماه‌ها و روزها.
+
+    Example:
+        >>> stamp = JalaliTimestampFormatter(use_persian_numerals=False)
+        >>> stamp.format(1696757400.0)
+        '1402/07/16 13:00:00'
+    """
+
+    __slots__ = ("output_format", "tz", "_parts", "_per_second", "_needs_offset", "_day", "_last")
+
+    def __init__(
+        self,
+        output_format: str = DEFAULT_JALALI_DATETIME_FORMAT,
+        tz: Optional[datetime.tzinfo] = None,
+        use_persian_numerals: bool = True,
+        locale: str = FA_LOCALE
+    ):
+        self.output_format = output_format
+        self.tz = tehran_timezone() if tz is None else tz
+        self._parts = _jalali_format_parts(output_format, locale == FA_LOCALE, use_persian_numerals)
+        directives = {part[0] for part in self._parts if isinstance(part, tuple)}
+        self._per_second = "%f" not in directives
+        self._needs_offset = bool(directives & {"%z", "%Z"})
+        # (شماره روز، الگوی روز، تولیدکننده‌های زمان، سال، ماه، روز) و (ثانیه، خروجی)؛ با جایگزینی اتمی تاپل‌ها
+        # استفاده هم‌زمان از چند نخ امن است.
+        self._day: Optional[tuple] = None
+        self._last: Optional[Tuple[int, str]] = None
+
+    def format(self, value: Union[datetime.datetime, float]) -> str:
+        """برچسب زمانی POSIX یا datetime را قالب‌بندی می‌کند (مانند gregorian_to_jalali_datetime با tz)."""
+        if self._per_second and isinstance(value, (int, float)) and not isinstance(value, bool):
+            second = int(value // 1)
+            last = self._last
+            if last is not None and last[0] == second:
+                return last[1]
+            text = self._format_local(datetime.datetime.fromtimestamp(value, self.tz))
+            self._last = (second, text)
+            return text
+        return self._format_local(_to_local_datetime(value, self.tz))
+
+    def _format_local(self, local: datetime.datetime) -> str:
+        ordinal = local.toordinal()
+        day = self._day
+        if day is None or day[0] != ordinal:
+            year, month, day_of_month = _jalali_from_ordinal_checked(ordinal)
+            template, emitters = _build_template(self._parts, _date_fields(year, month, day_of_month, ordinal))
+            day = self._day = (ordinal, template, emitters, year, month, day_of_month)
+        _, template, emitters, year, month, day_of_month = day
+        if not emitters:
+            return template
+        if self._needs_offset:
+            offset, tzname = local.utcoffset(), local.tzname()
+        else:
+            offset = tzname = None
+        fields = (
+            year, month, day_of_month, ordinal, local.hour, local.minute, local.second, local.microsecond, offset, tzname
+        )
+        return template.format(*[emit(fields) for emit in emitters])
+
+
+class JalaliLogFormatter(logging.Formatter):
+    """
+    logging.Formatter با زمان شمسی برای %(asctime)s (به وقت تهران به طور پیش‌فرض).
+
+    زمان با JalaliTimestampFormatter ساخته می‌شود، پس هزینه آن از formatTime استاندارد بیشتر نیست.
+    بدون datefmt قالب DEFAULT_JALALI_DATETIME_FORMAT به همراه میلی‌ثانیه (مثل logging) استفاده می‌شود.
+
+    Args:
+        fmt، datefmt، style و بقیه آرگومان‌ها: مانند logging.Formatter.
+        tz: منطقه زمانی (پیش‌فرض Asia/Tehran).
+        use_persian_numerals: اگر True باشد ارقام زمان فارسی هستند (پیش‌فرض False برای لاگ‌های قابل جستجو).
+        locale: لوکیل نام ماه‌ها و روزها.
+
+    Example:
+        >>> handler = logging.StreamHandler()
+        >>> handler.setFormatter(JalaliLogFormatter("%(asctime)s %(levelname)s %(message)s"))
+        >>> # 1402/07/16 13:00:00,123 INFO ...
+    """
+
+    def __init__(
+        self,
+        fmt: Optional[str] = None,
+        datefmt: Optional[str] = None,
+        style: str = "%",
+        *,
+        tz: Optional[datetime.tzinfo] = None,
+        use_persian_numerals: bool = False,
+        locale: str = FA_LOCALE,
+        **kwargs
+    ):
+        super().__init__(fmt, datefmt, style, **kwargs)
+        self._timestamp_options = (tz, use_persian_numerals, locale)
+        self._timestamp_formatters: Dict[Optional[str], JalaliTimestampFormatter] = {}
+
+    def formatTime(self, record: logging.LogRecord, datefmt: Optional[str] = None) -> str:
+        formatter = self._timestamp_formatters.get(datefmt)
+        if formatter is None:
+            tz, use_persian_numerals, locale = self._timestamp_options
+            formatter = JalaliTimestampFormatter(datefmt or DEFAULT_JALALI_DATETIME_FORMAT, tz, use_persian_numerals, locale)
+            self._timestamp_formatters[datefmt] = formatter
+        text = formatter.format(record.created)
+        if datefmt is None and self.default_msec_format:
+            text = self.default_msec_format % (text, record.msecs)
+            if self._timestamp_options[1]:
+                text = to_persian_numerals(text)
+        return text
+
+
+# --- تبدیل دسته‌ای (برداری) ---
+# با نصب بودن NumPy محاسبات روی کل آرایه انجام می‌شود؛ در غیر این صورت همان هسته عددی
+# در یک حلقه ساده پایتون اجرا می‌شود. NumPy فقط در اولین فراخوانی این توابع وارد می‌شود.
+
+_UNIX_EPOCH_ORDINAL = 719163 # 1970-01-01 (مبدا datetime64)
+
+
+def _is_ymd_array(numpy, array) -> bool:
+    return array.dtype.kind in "iu" and array.ndim == 2 and array.shape[1] == 3
+
+
+def _first_invalid_row(numpy, invalid, check, years, months, days) -> None:
+    """اگر ردیف نامعتبری باشد، خطای دقیق همان ردیف را با اعتبارسنج تکی برمی‌انگیزد."""
+    if invalid.any():
+        row = int(numpy.argmax(invalid))
+        check(int(years[row]), int(months[row]), int(days[row]))
+
+
+def _as_array(numpy, dates):
+    """
+    ورودی را برای مسیرهای برداری به آرایه تبدیل می‌کند، یا None اگر دنباله ناهمگن باشد (مثلا ترکیب
+    رشته و تاپل) تا ورودی‌ها تک‌تک تبدیل شوند.
+    """
+    if isinstance(dates, numpy.ndarray):
+        return dates
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore") # نسخه‌های قدیمی NumPy برای دنباله‌های ناهمگن هشدار می‌دهند
+        try:
+            return numpy.asarray(dates)
+        except (ValueError, TypeError):
+            return None
+
+
+def _gregorian_ordinals_numpy(numpy, dates, parser: DateParser):
+    array = _as_array(numpy, dates)
+    if array is not None and array.dtype.kind == "M": # datetime64 با هر واحدی (مثلا ستون‌های pandas با واحد ns)
+        day_array = array.astype("datetime64[D]")
+        if numpy.isnat(day_array).any():
+            raise ValueError("تاریخ‌های خالی (NaT) قابل تبدیل نیستند.")
+        return day_array.astype(numpy.int64) + _UNIX_EPOCH_ORDINAL
+    if array is not None and _is_ymd_array(numpy, array):
+        years, months, days = (array[:, column].astype(numpy.int64) for column in range(3))
+        leap = (years % 4 == 0) & ((years % 100 != 0) | (years % 400 == 0))
+        valid_month = (months >= 1) & (months <= 12)
+        safe_months = numpy.where(valid_month, months, 1)
+        after_february = (safe_months > 2) & leap
+        month_days = numpy.asarray(_GREGORIAN_DAYS_IN_MONTH)[safe_months] + ((safe_months == 2) & leap)
+        invalid = (
+            (years < datetime.MINYEAR) | (years > datetime.MAXYEAR) | ~valid_month | (days < 1) | (days > month_days)
+        )
+        _first_invalid_row(numpy, invalid, _check_gregorian_date, years, months, days)
+        previous = years - 1
+        return (
+            previous * 365 + previous // 4 - previous // 100 + previous // 400
+            + numpy.asarray(_GREGORIAN_DAYS_BEFORE_MONTH)[safe_months] + after_february + days
+        )
+    return numpy.fromiter((_gregorian_input_to_ordinal(item, parser) for item in dates), dtype=numpy.int64, count=len(dates))
+
+
+def _jalali_ordinals_numpy(numpy, dates, parser: DateParser):
+    array = _as_array(numpy, dates)
+    if array is not None and _is_ymd_array(numpy, array):
+        years, months, days = (array[:, column].astype(numpy.int64) for column in range(3))
+        valid_month = (months >= 1) & (months <= 12)
+        safe_months = numpy.where(valid_month, months, 1)
+        leap = numpy.isin(years % 33, tuple(_JALALI_LEAP_REMAINDERS))
+        month_days = numpy.where(safe_months <= 6, 31, numpy.where(safe_months <= 11, 30, 29 + leap))
+        invalid = (years < JALALI_MIN_YEAR) | (years > JALALI_MAX_YEAR) | ~valid_month | (days < 1) | (days > month_days)
+        _first_invalid_row(numpy, invalid, _check_jalali_date, years, months, days)
+        k = years - _JALALI_EPOCH_YEAR
+        return (
+            _JALALI_EPOCH_ORDINAL + 365 * k + (k // 33) * 8 + (k % 33 + 3) // 4
+            + numpy.asarray(_JALALI_DAYS_BEFORE_MONTH)[safe_months] + days - 1
+        )
+    return numpy.fromiter((_jalali_input_to_ordinal(item, parser) for item in dates), dtype=numpy.int64, count=len(dates))
+
+
+def _ordinals_to_jalali_numpy(numpy, ordinals):
+    if ((ordinals < _JALALI_MIN_ORDINAL) | (ordinals > _JALALI_MAX_ORDINAL)).any():
+        raise ValueError("تاریخ خارج از بازه پشتیبانی‌شده تقویم شمسی (۱ تا ۹۳۷۷) است.")
+    cycles, days = numpy.divmod(ordinals - _JALALI_EPOCH_ORDINAL, _JALALI_CYCLE_DAYS)
+    years = _JALALI_EPOCH_YEAR + 33 * cycles + 4 * (days // 1461)
+    days = days % 1461
+    long_year = days >= 366
+    days = numpy.where(long_year, days - 1, days)
+    years = years + numpy.where(long_year, days // 365, 0)
+    days = numpy.where(long_year, days % 365, days)
+    first_half = days < 186
+    second_half_days = days - 186
+    months = numpy.where(first_half, days // 31 + 1, second_half_days // 30 + 7)
+    days = numpy.where(first_half, days % 31 + 1, second_half_days % 30 + 1)
+    return years, months, days
+
+
+def _ordinals_to_gregorian_numpy(numpy, ordinals):
+    day_array = (ordinals - _UNIX_EPOCH_ORDINAL).astype("datetime64[D]")
+    month_array = day_array.astype("datetime64[M]")
+    years = day_array.astype("datetime64[Y]").astype(numpy.int64) + 1970
+    months = month_array.astype(numpy.int64) % 12 + 1
+    days = (day_array - month_array).astype(numpy.int64) + 1
+    return years, months, days
+
+
+def _format_jalali_many(
+    dates: Iterable[Tuple[int, int, int]], ordinals: Iterable[int], output_format: str, use_persian_numerals: bool,
+    locale: str
+) -> List[str]:
+    # قالب فقط یک بار برای کل دسته کامپایل می‌شود
+    template, emitters = _compile_jalali_strftime(output_format, locale == FA_LOCALE, use_persian_numerals)
+    formatted = []
+    for (year, month, day), ordinal in zip(dates, ordinals):
+        fields = (year, month, day, ordinal, 0, 0, 0, 0, None, None)
+        formatted.append(template.format(*[emit(fields) for emit in emitters]))
+    return formatted
+
+
+def gregorian_to_jalali_many(
+    g_dates,
+    output_format: Optional[str] = DEFAULT_JALALI_FORMAT,
+    use_persian_numerals: bool = True,
+    locale: str = "fa_IR",
+    use_numpy: Optional[bool] = None,
+    input_format: Optional[str] = None
+):
+    """
+    مجموعه‌ای از تاریخ‌های میلادی را یکجا به شمسی تبدیل می‌کند (معادل برداری gregorian_to_jalali).
+
+    Args:
+        g_dates: یکی از موارد زیر:
+                 - دنباله‌ای از ورودی‌های gregorian_to_jalali (رشته، date/datetime) یا تاپل‌های (سال، ماه، روز)
+                 - آرایه numpy.datetime64 با هر واحدی (مثلا ستون تاریخ pandas: series.to_numpy())
+                 - آرایه عددی با شکل (n, 3) از سال، ماه و روز
+        output_format: فرمت رشته‌های خروجی شمسی؛ اگر None باشد سه آرایه موازی (سال‌ها، ماه‌ها، روزها) برمی‌گرداند.
+        use_persian_numerals: اگر True باشد، اعداد در رشته‌های خروجی فارسی می‌شوند.
+        locale: لوکیل برای نام ماه‌ها و روزهای هفته.
+        use_numpy: None یعنی استفاده از NumPy در صورت نصب بودن؛ False محاسبه با پایتون خالص
+                   و True الزام به NumPy.
+        input_format: قالب ورودی‌های رشته‌ای؛ اگر None باشد قالب یک بار برای این دسته تشخیص داده
+                      می‌شود (و فقط با تغییر قالب ورودی‌ها دوباره تشخیص انجام می‌شود).
+
+    Returns:
+        لیست رشته‌های فرمت‌شده، یا تاپل (سال‌ها، ماه‌ها، روزها) که با NumPy آرایه‌های int64 و بدون آن لیست هستند.
+
+    Example:
+        >>> gregorian_to_jalali_many(["2023-03-21", datetime.date(2024, 2, 29)])
+        ['۱۴۰۲/۰۱/۰۱', '۱۴۰۲/۱۲/۱۰']
+        >>> years, months, days = gregorian_to_jalali_many(numpy.array(["2023-03-21"], dtype="datetime64[D]"), output_format=None)
+    """
+    numpy = _numpy_module(use_numpy)
+    parser = DateParser(input_format, calendar=GREGORIAN)
+    if numpy is None:
+        ordinals = [_gregorian_input_to_ordinal(item, parser) for item in g_dates]
+        dates = [_jalali_from_ordinal_checked(ordinal) for ordinal in ordinals]
+        if output_format is None:
+            return [y for y, _, _ in dates], [m for _, m, _ in dates], [d for _, _, d in dates]
+        return _format_jalali_many(dates, ordinals, output_format, use_persian_numerals, locale)
+
+    if not hasattr(g_dates, "__len__"): # مولدها و سایر iterableها
+        g_dates = list(g_dates)
+    ordinals = _gregorian_ordinals_numpy(numpy, g_dates, parser)
+    years, months, days = _ordinals_to_jalali_numpy(numpy, ordinals)
+    if output_format is None:
+        return years, months, days
+    return _format_jalali_many(
+        zip(years.tolist(), months.tolist(), days.tolist()), ordinals.tolist(), output_format, use_persian_numerals,
+        locale
+    )
+
+
+def jalali_to_gregorian_many(
+    j_dates,
+    output_format: Optional[str] = DEFAULT_GREGORIAN_FORMAT,
+    use_numpy: Optional[bool] = None,
+    input_format: Optional[str] = None
+):
+    """
+    مجموعه‌ای از تاریخ‌های شمسی را یکجا به میلادی تبدیل می‌کند (معادل برداری jalali_to_gregorian).
+
+    Args:
+        j_dates: دنباله‌ای از ورودی‌های jalali_to_gregorian (رشته، تاپل (سال، ماه، روز) یا شیء jdatetime)
+                 یا آرایه عددی با شکل (n, 3) از سال، ماه و روز شمسی.
+        output_format: فرمت رشته‌های خروجی میلادی؛ اگر None باشد سه آرایه موازی (سال‌ها، ماه‌ها، روزها) برمی‌گرداند.
+        use_numpy: مانند gregorian_to_jalali_many.
+        input_format: مانند gregorian_to_jalali_many.
+
+    Returns:
+        لیست رشته‌های فرمت‌شده، یا تاپل (سال‌ها، ماه‌ها، روزها) که با NumPy آرایه‌های int64 و بدون آن لیست هستند.
+
+    Example:
+        >>> jalali_to_gregorian_many(["۱۴۰۲/۰۱/۰۱", (1402, 12, 10)])
+        ['2023-03-21', '2024-02-29']
+    """
+    numpy = _numpy_module(use_numpy)
+    parser = DateParser(input_format)
+    if numpy is None:
+        ordinals = [_jalali_input_to_ordinal(item, parser) for item in j_dates]
+        if output_format is None:
+            dates = [_ordinal_to_gregorian(ordinal) for ordinal in ordinals]
+            return [y for y, _, _ in dates], [m for _, m, _ in dates], [d for _, _, d in dates]
+        return [datetime.date.fromordinal(ordinal).strftime(output_format) for ordinal in ordinals]
+
+    if not hasattr(j_dates, "__len__"):
+        j_dates = list(j_dates)
+    ordinals = _jalali_ordinals_numpy(numpy, j_dates, parser)
+    if output_format is None:
+        return _ordinals_to_gregorian_numpy(numpy, ordinals)
+    fromordinal = datetime.date.fromordinal
+    return [fromordinal(ordinal).strftime(output_format) for ordinal in ordinals.tolist()]
+
+
+# --- استخراج و تبدیل تاریخ‌های داخل متن ---
+# یک regex از پیش کامپایل‌شده سه شکل را پیدا می‌کند: عددی سال-ماه-روز (۱۴۰۲/۰۷/۱۶، 2023-10-08، 1402.7.16)،
+# روز و نام ماه شمسی و سال (۱۶ مهر ۱۴۰۲) و روز و نام ماه میلادی انگلیسی و سال (8 October 2023).
+# تقویم شکل عددی از سال تشخیص داده می‌شود (سال‌های کمتر از ۱۷۰۰ شمسی‌اند). طول هر تطبیق محدود است،
+# پس متن جریانی با نگه داشتن فقط _DATE_MENTION_HOLD کاراکتر انتهایی بین تکه‌ها پیمایش می‌شود.
+
+_MENTION_DIGIT = "[0-9\u06f0-\u06f9\u0660-\u0669]"
+_MENTION_SPACE = "[ \u00a0]{1,3}"
+_MAX_JALALI_MENTION_YEAR = 1699
+_JALALI_MENTION_MONTH_PATTERN, _jalali_mention_month = _name_matcher((_JALALI_MONTHS_FA,))
+_GREGORIAN_MENTION_MONTH_PATTERN, _gregorian_mention_month = _name_matcher((_GREGORIAN_MONTHS_EN, _GREGORIAN_MONTHS_SHORT_EN))
+_RE_DATE_MENTION = re.compile(
+    rf"(?<![\w/.\-])(?:"
+    rf"({_MENTION_DIGIT}{{4}})([/\-.])({_MENTION_DIGIT}{{1,2}})\2({_MENTION_DIGIT}{{1,2}})(?![\w/\-]|\.{_MENTION_DIGIT})"
+    rf"|({_MENTION_DIGIT}{{1,2}}){_MENTION_SPACE}{_JALALI_MENTION_MONTH_PATTERN}{_MENTION_SPACE}({_MENTION_DIGIT}{{4}})(?!\w)"
+    rf"|({_MENTION_DIGIT}{{1,2}}){_MENTION_SPACE}{_GREGORIAN_MENTION_MONTH_PATTERN},?{_MENTION_SPACE}({_MENTION_DIGIT}{{4}})(?!\w)"
+    rf")"
+)
+_RE_NON_ASCII_DIGIT = re.compile("[\u06f0-\u06f9\u0660-\u0669]")
+# بیشتر از طولانی‌ترین تطبیق ممکن (به همراه کاراکتر نگاه به جلو)
+_DATE_MENTION_HOLD = 64
+_MentionDates = Optional[Tuple[Tuple[int, int, int], Tuple[int, int, int]]]
+
+
+class DateMention:
+    """
+    یک تاریخ پیدا شده در متن (خروجی extract_dates).
+
+    start و end بازه تاریخ در کل متن ورودی هستند (text[start:end] == text)، calendar تقویم متن اصلی
+    (JALALI یا GREGORIAN) است و jalali و gregorian همان تاریخ در هر دو تقویم به صورت (سال، ماه، روز).
+    """
+
+    __slots__ = ("start", "end", "text", "calendar", "jalali", "gregorian")
+
+    def __init__(
+        self,
+        start: int,
+        end: int,
+        text: str,
+        calendar: str,
+        jalali: Tuple[int, int, int],
+        gregorian: Tuple[int, int, int]
+    ):
+        self.start = start
+        self.end = end
+        self.text = text
+        self.calendar = calendar
+        self.jalali = jalali
+        self.gregorian = gregorian
+
+    def __repr__(self) -> str:
+        fields = ", ".join(f"{name}={getattr(self, name)!r}" for name in self.__slots__)
+        return f"DateMention({fields})"
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, DateMention):
+            return NotImplemented
+        return all(getattr(self, name) == getattr(other, name) for name in self.__slots__)
+
+    def to_dict(self) -> Dict[str, object]:
+        return {name: getattr(self, name) for name in self.__slots__}
+
+
+def _mention_dates(
+    match: "re.Match[str]",
+    memo: Dict[Tuple[str, int, int, int], _MentionDates]
+) -> Tuple[str, _MentionDates]:
+    """تقویم و (تاریخ شمسی، تاریخ میلادی) یک تطبیق؛ برای تاریخ نامعتبر None. هر تاریخ یک بار تبدیل می‌شود."""
+    groups = match.groups()
+    if groups[0] is not None:
+        year, month, day = int(groups[0]), int(groups[2]), int(groups[3])
+        calendar = JALALI if year <= _MAX_JALALI_MENTION_YEAR else GREGORIAN
+    elif groups[4] is not None:
+        year, month, day = int(groups[6]), _jalali_mention_month(groups[5]), int(groups[4])
+        calendar = JALALI
+    else:
+        year, month, day = int(groups[9]), _gregorian_mention_month(groups[8]), int(groups[7])
+        calendar = GREGORIAN
+    key = (calendar, year, month, day)
+    try:
+        return calendar, memo[key]
+    except KeyError:
+        pass
+    try:
+        if calendar == JALALI:
+            _check_jalali_date(year, month, day)
+            dates = (year, month, day), _ordinal_to_gregorian(_jalali_to_ordinal(year, month, day))
+        else:
+            _check_gregorian_date(year, month, day)
+            dates = _jalali_from_ordinal_checked(_gregorian_to_ordinal(year, month, day)), (year, month, day)
+    except ValueError: # مثلا ۱۴۰۲/۱۳/۴۰؛ تاریخ به حساب نمی‌آید
+        dates = None
+    memo[key] = dates
+    return calendar, dates
+
+
+def _iter_date_segments(pieces: Iterable[str]) -> Iterator[Tuple[str, Optional[DateMention]]]:
+    """
+    متن تکه‌تکه را پیمایش می‌کند و (متن قبل از تاریخ، DateMention) برمی‌گرداند؛ متنی که پس از آخرین
+    تاریخ قطعی شده با DateMention برابر None می‌آید. کنار هم گذاشتن همه متن‌ها و تاریخ‌ها همان ورودی است.
+    """
+    memo: Dict[Tuple[str, int, int, int], _MentionDates] = {}
+    buffer = ''
+    offset = 0  # موقعیت buffer[0] در کل متن
+    position = 0  # ابتدای متنی از buffer که هنوز برنگشته است
+    end_of_text = object()
+    for piece in itertools.chain(pieces, (end_of_text,)):
+        if piece is end_of_text:
+            limit = len(buffer)
+        else:
+            if not isinstance(piece, str):
+                raise TypeError("ورودی باید از نوع رشته باشد.")
+            buffer += piece
+            # تطبیق‌هایی که از limit به بعد شروع می‌شوند ممکن است با تکه بعدی تغییر کنند
+            limit = len(buffer) - _DATE_MENTION_HOLD
+            if limit <= position:
+                continue
+        for match in _RE_DATE_MENTION.finditer(buffer, position):
+            start, end = match.span()
+            if start >= limit:
+                break
+            calendar, dates = _mention_dates(match, memo)
+            if dates is None:
+                continue
+            text = match.group()
+            yield buffer[position:start], DateMention(offset + start, offset + end, text, calendar, *dates)
+            position = end
+        if piece is end_of_text:
+            if position < len(buffer):
+                yield buffer[position:], None
+            return
+        cut = max(position, limit)
+        if cut > position:
+            yield buffer[position:cut], None
+        # یک کاراکتر قبل از cut برای نگاه به عقب regex نگه داشته می‌شود
+        drop = cut - 1
+        buffer = buffer[drop:]
+        offset += drop
+        position = cut - drop
+
+
+def _text_pieces(source: Union[str, TextIO, Iterable[str]], buffer_size: int) -> Iterable[str]:
+    if isinstance(source, str):
+        return (source,)
+    if hasattr(source, 'read'):
+        return iter(lambda: source.read(buffer_size), '')  # type: ignore[union-attr]
+    return source
+
+
+def extract_dates(source: Union[str, TextIO, Iterable[str]], buffer_size: int = 1 << 16) -> Iterator[DateMention]:
+    """
+    تاریخ‌های شمسی و میلادی داخل متن را به صورت تنبل پیدا و به تقویم دیگر تبدیل می‌کند.
+
+    شکل‌های پذیرفته: ۱۴۰۲/۰۷/۱۶ و 2023-10-08 (با جداکننده / یا - یا .)، «۱۶ مهر ۱۴۰۲» و «8 October 2023»،
+    با ارقام فارسی، عربی یا انگلیسی. تاریخ‌های نامعتبر (مثل ۱۴۰۲/۱۳/۴۰) نادیده گرفته می‌شوند و هر تاریخ
+    تکراری در یک متن فقط یک بار تبدیل می‌شود.
+
+    Args:
+        source: متن، فایل باز شده یا iterable از رشته‌ها (تکه‌های پشت‌سرهم یک سند). تاریخی که بین دو تکه
+                شکسته شده هم پیدا می‌شود و start و end نسبت به کل متن هستند.
+        buffer_size: اندازه بلوک خواندن از فایل (بر حسب کاراکتر).
+
+    Yields:
+        اشیای DateMention به ترتیب وقوع.
+
+    Example:
+        >>> [(m.text, m.gregorian) for m in extract_dates("جلسه ۱۶ مهر ۱۴۰۲ و تمدید تا 2023-11-01")]
+        [('۱۶ مهر ۱۴۰۲', (2023, 10, 8)), ('2023-11-01', (2023, 11, 1))]
+    """
+    if buffer_size <= 0:
+        raise ValueError("buffer_size باید عددی مثبت باشد.")
+    segments = _iter_date_segments(_text_pieces(source, buffer_size))
+    return (mention for _, mention in segments if mention is not None)
+
+
+def convert_dates_in_stream(
+    source: Union[str, TextIO, Iterable[str]],
+    to: str = GREGORIAN,
+    output_format: Optional[str] = None,
+    use_persian_numerals: Optional[bool] = None,
+    locale: str = FA_LOCALE,
+    buffer_size: int = 1 << 16
+) -> Iterator[str]:
+    """
+    نسخه جریانی convert_dates_in_text: متن تبدیل‌شده را تکه‌تکه برمی‌گرداند
+    (''.join(convert_dates_in_stream(parts)) == convert_dates_in_text(''.join(parts))).
+
+    Example:
+        >>> with open("report.txt", encoding="utf-8") as f:
+        ...     for part in convert_dates_in_stream(f, to="jalali"):
+        ...         out.write(part)
+    """
+    if to not in (JALALI, GREGORIAN):
+        raise ValueError(f"تقویم مقصد باید '{JALALI}' یا '{GREGORIAN}' باشد.")
+    if buffer_size <= 0:
+        raise ValueError("buffer_size باید عددی مثبت باشد.")
+    if output_format is None:
+        output_format = DEFAULT_JALALI_FORMAT if to == JALALI else DEFAULT_GREGORIAN_FORMAT
+    return _convert_date_segments(
+        _iter_date_segments(_text_pieces(source, buffer_size)), to, output_format, use_persian_numerals, locale
+    )
+
+
+def _convert_date_segments(
+    segments: Iterator[Tuple[str, Optional[DateMention]]],
+    to: str,
+    output_format: str,
+    use_persian_numerals: Optional[bool],
+    locale: str
+) -> Iterator[str]:
+    rendered: Dict[Tuple[Tuple[int, int, int], bool], str] = {}
+    for text, mention in segments:
+        if mention is None:
+            yield text
+            continue
+        if mention.calendar == to: # تاریخ از قبل در تقویم مقصد است
+            yield text + mention.text
+            continue
+        persian = use_persian_numerals
+        if persian is None: # خط ارقام تاریخ اصلی حفظ می‌شود
+            persian = _RE_NON_ASCII_DIGIT.search(mention.text) is not None
+        date = mention.jalali if to == JALALI else mention.gregorian
+        key = (date, persian)
+        converted = rendered.get(key)
+        if converted is None:
+            if to == JALALI:
+                year, month, day = date
+                compiled = _compile_jalali_strftime(output_format, locale == FA_LOCALE, persian)
+                converted = _render(compiled, _date_fields(year, month, day, _jalali_to_ordinal(year, month, day)))
+            else:
+                converted = datetime.date(*date).strftime(output_format)
+                if persian:
+                    converted = to_persian_numerals(converted)
+            rendered[key] = converted
+        yield text + converted
+
+
+def convert_dates_in_text(
+    text: str,
+    to: str = GREGORIAN,
+    output_format: Optional[str] = None,
+    use_persian_numerals: Optional[bool] = None,
+    locale: str = FA_LOCALE
+) -> str:
+    """
+    تاریخ‌های داخل متن (شکل‌های extract_dates) را به تقویم مقصد تبدیل و در جای خود جایگزین می‌کند.
+
+    تاریخ‌هایی که از قبل در تقویم مقصد هستند تغییر نمی‌کنند.
+
+    Args:
+        text: متن ورودی.
+        to: تقویم مقصد، "gregorian" (GREGORIAN) یا "jalali" (JALALI).
+        output_format: قالب تاریخ‌های تبدیل‌شده؛ پیش‌فرض DEFAULT_GREGORIAN_FORMAT یا DEFAULT_JALALI_FORMAT.
+        use_persian_numerals: ارقام فارسی (True) یا انگلیسی (False)؛ اگر None باشد خط ارقام هر تاریخ اصلی حفظ می‌شود.
+        locale: لوکیل نام ماه‌ها و روزها در خروجی شمسی.
+
+    Returns:
+        متن با تاریخ‌های تبدیل‌شده.
+
+    Example:
+        >>> convert_dates_in_text("مهلت: ۱۴۰۲/۰۷/۱۶")
+        'مهلت: ۲۰۲۳-۱۰-۰۸'
+        >>> convert_dates_in_text("Released 2023-10-08", to="jalali", output_format="%d %B %Y")
+        'Released 16 مهر 1402'
+    """
+    if not isinstance(text, str):
+        raise TypeError("ورودی باید از نوع رشته باشد.")
+    return "".join(convert_dates_in_stream((text,), to, output_format, use_persian_numerals, locale))
@@ -3,6 +3,7 @@
 from typing import List, Set, Optional, Union, Iterable
 import itertools # برای تولید ترکیبات
 from .text_normalizer import persian_text_normalizer # برای یکسان‌سازی ورودی‌ها
+from .text_analyzer import count_words # شمارش کلمات با توکن‌ساز مشترک
 
 # لیست‌های پیش‌فرض برای تولید کلمات کلیدی طولانی
 # این لیست‌ها می‌توانند بسیار گسترده‌تر باشند و از فایل خوانده شوند.
@@ -82,7 +83,7 @@ def generate_longtail_keywords(
     all_suggestions: Set[str] = set()
     if include_original:
         for seed in normalized_seeds:
-            if len(seed.split()) >= min_length:
+            if count_words(seed) >= min_length:
                 all_suggestions.add(seed)
 
     # ایجاد ترکیبات از کلمات کلیدی اصلی
@@ -104,13 +105,13 @@ def generate_longtail_keywords(
         # 1. ترکیب با پیشوندهای پرسشی
         for prefix in question_prefixes:
             suggestion = f"{prefix} {current_seed_phrase}"
-            if len(suggestion.split()) >= min_length:
+            if count_words(suggestion) >= min_length:
                 suggestions_for_current_seed.add(suggestion)
         
         # 2. ترکیب با پسوندهای رایج
         for suffix in common_suffixes:
             suggestion = f"{current_seed_phrase} {suffix}"
-            if len(suggestion.split()) >= min_length:
+            if count_words(suggestion) >= min_length:
                 suggestions_for_current_seed.add(suggestion)
 
         # 3. ترکیب پیشوند + کلمه کلیدی + پسوند (ساده شده)
@@ -124,7 +125,7 @@ def generate_longtail_keywords(
                     # جلوگیری از پسوندهایی که خودشان پرسشی هستند (مانند چیست) بعد از پیشوند پرسشی
                     if suffix.lower() not in ["چیست", "کجاست"] or not any(q in prefix.lower() for q in ["چیست", "چگونه", "کجا"]):
                         suggestion = f"{prefix} {current_seed_phrase} {suffix}"
-                        if len(suggestion.split()) >= min_length:
+                        if count_words(suggestion) >= min_length:
                             suggestions_for_current_seed.add(suggestion)
         
         # اعمال محدودیت تعداد پیشنهادات برای هر کلمه کلیدی اصلی
@@ -1,6 +1,12 @@
 # farsinum/number_to_words.py
 
-from typing import List
+import abc
+import decimal
+import functools
+import re
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, TextIO, Tuple, Union
+
+from ._batching import map_in_batches
 
 _PERSIAN_ZERO = "صفر"
 _PERSIAN_NEGATIVE = "منفی "
@@ -18,8 +24,11 @@ _PERSIAN_TENS: List[str] = [
 _PERSIAN_HUNDREDS: List[str] = [
     "", "یکصد", "دویست", "سیصد", "چهارصد", "پانصد", "ششصد", "هفتصد", "هشتصد", "نهصد"
 ]
+# هر مقیاس هزار برابر قبلی (مقیاس کوتاه)؛ با extend_persian_scales قابل گسترش است. فراتر از آخرین نام،
+# نام مقیاس ترکیبی از نام‌ها ساخته می‌شود (مثلا «هزار دسیلیون» و «دسیلیون دسیلیون»).
 _PERSIAN_SCALE: List[str] = [
-    "", "هزار", "میلیون", "میلیارد", "تریلیون", "کوادریلیون" # اضافه کردن مقیاس‌های بیشتر در صورت نیاز
+    "", "هزار", "میلیون", "میلیارد", "تریلیون", "کوادریلیون", "کوینتیلیون", "سکستیلیون", "سپتیلیون", "اکتیلیون",
+    "نونیلیون", "دسیلیون"
 ]
 
 
@@ -53,10 +62,138 @@ def _three_digit_to_persian(n: int) -> str:
     return _PERSIAN_AND.join(parts)
 
 
+# حروف همه گروه‌های سه‌رقمی (۰ تا ۹۹۹) یک بار ساخته می‌شوند؛ گروه صفر رشته خالی است
+_PERSIAN_THREE_DIGITS: Tuple[str, ...] = tuple(_three_digit_to_persian(n) for n in range(1000))
+
+# حداکثر تعداد اعداد کش‌شده (کش LRU اعداد مثبت بزرگ‌تر از ۹۹۹ و کوچک‌تر از _MEMOIZED_NUMBER_LIMIT)
+NUMBER_WORDS_CACHE_SIZE = 1 << 16
+_MEMOIZED_NUMBER_LIMIT = 10 ** 18
+# تبدیل دسته‌ای: تبدیل هر عدد حدود یک میکروثانیه است، پس فقط دسته‌های بسیار بزرگ ارزش چند پردازه را دارند
+DEFAULT_WORDS_PARALLEL_THRESHOLD = 200000
+DEFAULT_WORDS_CHUNKSIZE = 8192
+
+
+@functools.lru_cache(maxsize=1024)
+def _compound_scale_name(index: int) -> str:
+    """نام مقیاس ۱۰۰۰ به توان index فراتر از آخرین نام تعریف‌شده (ترکیبی از نام‌ها)."""
+    top = len(_PERSIAN_SCALE) - 1
+    repeats, index = divmod(index, top)
+    names = [_PERSIAN_SCALE[index]] if index else []
+    names.extend([_PERSIAN_SCALE[top]] * repeats)
+    return " ".join(names)
+
+
+def extend_persian_scales(names: Iterable[str]) -> Tuple[str, ...]:
+    """
+    نام مقیاس‌های بزرگ‌تر را به ترتیب (هر کدام هزار برابر قبلی) بعد از آخرین مقیاس تعریف‌شده اضافه می‌کند.
+
+    نام‌ها نباید تکراری باشند یا با واژه‌های عددی موجود (مثل «میلیون» یا «صد») یکی شوند، وگرنه
+    persian_words_to_number مبهم می‌شود. این تغییر سراسری است (بر کل ماژول اثر می‌گذارد).
+
+    Returns:
+        همه نام‌های مقیاس فعلی (از هزار به بعد).
+
+    Example:
+        >>> extend_persian_scales(["اندسیلیون"])[-2:]  # doctest: +SKIP
+        ('دسیلیون', 'اندسیلیون')
+        >>> number_to_persian_words(10 ** 36)  # doctest: +SKIP
+        'یک اندسیلیون'
+    """
+    vocabulary = _words_trie()[_WHOLE_WORDS]
+    added: List[str] = []
+    keys = set()
+    for name in names:
+        if not isinstance(name, str):
+            raise TypeError("نام مقیاس باید از نوع رشته باشد.")
+        if not name.strip():
+            raise ValueError("نام مقیاس نمی‌تواند خالی باشد.")
+        key = name.translate(_WORDS_TEXT_TABLE).replace(" ", "")
+        if key in vocabulary or key in keys:
+            raise ValueError(f"نام مقیاس '{name.strip()}' تکراری است یا با یک واژه عددی موجود یکی است.")
+        keys.add(key)
+        added.append(name.strip())
+    _set_persian_scales(_PERSIAN_SCALE + added)
+    return tuple(_PERSIAN_SCALE[1:])
+
+
+def _set_persian_scales(scales: List[str]) -> None:
+    """واژگان مقیاس‌ها را جایگزین و کش‌های وابسته به آن را پاک می‌کند."""
+    global _WORDS_TRIE
+    _PERSIAN_SCALE[:] = scales
+    _compound_scale_name.cache_clear()
+    _WORDS_TRIE = None
+
+
+def _init_words_worker(scales: Tuple[str, ...]) -> None:
+    """
+    initializer پردازه‌های کارگر *_many: مقیاس‌های اضافه‌شده با extend_persian_scales وضعیت ماژول
+    هستند و پردازه‌هایی که با spawn ساخته می‌شوند آن‌ها را به ارث نمی‌برند.
+    """
+    if tuple(_PERSIAN_SCALE) != scales:
+        _set_persian_scales(list(scales))
+
+
+def _map_in_batches(convert_batch: Callable[[List], List], items: Iterable, workers: Optional[int],
+                    chunksize: int, parallel_threshold: int) -> List:
+    return map_in_batches(convert_batch, items, workers, chunksize, parallel_threshold,
+                          initializer=_init_words_worker, initargs=(tuple(_PERSIAN_SCALE),))
+
+
+def _decimal_digits(number: int) -> str:
+    """نمایش دهدهی یک عدد مثبت؛ اعداد بزرگ‌تر از محدودیت str (sys.get_int_max_str_digits) تکه‌تکه تبدیل می‌شوند."""
+    try:
+        return str(number)
+    except ValueError:
+        half = int(number.bit_length() * 0.1505) # حدود نصف تعداد ارقام (log10(2) / 2)
+        high, low = divmod(number, 10 ** half)
+        return _decimal_digits(high) + _decimal_digits(low).zfill(half)
+
+
+def _digits_to_persian(digits: str) -> str:
+    """
+    حروف عدد مثبت از روی رشته ارقام آن: گروه‌های سه‌رقمی از رشته برش می‌خورند (به جای % و // روی عدد
+    که برای اعداد بزرگ از مرتبه دوم است) و حروف هر گروه از جدول خوانده می‌شود.
+    """
+    groups = _PERSIAN_THREE_DIGITS
+    scales = _PERSIAN_SCALE
+    digits = "00"[:-len(digits) % 3] + digits
+    scale_index = len(digits) // 3
+    parts: List[str] = []
+    for start in range(0, len(digits), 3):
+        scale_index -= 1
+        group = groups[int(digits[start:start + 3])]
+        if group:
+            if scale_index:
+                scale = scales[scale_index] if scale_index < len(scales) else _compound_scale_name(scale_index)
+                group += " " + scale
+            parts.append(group)
+    return _PERSIAN_AND.join(parts)
+
+
+@functools.lru_cache(maxsize=NUMBER_WORDS_CACHE_SIZE)
+def _memoized_number_to_persian(number: int) -> str:
+    """حروف عدد مثبت کوچک‌تر از _MEMOIZED_NUMBER_LIMIT (برای اعداد کوچک % و // سریع‌تر از برش رشته است)."""
+    groups = _PERSIAN_THREE_DIGITS
+    parts: List[str] = []
+    scale_index = 0
+    while number:
+        number, group = divmod(number, 1000)
+        if group:
+            parts.append(groups[group] + " " + _PERSIAN_SCALE[scale_index] if scale_index else groups[group])
+        scale_index += 1
+    parts.reverse()
+    return _PERSIAN_AND.join(parts)
+
+
 def number_to_persian_words(number: int) -> str:
     """
     یک عدد صحیح را به حروف فارسی تبدیل می‌کند.
 
+    اندازه عدد محدودیتی ندارد: فراتر از آخرین مقیاس نام‌دار (دسیلیون، یا مقیاس‌های اضافه‌شده با
+    extend_persian_scales) نام مقیاس‌ها ترکیبی ساخته می‌شود. برای اعداد بسیار بزرگ هزینه بیش از خطی است:
+    تبدیل int به رشته ارقام در CPython فوق‌خطی است و طول نام‌های ترکیبی، و در نتیجه خروجی، هم با
+    تعداد ارقام رشد می‌کند.
+
     Args:
         number: عدد صحیح ورودی.
 
@@ -76,41 +213,682 @@ def number_to_persian_words(number: int) -> str:
         'یکصد و بیست و سه میلیون و چهارصد و پنجاه و شش هزار و هفتصد و هشتاد و نه'
         >>> number_to_persian_words(-42)
         'منفی چهل و دو'
+        >>> number_to_persian_words(2 * 10 ** 36 + 10 ** 33)
+        'دو هزار دسیلیون و یک دسیلیون'
     """
     if not isinstance(number, int):
         raise TypeError("ورودی باید عدد صحیح باشد.")
 
+    if 0 < number < 1000:
+        return _PERSIAN_THREE_DIGITS[number]
     if number == 0:
         return _PERSIAN_ZERO
 
     prefix = ""
     if number < 0:
         prefix = _PERSIAN_NEGATIVE
-        number = abs(number)
+        number = -number
 
-    if number >= (1000 ** len(_PERSIAN_SCALE)):
-        raise ValueError(f"عدد بسیار بزرگ است. حداکثر تا مقیاس {_PERSIAN_SCALE[-1]} پشتیبانی می‌شود.")
+    if number < 1000:
+        return prefix + _PERSIAN_THREE_DIGITS[number]
+    if number < _MEMOIZED_NUMBER_LIMIT:
+        return prefix + _memoized_number_to_persian(number)
+    return prefix + _digits_to_persian(_decimal_digits(number))
 
-    parts: List[str] = []
-    scale_index = 0
 
-    while number > 0:
-        if number % 1000 != 0:
-            chunk_words = _three_digit_to_persian(number % 1000)
-            if scale_index > 0: # برای هزار، میلیون و ...
-                chunk_words += " " + _PERSIAN_SCALE[scale_index]
-            parts.append(chunk_words)
-        number //= 1000
-        scale_index += 1
-    
-    # اتصال قطعات با " و "
-    result = _PERSIAN_AND.join(reversed(parts))
-    
-    # پاکسازی " و " های اضافی احتمالی ناشی از منطق ساده شده
-    # مثال: "یک هزار و  و یک" -> "یک هزار و یک"
-    # این مورد با منطق فعلی _three_digit_to_persian کمتر پیش می آید
-    # اما برای اطمینان:
-    result = result.replace(f"{_PERSIAN_AND.strip()}  {_PERSIAN_AND.strip()}", _PERSIAN_AND) # " و  و "
-    result = result.strip()
-
-    return prefix + result
+def _number_words_batch(batch: List[int]) -> List[str]:
+    return [number_to_persian_words(number) for number in batch]
+
+
+def number_to_persian_words_many(
+    numbers: Iterable[int],
+    workers: Optional[int] = None,
+    chunksize: int = DEFAULT_WORDS_CHUNKSIZE,
+    parallel_threshold: int = DEFAULT_WORDS_PARALLEL_THRESHOLD
+) -> List[str]:
+    """
+    تعداد زیادی عدد را به حروف فارسی تبدیل می‌کند و نتایج را به ترتیب ورودی برمی‌گرداند.
+
+    از همان جدول گروه‌های سه‌رقمی و کش number_to_persian_words استفاده می‌شود. ورودی به صورت تنبل
+    خوانده می‌شود؛ اگر حداقل parallel_threshold عدد داشته باشد و workers بیشتر از ۱ باشد، اعداد در
+    دسته‌های chunksize تایی بین پردازه‌ها پخش می‌شوند.
+
+    Args:
+        numbers: هر iterable از اعداد صحیح.
+        workers: تعداد پردازه‌ها (پیش‌فرض: تعداد هسته‌های پردازنده).
+        chunksize: تعداد عدد در هر دسته ارسالی به یک پردازه.
+        parallel_threshold: حداقل تعداد عدد برای استفاده از پردازه‌های جداگانه.
+
+    Returns:
+        لیست حروف اعداد به همان ترتیب ورودی.
+
+    Example:
+        >>> number_to_persian_words_many([0, 21, 1001])
+        ['صفر', 'بیست و یک', 'یک هزار و یک']
+    """
+    return _map_in_batches(_number_words_batch, numbers, workers, chunksize, parallel_threshold)
+
+
+# --- تبدیل حروف فارسی به عدد ---
+# واژگان بالا (به همراه چند املای رایج دیگر) یک بار در یک trie کاراکتری کامپایل می‌شوند. متن با یک
+# translate یکسان‌سازی می‌شود (حذف نیم‌فاصله، ی و ک عربی) و سپس با طولانی‌ترین تطبیق در trie توکن‌بندی
+# می‌شود، پس «یکصد»، «یک صد»، «یک‌صد» و «یکهزار» همه درست خوانده می‌شوند و زمان اجرا با طول متن خطی است.
+
+_WORD_NUMBER, _WORD_HUNDRED, _WORD_SCALE, _WORD_AND, _WORD_ZERO, _WORD_NEGATIVE, _WORD_DIGIT_GROUP = range(7)
+_WHOLE_WORDS = "" # کلید ریشه trie برای جدول کل واژه‌ها (کاراکتر خالی هرگز در متن دیده نمی‌شود)
+# مرتبه هر واژه عددی در گروه سه‌رقمی: صدگان ۳، دهگان ۲، یکان و ۱۰ تا ۱۹ برابر ۱؛ هر واژه باید مرتبه‌ای
+# کمتر از واژه قبلی همان گروه داشته باشد (مثلا «بیست و یک» درست است و «یک و بیست» نه)
+_GROUP_START_LEVEL = 4
+_PERSIAN_WORD_VARIANTS: Dict[str, int] = {"هیجده": 18, "شونزده": 16, "پونزده": 15, "پونصد": 500}
+_WORDS_TEXT_TABLE = str.maketrans({"\u200c": None, "\u200e": None, "\u200f": None, "ي": "ی", "ى": "ی", "ك": "ک"})
+_WORD_DIGITS = frozenset("0123456789\u06f0\u06f1\u06f2\u06f3\u06f4\u06f5\u06f6\u06f7\u06f8\u06f9"
+                         "\u0660\u0661\u0662\u0663\u0664\u0665\u0666\u0667\u0668\u0669")
+_WORDS_TRIE: Optional[Dict] = None
+
+
+def _words_trie() -> Dict:
+    """
+    trie واژه‌های عددی: هر گره یک dict از کاراکتر به گره بعدی و کلید None برای (نوع، مقدار، مرتبه).
+    مرتبه یک مقیاس شماره آن در _PERSIAN_SCALE است.
+    """
+    global _WORDS_TRIE
+    if _WORDS_TRIE is not None:
+        return _WORDS_TRIE
+    words: Dict[str, Tuple[int, int, int]] = {}
+    for value, word in enumerate(_PERSIAN_UNITS[1:], 1):
+        words[word] = (_WORD_NUMBER, value, 1)
+    for value, word in enumerate(_PERSIAN_TEENS, 10):
+        words[word] = (_WORD_NUMBER, value, 1)
+    for value, word in enumerate(_PERSIAN_TENS[2:], 2):
+        words[word] = (_WORD_NUMBER, value * 10, 2)
+    for value, word in enumerate(_PERSIAN_HUNDREDS[1:], 1):
+        words[word] = (_WORD_NUMBER, value * 100, 3)
+    for word, value in _PERSIAN_WORD_VARIANTS.items():
+        words[word] = (_WORD_NUMBER, value, 3 if value >= 100 else 1)
+    for index, word in enumerate(_PERSIAN_SCALE[1:], 1):
+        words[word.translate(_WORDS_TEXT_TABLE).replace(" ", "")] = (_WORD_SCALE, 1000 ** index, index)
+    words["صد"] = (_WORD_HUNDRED, 100, 3)
+    words[_PERSIAN_AND.strip()] = (_WORD_AND, 0, 0)
+    words[_PERSIAN_ZERO] = (_WORD_ZERO, 0, 0)
+    words[_PERSIAN_NEGATIVE.strip()] = (_WORD_NEGATIVE, 0, 0)
+
+    trie: Dict = {_WHOLE_WORDS: words}
+    for word, entry in words.items():
+        node = trie
+        for char in word:
+            node = node.setdefault(char, {})
+        node[None] = entry
+    _WORDS_TRIE = trie
+    return trie
+
+
+def _invalid_words(text: str) -> ValueError:
+    return ValueError(f"متن '{text}' یک عدد معتبر به حروف فارسی نیست.")
+
+
+def _iter_number_words(text: str) -> Iterator[Tuple[int, int, int]]:
+    """
+    توکن‌های (نوع، مقدار، مرتبه) متن عدد به حروف. هر کلمه جداشده با فاصله ابتدا مستقیما در واژگان جستجو
+    می‌شود و فقط کلمه‌های چسبیده (مثل «یکهزار» یا «بیستو») با طولانی‌ترین تطبیق در trie تکه می‌شوند.
+    """
+    trie = _words_trie()
+    words = trie[_WHOLE_WORDS]
+    for word in text.translate(_WORDS_TEXT_TABLE).split():
+        entry = words.get(word)
+        if entry is not None:
+            yield entry
+            continue
+        position, length = 0, len(word)
+        while position < length:
+            if word[position] in _WORD_DIGITS: # گروه نوشته‌شده با رقم
+                end = position + 1
+                while end < length and word[end] in _WORD_DIGITS:
+                    end += 1
+                yield _WORD_DIGIT_GROUP, int(word[position:end]), 0
+                position = end
+                continue
+            node = trie
+            entry = None
+            index = end = position
+            while index < length:
+                node = node.get(word[index])
+                if node is None:
+                    break
+                index += 1
+                if None in node:
+                    entry, end = node[None], index
+            if entry is None:
+                raise _invalid_words(text)
+            yield entry
+            position = end
+
+
+def persian_words_to_number(text: str) -> int:
+    """
+    عدد نوشته‌شده با حروف فارسی را به عدد صحیح تبدیل می‌کند (عکس number_to_persian_words).
+
+    املاهای رایج پذیرفته می‌شوند: «صد» و «یکصد»، «یک صد»، با یا بدون نیم‌فاصله یا فاصله («سی‌صد»،
+    «سی صد»، «یکهزار»، «بیست‌و‌یک»)، ی و ک عربی، «هیجده». گروه‌های عددی می‌توانند با رقم نوشته شوند
+    («۲۵ هزار»). مقیاس بخش‌ها باید از چپ به راست کوچک شود («دو هزار و سه هزار» و «یک میلیون هزار»
+    نامعتبرند)؛ تنها مقیاس‌های کنار هم مجاز، نام‌های ترکیبی number_to_persian_words هستند (یک مقیاس
+    و پس از آن بزرگ‌ترین مقیاس تعریف‌شده، مثل «هزار دسیلیون») که در هم ضرب می‌شوند.
+
+    Args:
+        text: متن عدد به حروف.
+
+    Returns:
+        عدد صحیح.
+
+    Raises:
+        TypeError: اگر ورودی رشته نباشد.
+        ValueError: اگر متن عدد معتبری نباشد.
+
+    Example:
+        >>> persian_words_to_number("یکصد و بیست و سه میلیون")
+        123000000
+        >>> persian_words_to_number("منفی دو هزار و سی‌صد")
+        -2300
+        >>> persian_words_to_number("۲۵ هزار")
+        25000
+    """
+    if not isinstance(text, str):
+        raise TypeError("ورودی باید از نوع رشته باشد.")
+    total = 0         # مجموع بخش‌های کامل‌شده
+    section = 0       # بخش فعلی: گروه ضرب در مقیاس(های) آن، تا رسیدن مقیاس بعدی
+    section_scale = 0 # توان هزار در مقیاس بخش فعلی (۰: هنوز مقیاسی دیده نشده)
+    limit = 0         # همین توان برای آخرین بخش کامل‌شده؛ توان هر بخش باید از آن کمتر باشد (۰: بدون محدودیت)
+    top_scale = len(_PERSIAN_SCALE) - 1
+    group = 0         # گروه سه‌رقمی در حال خواندن
+    level = _GROUP_START_LEVEL
+    previous_kind = None
+    negative = zero = False
+    for kind, value, word_level in _iter_number_words(text):
+        if zero:
+            raise _invalid_words(text)
+        if kind == _WORD_DIGIT_GROUP: # «۲۵ هزار»
+            if level != _GROUP_START_LEVEL:
+                raise _invalid_words(text)
+            group, level, kind = value, 0, _WORD_NUMBER
+        elif kind == _WORD_NUMBER:
+            if word_level >= level:
+                raise _invalid_words(text)
+            group += value
+            level = word_level
+        elif kind == _WORD_HUNDRED: # «صد» یا «دو صد»
+            if level == _GROUP_START_LEVEL:
+                group = 100
+            elif level == 1 and group < 10:
+                group *= 100
+            elif level == 2 and group == 30: # «سی صد» (سیصد با فاصله)
+                group = 300
+            else:
+                raise _invalid_words(text)
+            level = 3
+        elif kind == _WORD_SCALE:
+            if previous_kind == _WORD_SCALE: # مقیاس ترکیبی: «هزار دسیلیون»
+                if word_level != top_scale:
+                    raise _invalid_words(text)
+                section *= value
+                section_scale += word_level
+            else:
+                if section_scale: # بخش قبلی کامل شد
+                    if limit and section_scale >= limit:
+                        raise _invalid_words(text)
+                    limit = section_scale
+                total += section
+                section = (group or 1) * value
+                section_scale = word_level
+                group, level = 0, _GROUP_START_LEVEL
+        elif kind == _WORD_AND:
+            if previous_kind not in (_WORD_NUMBER, _WORD_HUNDRED, _WORD_SCALE):
+                raise _invalid_words(text)
+        elif kind == _WORD_ZERO:
+            if previous_kind not in (None, _WORD_NEGATIVE):
+                raise _invalid_words(text)
+            zero = True
+        else: # منفی فقط در ابتدای متن
+            if previous_kind is not None:
+                raise _invalid_words(text)
+            negative = True
+        previous_kind = kind
+
+    if previous_kind in (None, _WORD_AND, _WORD_NEGATIVE) or (limit and section_scale >= limit):
+        raise _invalid_words(text)
+    number = total + section + group
+    return -number if negative else number
+
+
+def _words_to_number_batch(batch: List[str], errors: str = "raise") -> List[Optional[int]]:
+    if errors == "raise":
+        return [persian_words_to_number(text) for text in batch]
+    results: List[Optional[int]] = []
+    for text in batch:
+        try:
+            results.append(persian_words_to_number(text))
+        except (TypeError, ValueError):
+            results.append(None)
+    return results
+
+
+def persian_words_to_number_many(
+    texts: Iterable[str],
+    errors: str = "raise",
+    workers: Optional[int] = None,
+    chunksize: int = DEFAULT_WORDS_CHUNKSIZE,
+    parallel_threshold: int = DEFAULT_WORDS_PARALLEL_THRESHOLD
+) -> List[Optional[int]]:
+    """
+    تبدیل دسته‌ای حروف به عدد (مثلا یک ستون کامل) با حفظ ترتیب؛ trie فقط یک بار ساخته می‌شود.
+
+    Args:
+        texts: هر iterable از رشته‌ها.
+        errors: "raise" برای خطا در اولین متن نامعتبر یا "coerce" برای None به جای آن.
+        workers، chunksize و parallel_threshold: مانند number_to_persian_words_many.
+
+    Example:
+        >>> persian_words_to_number_many(["بیست و یک", "یکهزار", "نامعلوم"], errors="coerce")
+        [21, 1000, None]
+    """
+    if errors not in ("raise", "coerce"):
+        raise ValueError("مقدار errors باید 'raise' یا 'coerce' باشد.")
+    convert_batch = functools.partial(_words_to_number_batch, errors=errors)
+    return _map_in_batches(convert_batch, texts, workers, chunksize, parallel_threshold)
+
+
+# --- خواندن همه اعداد یک متن (حالت TTS) ---
+# یک regex همه اعداد را با ارقام فارسی، عربی یا انگلیسی پیدا می‌کند: با جداکننده هزارگان (1,234 یا ۱٬۲۳۴)،
+# اعشار (۲.۵ یا ۲٫۵) و علامت منفی (فقط در ابتدای کلمه، تا بازه‌هایی مثل ۱۰-۱۲ منفی خوانده نشوند).
+
+_SPELL_DIGIT = "[0-9\u06f0-\u06f9\u0660-\u0669]"
+_RE_SPELL_NUMBER = re.compile(
+    rf"((?<![^\s(])[-\u2212])?({_SPELL_DIGIT}{{1,3}}(?:[,\u066c]{_SPELL_DIGIT}{{3}})+|{_SPELL_DIGIT}+)"
+    rf"(?:[.\u066b]({_SPELL_DIGIT}+))?"
+)
+_SPELL_DIGITS_TABLE = str.maketrans(
+    "\u06f0\u06f1\u06f2\u06f3\u06f4\u06f5\u06f6\u06f7\u06f8\u06f9\u0660\u0661\u0662\u0663\u0664\u0665\u0666\u0667\u0668\u0669",
+    "01234567890123456789",
+    ",\u066c"
+)
+# همه کاراکترهایی که می‌توانند بخشی از یک عدد در _RE_SPELL_NUMBER باشند (ارقام، جداکننده‌ها و علامت منفی)
+_SPELL_NUMBER_CHARACTERS = "0123456789\u06f0\u06f1\u06f2\u06f3\u06f4\u06f5\u06f6\u06f7\u06f8\u06f9" \
+    "\u0660\u0661\u0662\u0663\u0664\u0665\u0666\u0667\u0668\u0669,\u066c.\u066b-\u2212"
+_PERSIAN_DECIMAL_POINT = " ممیز "
+DEFAULT_SPELL_BUFFER_SIZE = 1 << 16
+_SPELL_MEMO_SIZE = 1 << 12 # حداکثر تعداد اعداد متمایز کش‌شده در هر سند یا جریان
+
+
+def _digit_string_to_persian(digits: str) -> str:
+    """حروف مقدار یک رشته ارقام انگلیسی (صفرهای ابتدایی بی‌اثرند)؛ بدون تبدیل به int برای اعداد بزرگ."""
+    stripped = digits.lstrip("0")
+    if not stripped:
+        return _PERSIAN_ZERO
+    if len(stripped) < 4:
+        return _PERSIAN_THREE_DIGITS[int(stripped)]
+    return _digits_to_persian(stripped)
+
+
+def _spell_digit_run(digits: str) -> str:
+    """حروف یک رشته ارقام انگلیسی؛ صفرهای ابتدایی (مثل ۰۰۷ یا ۰۲۱) هر کدام «صفر» خوانده می‌شوند."""
+    stripped = digits.lstrip("0")
+    zeros = [_PERSIAN_ZERO] * (len(digits) - len(stripped))
+    if not stripped:
+        return " ".join(zeros)
+    return " ".join(zeros + [_digit_string_to_persian(stripped)])
+
+
+def _spell_number_match(match: "re.Match[str]") -> str:
+    sign, integer, fraction = match.groups()
+    words = _spell_digit_run(integer.translate(_SPELL_DIGITS_TABLE))
+    if fraction is not None:
+        words += _PERSIAN_DECIMAL_POINT + _spell_digit_run(fraction.translate(_SPELL_DIGITS_TABLE))
+    if sign and words != _PERSIAN_ZERO:
+        words = _PERSIAN_NEGATIVE + words
+    return words
+
+
+def _number_speller(memo_size: int = _SPELL_MEMO_SIZE) -> Callable[["re.Match[str]"], str]:
+    """
+    تابع جایگزینی re.sub با کش نتایج در طول یک سند (اعداد تکراری فقط یک بار خوانده می‌شوند).
+    کش با رسیدن به memo_size مدخل خالی می‌شود تا حافظه جریان‌های بسیار بزرگ محدود بماند.
+    """
+    memo: Dict[str, str] = {}
+
+    def spell(match: "re.Match[str]") -> str:
+        text = match.group()
+        words = memo.get(text)
+        if words is None:
+            if len(memo) >= memo_size:
+                memo.clear()
+            words = memo[text] = _spell_number_match(match)
+        return words
+
+    return spell
+
+
+def spell_out_numbers(text: str) -> str:
+    """
+    همه اعداد داخل متن را با حروف فارسی جایگزین می‌کند (مثلا برای تبدیل متن به گفتار).
+
+    ارقام فارسی، عربی و انگلیسی، جداکننده هزارگان (, یا ٬)، اعشار (. یا ٫ که «ممیز» خوانده می‌شود) و
+    علامت منفی در ابتدای کلمه پشتیبانی می‌شوند. متن فقط یک بار پیمایش می‌شود و هر عدد تکراری فقط یک
+    بار به حروف تبدیل می‌شود. اندازه اعداد محدودیتی ندارد.
+
+    Args:
+        text: متن ورودی.
+
+    Returns:
+        متن با اعداد به حروف.
+
+    Example:
+        >>> spell_out_numbers("قیمت ۱٬۲۵۰ تومان و وزن 2.5 کیلو")
+        'قیمت یک هزار و دویست و پنجاه تومان و وزن دو ممیز پنج کیلو'
+        >>> spell_out_numbers("دمای -۳ درجه، صفحه ۱۰-۱۲")
+        'دمای منفی سه درجه، صفحه ده-دوازده'
+    """
+    if not isinstance(text, str):
+        raise TypeError("ورودی باید از نوع رشته باشد.")
+    return _RE_SPELL_NUMBER.sub(_number_speller(), text)
+
+
+def spell_out_numbers_stream(
+    source: Union[str, TextIO, Iterable[str]],
+    buffer_size: int = DEFAULT_SPELL_BUFFER_SIZE
+) -> Iterator[str]:
+    """
+    نسخه جریانی spell_out_numbers برای متن‌های بلند
+    (''.join(spell_out_numbers_stream(parts)) == spell_out_numbers(''.join(parts))).
+
+    متن فقط قبل از کاراکترهایی که جزئی از عدد نیستند (حرف، فاصله، ...) برش می‌خورد، پس عددی که بین دو
+    تکه ورودی شکسته شده درست خوانده می‌شود و حافظه مصرفی فقط به طول تکه‌ها و طولانی‌ترین عدد بستگی دارد
+    (حتی برای متن‌های بدون فاصله). کش اعداد تکراری برای کل جریان مشترک است.
+
+    Args:
+        source: فایل باز شده (خوانده شده در بلوک‌های buffer_size کاراکتری)، یک رشته یا iterable از رشته‌ها.
+        buffer_size: اندازه بلوک خواندن از فایل.
+
+    Example:
+        >>> "".join(spell_out_numbers_stream(["سال ۱۴", "۰۲ و ۲٫", "۵ درصد"]))
+        'سال یک هزار و چهارصد و دو و دو ممیز پنج درصد'
+        >>> with open("article.txt", encoding="utf-8") as f:  # doctest: +SKIP
+        ...     for part in spell_out_numbers_stream(f):
+        ...         out.write(part)
+    """
+    if buffer_size <= 0:
+        raise ValueError("buffer_size باید عددی مثبت باشد.")
+    if isinstance(source, str):
+        pieces: Iterable[str] = (source,)
+    elif hasattr(source, 'read'):
+        pieces = iter(lambda: source.read(buffer_size), '')  # type: ignore[union-attr]
+    else:
+        pieces = source
+    return _spell_out_pieces(pieces)
+
+
+def _spell_out_pieces(pieces: Iterable[str]) -> Iterator[str]:
+    spell = _number_speller()
+    pending: List[str] = [] # فقط کاراکترهای عددی انتهای متن تا اینجا (به همراه یک کاراکتر قبل از آن‌ها)
+    for piece in pieces:
+        if not isinstance(piece, str):
+            raise TypeError("ورودی باید از نوع رشته باشد.")
+        # برش قبل از آخرین کاراکتر این تکه که نمی‌تواند جزئی از عدد باشد؛ آن کاراکتر در تکه بعدی می‌ماند
+        # تا شرط ابتدای کلمه برای علامت منفی درست بماند. فقط همین تکه (آن هم از انتها) پیمایش می‌شود.
+        cut = len(piece.rstrip(_SPELL_NUMBER_CHARACTERS)) - 1
+        if cut < 0:
+            pending.append(piece)
+            continue
+        pending.append(piece[:cut])
+        text = ''.join(pending)
+        if text:
+            yield _RE_SPELL_NUMBER.sub(spell, text)
+        pending = [piece[cut:]]
+    text = ''.join(pending)
+    if text:
+        yield _RE_SPELL_NUMBER.sub(spell, text)
+
+
+# --- اعشار، ترتیبی و مبالغ پولی به حروف ---
+# هر سبک یک شیء قالب‌بند است که جدول‌های پسوند خود را یک بار در سازنده می‌سازد؛ format یک مقدار و
+# format_many یک دسته را بدون هزینه راه‌اندازی دوباره به حروف تبدیل می‌کند.
+
+_PERSIAN_ORDINAL_SUFFIX = "م"
+_PERSIAN_ORDINAL_ADJECTIVE_SUFFIX = "مین"
+_PERSIAN_FIRST = "اول"
+# مخرج کسرهای اعشاری تا این تعداد رقم از پیش ساخته می‌شود (دهم، صدم، هزارم، ده‌هزارم، ...)
+_PRECOMPUTED_FRACTION_DIGITS = 18
+_CURRENCY_UNITS: Dict[str, Tuple[str, int]] = {"rial": ("ریال", 1), "toman": ("تومان", 10)}
+
+
+def _ordinal_word(word: str, suffix: str) -> str:
+    """شکل ترتیبی یک واژه عددی: سه -> سوم، سی -> سی‌ام، بیست -> بیستم (suffix برابر «م» یا «مین»)."""
+    if word == "سه":
+        return "سو" + suffix
+    if word.endswith("ی"):
+        return word + "\u200cا" + suffix
+    return word + suffix
+
+
+def _scale_words(scale_index: int) -> str:
+    return _PERSIAN_SCALE[scale_index] if scale_index < len(_PERSIAN_SCALE) else _compound_scale_name(scale_index)
+
+
+def _to_decimal(value: Union[int, float, str, decimal.Decimal]) -> decimal.Decimal:
+    """ورودی عددی (int، float، Decimal یا رشته با ارقام فارسی/عربی/انگلیسی) را به Decimal متناهی تبدیل می‌کند."""
+    if isinstance(value, bool) or not isinstance(value, (int, float, str, decimal.Decimal)):
+        raise TypeError("ورودی باید عدد (int، float یا Decimal) یا رشته عددی باشد.")
+    if isinstance(value, float):
+        value = repr(value) # کوتاه‌ترین نمایش دهدهی float (2.675 به جای 2.67499999...)
+    elif isinstance(value, str):
+        value = value.strip().translate(_SPELL_DIGITS_TABLE).replace("\u066b", ".").replace("\u2212", "-")
+    try:
+        number = decimal.Decimal(value)
+    except decimal.InvalidOperation:
+        raise ValueError(f"'{value}' یک عدد معتبر نیست.")
+    if not number.is_finite():
+        raise ValueError("عدد باید متناهی باشد.")
+    return number
+
+
+class _WordsFormatter(abc.ABC):
+    """پایه انتزاعی قالب‌بندهای حروف: format_many و فراخوانی مستقیم شیء."""
+
+    __slots__ = ()
+
+    @abc.abstractmethod
+    def format(self, value) -> str:
+        """یک مقدار را به حروف تبدیل می‌کند."""
+
+    def __call__(self, value) -> str:
+        return self.format(value)
+
+    def format_many(self, values: Iterable) -> List[str]:
+        """همه مقادیر را به ترتیب ورودی قالب‌بندی می‌کند."""
+        format_value = self.format
+        return [format_value(value) for value in values]
+
+
+class DecimalWordsFormatter(_WordsFormatter):
+    """
+    عدد اعشاری را به حروف کسری فارسی تبدیل می‌کند: ۱۲.۵ -> دوازده و پنج دهم.
+
+    تعداد ارقام اعشار همان تعداد ارقام نوشته‌شده است (برای رشته و Decimal، ۲.۵۰ «پنجاه صدم» خوانده
+    می‌شود) و float با کوتاه‌ترین نمایش دهدهی خود خوانده می‌شود.
+
+    Example:
+        >>> formatter = DecimalWordsFormatter()
+        >>> formatter.format("۱۲.۵")
+        'دوازده و پنج دهم'
+        >>> formatter.format_many([0.25, -1.05])
+        ['بیست و پنج صدم', 'منفی یک و پنج صدم']
+    """
+
+    __slots__ = ("_denominators",)
+
+    def __init__(self) -> None:
+        # مخرج کسر برای هر تعداد رقم اعشار: ۱ -> دهم، ۲ -> صدم، ۳ -> هزارم، ۴ -> ده‌هزارم، ...
+        self._denominators = tuple(self._denominator(digits) for digits in range(_PRECOMPUTED_FRACTION_DIGITS + 1))
+
+    @staticmethod
+    def _denominator(digits: int) -> str:
+        if digits == 0:
+            return ""
+        scale_index, power = divmod(digits, 3)
+        if scale_index == 0:
+            return ("ده", "صد")[power - 1] + _PERSIAN_ORDINAL_SUFFIX
+        prefix = ("", "ده\u200c", "صد\u200c")[power]
+        return prefix + _ordinal_word(_scale_words(scale_index), _PERSIAN_ORDINAL_SUFFIX)
+
+    def format(self, value: Union[int, float, str, decimal.Decimal]) -> str:
+        """مقدار را به حروف کسری تبدیل می‌کند (ValueError برای NaN و بی‌نهایت)."""
+        number = _to_decimal(value)
+        text = format(abs(number), "f")
+        integer, _, fraction = text.partition(".")
+        fraction = fraction.rstrip("0") if isinstance(value, float) else fraction
+        parts = []
+        if integer.strip("0") or not fraction.strip("0"):
+            parts.append(_digit_string_to_persian(integer))
+        if fraction.strip("0"):
+            digits = len(fraction)
+            denominator = (
+                self._denominators[digits] if digits <= _PRECOMPUTED_FRACTION_DIGITS else self._denominator(digits)
+            )
+            parts.append(_digit_string_to_persian(fraction) + " " + denominator)
+        words = _PERSIAN_AND.join(parts)
+        if number < 0 and words != _PERSIAN_ZERO:
+            words = _PERSIAN_NEGATIVE + words
+        return words
+
+
+class OrdinalWordsFormatter(_WordsFormatter):
+    """
+    عدد صحیح نامنفی را به حروف ترتیبی تبدیل می‌کند: ۲۱ -> بیست و یکم (یا بیست و یکمین).
+
+    Args:
+        adjective: اگر True باشد صفت ترتیبی با «مین» ساخته می‌شود (سومین).
+        first_as_aval: اگر True باشد عدد ۱ به صورت «اول»/«اولین» نوشته می‌شود (به جای «یکم»/«یکمین»).
+
+    Example:
+        >>> OrdinalWordsFormatter().format_many([1, 3, 30, 21])
+        ['یکم', 'سوم', 'سی\u200cام', 'بیست و یکم']
+        >>> OrdinalWordsFormatter(adjective=True).format(1000)
+        'یک هزارمین'
+    """
+
+    __slots__ = ("_suffix", "_first", "_last_words")
+
+    def __init__(self, adjective: bool = False, first_as_aval: bool = False):
+        suffix = _PERSIAN_ORDINAL_ADJECTIVE_SUFFIX if adjective else _PERSIAN_ORDINAL_SUFFIX
+        self._suffix = suffix
+        self._first = _PERSIAN_FIRST + suffix[1:] if first_as_aval else None
+        # شکل ترتیبی هر واژه‌ای که می‌تواند آخرین واژه یک عدد باشد
+        words = set(_PERSIAN_UNITS[1:] + _PERSIAN_TEENS + _PERSIAN_TENS[2:] + _PERSIAN_HUNDREDS[1:] + _PERSIAN_SCALE[1:])
+        words.add(_PERSIAN_ZERO)
+        self._last_words = {word: _ordinal_word(word, suffix) for word in words}
+
+    def format(self, value: int) -> str:
+        """ValueError برای اعداد منفی."""
+        if isinstance(value, bool) or not isinstance(value, int):
+            raise TypeError("ورودی باید عدد صحیح باشد.")
+        if value < 0:
+            raise ValueError("عدد ترتیبی نمی‌تواند منفی باشد.")
+        if value == 1 and self._first is not None:
+            return self._first
+        head, space, last = number_to_persian_words(value).rpartition(" ")
+        ordinal = self._last_words.get(last)
+        if ordinal is None: # مقیاسی که بعد از ساخت قالب‌بند اضافه شده است
+            ordinal = _ordinal_word(last, self._suffix)
+        return head + space + ordinal
+
+
+class CurrencyWordsFormatter(_WordsFormatter):
+    """
+    مبلغ ریالی یا تومانی را به حروف با واحد پول تبدیل می‌کند (مثلا برای رسید و فاکتور).
+
+    Args:
+        unit: واحد خروجی، "toman" یا "rial".
+        source_unit: واحد مبالغ ورودی، "rial" یا "toman" (۱ تومان = ۱۰ ریال).
+
+    اگر مبلغ به تومان کامل نرسد باقی‌مانده به ریال نوشته می‌شود. مبلغ ورودی باید در ریال صحیح باشد
+    (مثلا ۱۲.۵ تومان = ۱۲۵ ریال قابل قبول است ولی ۱۲.۵۵ تومان نه).
+
+    Example:
+        >>> CurrencyWordsFormatter().format(1250000)
+        'یکصد و بیست و پنج هزار تومان'
+        >>> CurrencyWordsFormatter().format(12345)
+        'یک هزار و دویست و سی و چهار تومان و پنج ریال'
+        >>> CurrencyWordsFormatter(unit="rial", source_unit="toman").format("۲۵٬۰۰۰")
+        'دویست و پنجاه هزار ریال'
+    """
+
+    __slots__ = ("unit", "source_unit", "_unit_suffix", "_rial_suffix", "_unit_rials", "_source_rials")
+
+    def __init__(self, unit: str = "toman", source_unit: str = "rial"):
+        for name in (unit, source_unit):
+            if name not in _CURRENCY_UNITS:
+                raise ValueError(f"واحد پول '{name}' نامعتبر است (باید یکی از {', '.join(_CURRENCY_UNITS)} باشد).")
+        self.unit = unit
+        self.source_unit = source_unit
+        unit_name, self._unit_rials = _CURRENCY_UNITS[unit]
+        self._source_rials = _CURRENCY_UNITS[source_unit][1]
+        self._unit_suffix = " " + unit_name
+        self._rial_suffix = " " + _CURRENCY_UNITS["rial"][0]
+
+    def format(self, value: Union[int, float, str, decimal.Decimal]) -> str:
+        """رشته ورودی می‌تواند جداکننده هزارگان (, یا ٬) و ارقام فارسی داشته باشد."""
+        if isinstance(value, int) and not isinstance(value, bool):
+            rials = value * self._source_rials
+        else:
+            if isinstance(value, str):
+                value = value.replace(",", "").replace("\u066c", "")
+            amount = _to_decimal(value) * self._source_rials
+            if amount != amount.to_integral_value():
+                raise ValueError(f"مبلغ {value} در ریال صحیح نیست.")
+            rials = int(amount)
+        units, remainder = divmod(abs(rials), self._unit_rials)
+        if units or not remainder:
+            words = number_to_persian_words(units) + self._unit_suffix
+            if remainder:
+                words += _PERSIAN_AND + number_to_persian_words(remainder) + self._rial_suffix
+        else:
+            words = number_to_persian_words(remainder) + self._rial_suffix
+        return _PERSIAN_NEGATIVE + words if rials < 0 else words
+
+
+DEFAULT_DECIMAL_FORMATTER = DecimalWordsFormatter()
+DEFAULT_ORDINAL_FORMATTER = OrdinalWordsFormatter()
+DEFAULT_CURRENCY_FORMATTER = CurrencyWordsFormatter()
+
+
+def decimal_to_persian_words(value: Union[int, float, str, decimal.Decimal]) -> str:
+    """
+    عدد اعشاری را به حروف تبدیل می‌کند (جزئیات در DecimalWordsFormatter).
+
+    Example:
+        >>> decimal_to_persian_words("۱۲.۵")
+        'دوازده و پنج دهم'
+    """
+    return DEFAULT_DECIMAL_FORMATTER.format(value)
+
+
+def ordinal_to_persian_words(number: int) -> str:
+    """
+    عدد ترتیبی به حروف (جزئیات در OrdinalWordsFormatter).
+
+    Example:
+        >>> ordinal_to_persian_words(21)
+        'بیست و یکم'
+    """
+    return DEFAULT_ORDINAL_FORMATTER.format(number)
+
+
+def currency_to_persian_words(amount: Union[int, float, str, decimal.Decimal], unit: str = "toman", source_unit: str = "rial") -> str:
+    """
+    مبلغ پولی به حروف (جزئیات در CurrencyWordsFormatter). برای تعداد زیادی مبلغ یک قالب‌بند بسازید
+    و از format_many استفاده کنید.
+
+    Example:
+        >>> currency_to_persian_words(1250000)
+        'یکصد و بیست و پنج هزار تومان'
+    """
+    if unit == "toman" and source_unit == "rial":
+        return DEFAULT_CURRENCY_FORMATTER.format(amount)
+    return CurrencyWordsFormatter(unit, source_unit).format(amount)
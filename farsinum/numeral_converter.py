@@ -1,9 +1,16 @@
 # farsinum/numeral_converter.py
 
-from typing import Union
+import decimal
+import functools
+import math
+import re
+from typing import Callable, Iterable, List, Optional, Union
 
 PERSIAN_NUMERALS = "۰۱۲۳۴۵۶۷۸۹"
+ARABIC_NUMERALS = "٠١٢٣٤٥٦٧٨٩"
 ENGLISH_NUMERALS = "0123456789"
+PERSIAN_THOUSANDS_SEPARATOR = "\u066c" # ٬
+PERSIAN_DECIMAL_SEPARATOR = "\u066b" # ٫
 
 # ساخت جداول ترجمه برای کارایی بیشتر
 _PERSIAN_TO_ENGLISH_TRANSLATOR = str.maketrans(PERSIAN_NUMERALS, ENGLISH_NUMERALS)
@@ -49,3 +56,281 @@ def to_english_numerals(text: Union[str, int]) -> str:
     # اما برای سادگی، فرض می‌کنیم ورودی یا فارسی است یا انگلیسی که به فارسی تبدیل شده.
     # راه ساده‌تر و مستقیم‌تر برای این تابع:
     return str(text).translate(_PERSIAN_TO_ENGLISH_TRANSLATOR)
+
+
+# --- قالب‌بندی اعداد با ارقام و جداکننده‌های فارسی ---
+# عدد ابتدا با format پایتون به شکل ASCII (با , و .) ساخته می‌شود و سپس یک translate ارقام و
+# جداکننده‌ها را یکجا جایگزین می‌کند. در حالت دسته‌ای همه خروجی‌ها به هم چسبانده می‌شوند تا فقط
+# یک translate روی کل بافر اجرا شود.
+
+NEGATIVE_STYLES = ("prefix", "suffix", "parentheses")
+_BATCH_SEPARATOR = "\n"
+
+
+@functools.lru_cache(maxsize=32)
+def _number_translator(thousands_separator: str, decimal_separator: str, use_persian_numerals: bool) -> dict:
+    """جدول translate از قالب ASCII (ارقام انگلیسی، , و .) به قالب خروجی."""
+    if _BATCH_SEPARATOR in thousands_separator or _BATCH_SEPARATOR in decimal_separator:
+        raise ValueError("جداکننده‌ها نمی‌توانند شامل خط جدید باشند.")
+    table = {ord(","): thousands_separator, ord("."): decimal_separator}
+    if use_persian_numerals:
+        table.update(_ENGLISH_TO_PERSIAN_TRANSLATOR)
+    return table
+
+
+def _ascii_number_renderer(precision: Optional[int], grouping: bool, negative_style: str) -> Callable[[object], str]:
+    """
+    تابعی می‌سازد که یک عدد را به قالب ASCII (مثلا -1,234.50) تبدیل می‌کند. مشخصه‌های format یک بار
+    برای کل دسته ساخته می‌شوند.
+    """
+    if precision is not None and (isinstance(precision, bool) or not isinstance(precision, int) or precision < 0):
+        raise ValueError("precision باید عدد صحیح نامنفی یا None باشد.")
+    if negative_style not in NEGATIVE_STYLES:
+        raise ValueError(f"negative_style نامعتبر است (باید یکی از {', '.join(NEGATIVE_STYLES)} باشد).")
+    group = "," if grouping else ""
+    fixed_spec = None if precision is None else f"{group}.{precision}f"
+    decimal_spec = group + "f"
+    Decimal = decimal.Decimal
+
+    def render(value) -> str:
+        if isinstance(value, bool) or not isinstance(value, (int, float, Decimal)):
+            item = getattr(value, "item", None) # اسکالرهای NumPy (مثل numpy.int64) به عدد پایتون
+            value = item() if item is not None else None
+            if isinstance(value, bool) or not isinstance(value, (int, float)):
+                raise TypeError("ورودی باید عدد (int، float یا Decimal) باشد.")
+        if isinstance(value, int):
+            # int بدون تبدیل به float (بدون از دست رفتن دقت برای اعداد بزرگ)
+            text = format(value, group) if fixed_spec is None else format(Decimal(value), fixed_spec)
+        elif not (math.isfinite(value) if isinstance(value, float) else value.is_finite()):
+            raise ValueError("عدد باید متناهی باشد.")
+        elif fixed_spec is not None:
+            text = format(value, fixed_spec)
+        elif isinstance(value, float):
+            text = format(value, group) # کوتاه‌ترین نمایش دهدهی float
+            if "e" in text: # اعداد خیلی بزرگ یا کوچک بدون نماد علمی
+                text = format(Decimal(repr(value)), decimal_spec)
+        else:
+            text = format(value, decimal_spec)
+        if text[0] != "-":
+            return text
+        if not text.strip("-0.,"): # صفر منفی (مثلا -0.00)
+            return text[1:]
+        if negative_style == "prefix":
+            return text
+        if negative_style == "suffix":
+            return text[1:] + "-"
+        return "(" + text[1:] + ")"
+
+    return render
+
+
+def format_persian_number(
+    value: Union[int, float, decimal.Decimal],
+    precision: Optional[int] = None,
+    thousands_separator: str = PERSIAN_THOUSANDS_SEPARATOR,
+    decimal_separator: str = PERSIAN_DECIMAL_SEPARATOR,
+    negative_style: str = "prefix",
+    use_persian_numerals: bool = True
+) -> str:
+    """
+    عدد را با ارقام فارسی و جداکننده‌های هزارگان (٬) و اعشار (٫) فارسی قالب‌بندی می‌کند.
+
+    Args:
+        value: عدد ورودی (int، float، Decimal یا اسکالر NumPy).
+        precision: تعداد ارقام اعشار (با گرد کردن)؛ None یعنی همه ارقام (float با کوتاه‌ترین نمایش دهدهی).
+        thousands_separator: جداکننده هزارگان؛ رشته خالی یعنی بدون گروه‌بندی.
+        decimal_separator: جداکننده اعشار.
+        negative_style: محل علامت منفی: "prefix" (-۱۲)، "suffix" (۱۲-) یا "parentheses" ((۱۲)، سبک حسابداری).
+        use_persian_numerals: اگر False باشد ارقام انگلیسی می‌مانند.
+
+    Returns:
+        رشته قالب‌بندی‌شده.
+
+    Example:
+        >>> format_persian_number(1234567.891, precision=2)
+        '۱٬۲۳۴٬۵۶۷٫۸۹'
+        >>> format_persian_number(-2500, negative_style="suffix")
+        '۲٬۵۰۰-'
+    """
+    render = _ascii_number_renderer(precision, bool(thousands_separator), negative_style)
+    return render(value).translate(_number_translator(thousands_separator, decimal_separator, use_persian_numerals))
+
+
+def format_persian_numbers(
+    values: Iterable,
+    precision: Optional[int] = None,
+    thousands_separator: str = PERSIAN_THOUSANDS_SEPARATOR,
+    decimal_separator: str = PERSIAN_DECIMAL_SEPARATOR,
+    negative_style: str = "prefix",
+    use_persian_numerals: bool = True
+) -> List[str]:
+    """
+    نسخه دسته‌ای format_persian_number برای لیست‌ها، آرایه‌های یک‌بعدی NumPy و ستون‌های pandas.
+
+    آرایه‌ها یک باره با tolist به اعداد پایتون تبدیل می‌شوند، همه اعداد به قالب ASCII ساخته می‌شوند و
+    سپس فقط یک translate روی بافر به هم چسبیده آن‌ها اجرا می‌شود.
+
+    Args:
+        values: دنباله‌ای از اعداد یا آرایه یک‌بعدی.
+        بقیه آرگومان‌ها: مانند format_persian_number.
+
+    Returns:
+        لیست رشته‌های قالب‌بندی‌شده به ترتیب ورودی.
+
+    Example:
+        >>> format_persian_numbers([1500, -20.5, 0])
+        ['۱٬۵۰۰', '-۲۰٫۵', '۰']
+        >>> format_persian_numbers([1.005, 2.5], precision=2)
+        ['۱٫۰۰', '۲٫۵۰']
+    """
+    if hasattr(values, "tolist"): # ndarray یا Series
+        if getattr(values, "ndim", 1) != 1:
+            raise ValueError("آرایه ورودی باید یک‌بعدی باشد.")
+        values = values.tolist()
+    render = _ascii_number_renderer(precision, bool(thousands_separator), negative_style)
+    table = _number_translator(thousands_separator, decimal_separator, use_persian_numerals)
+    texts = [render(value) for value in values]
+    if not texts:
+        return []
+    return _BATCH_SEPARATOR.join(texts).translate(table).split(_BATCH_SEPARATOR)
+
+
+# --- تجزیه اعداد قالب‌بندی‌شده فارسی/عربی ---
+# یک translate همه خط‌های ارقام و جداکننده‌ها را به ASCII می‌برد و حذف نشانه‌های جهت متن را هم
+# انجام می‌دهد؛ سپس یک regex از پیش کامپایل‌شده شکل عدد (و گروه‌بندی درست هزارگان) را بررسی می‌کند.
+# در حالت دسته‌ای translate فقط یک بار روی کل ورودی‌های به هم چسبیده اجرا می‌شود.
+
+_PARSE_TRANSLATOR = str.maketrans({
+    **{persian: english for persian, english in zip(PERSIAN_NUMERALS + ARABIC_NUMERALS, ENGLISH_NUMERALS * 2)},
+    PERSIAN_THOUSANDS_SEPARATOR: ",",
+    "\u00a0": ",", # فاصله نشکن و فاصله نشکن باریک به عنوان جداکننده هزارگان
+    "\u202f": ",",
+    PERSIAN_DECIMAL_SEPARATOR: ".",
+    "\u2212": "-", # علامت منفی یونیکد
+    **dict.fromkeys("\u200e\u200f\u061c\u202a\u202b\u202c\u202d\u202e\u2066\u2067\u2068\u2069"), # نشانه‌های جهت متن
+})
+_RE_PARSE_NUMBER = re.compile(
+    r"\s*(?P<open>\()?(?P<sign>[-+])?"
+    r"(?=\.?\d)(?P<integer>\d{1,3}(?:,\d{3})+|\d*)(?P<fraction>\.\d+)?(?P<exponent>[eE][-+]?\d+)?"
+    r"(?P<suffix>-)?(?(open)\))\s*"
+)
+
+
+def _numpy_module(use_numpy: Optional[bool]):
+    """ماژول numpy یا None اگر نصب نباشد (یا use_numpy=False باشد)."""
+    if use_numpy is False:
+        return None
+    try:
+        import numpy
+    except ImportError:
+        if use_numpy:
+            raise ImportError("برای use_numpy=True باید کتابخانه numpy نصب باشد: pip install numpy")
+        return None
+    return numpy
+
+
+def _parse_ascii_number(text: str, original: str, as_decimal: bool) -> Union[int, float, decimal.Decimal]:
+    """متنی که از _PARSE_TRANSLATOR گذشته را به عدد تبدیل می‌کند (original فقط برای پیام خطا است)."""
+    match = _RE_PARSE_NUMBER.fullmatch(text)
+    if match is None:
+        raise ValueError(f"'{original}' یک عدد معتبر نیست.")
+    open_parenthesis, sign, integer, fraction, exponent, suffix = match.groups()
+    if (open_parenthesis or suffix) and sign or (open_parenthesis and suffix):
+        raise ValueError(f"'{original}' یک عدد معتبر نیست.")
+    negative = sign == "-" or suffix is not None or open_parenthesis is not None
+    if "," in integer:
+        integer = integer.replace(",", "")
+    if fraction is None and exponent is None:
+        number = int(integer)
+        return -number if negative else number
+    digits = (integer or "0") + (fraction or "") + (exponent or "")
+    number = decimal.Decimal(digits) if as_decimal else float(digits)
+    return -number if negative else number
+
+
+def parse_persian_number(text: str, as_decimal: bool = False) -> Union[int, float, decimal.Decimal]:
+    """
+    عدد نوشته‌شده با ارقام فارسی، عربی یا انگلیسی و جداکننده‌های فارسی یا انگلیسی را به عدد پایتون تبدیل می‌کند.
+
+    جداکننده هزارگان (٬ یا , یا فاصله نشکن) فقط در گروه‌های سه‌رقمی درست پذیرفته می‌شود، اعشار با ٫ یا .
+    نوشته می‌شود و علامت منفی می‌تواند پیشوند (-۱۲)، پسوند (۱۲-) یا پرانتز ((۱۲)) باشد؛ یعنی خروجی
+    format_persian_number با هر negative_style دوباره قابل تجزیه است. نشانه‌های جهت متن (LRM/RLM) نادیده
+    گرفته می‌شوند.
+
+    Args:
+        text: رشته عدد.
+        as_decimal: اگر True باشد اعداد اعشاری به جای float به صورت Decimal (بدون خطای گرد کردن) برمی‌گردند.
+
+    Returns:
+        int برای اعداد بدون اعشار و توان، و در غیر این صورت float (یا Decimal).
+
+    Example:
+        >>> parse_persian_number("۱۲٬۳۴۵٫۶۷")
+        12345.67
+        >>> parse_persian_number("١٢٣")
+        123
+        >>> parse_persian_number("۲٬۵۰۰-")
+        -2500
+    """
+    if not isinstance(text, str):
+        raise TypeError("ورودی باید از نوع رشته باشد.")
+    return _parse_ascii_number(text.translate(_PARSE_TRANSLATOR), text, as_decimal)
+
+
+def _numbers_to_array(numpy, numbers: list):
+    """نتایج تجزیه را به آرایه NumPy تبدیل می‌کند: int64 اگر همه صحیح باشند، وگرنه float64 (None -> NaN)."""
+    if all(type(number) is int for number in numbers):
+        try:
+            return numpy.array(numbers, dtype=numpy.int64)
+        except OverflowError: # عدد بزرگ‌تر از int64
+            return numpy.array(numbers, dtype=object)
+    if any(isinstance(number, decimal.Decimal) for number in numbers):
+        return numpy.array(numbers, dtype=object)
+    return numpy.array([math.nan if number is None else number for number in numbers], dtype=numpy.float64)
+
+
+def parse_persian_numbers(
+    texts: Iterable[str],
+    as_decimal: bool = False,
+    errors: str = "raise",
+    use_numpy: bool = False
+):
+    """
+    نسخه دسته‌ای parse_persian_number (مثلا برای ستون قیمت‌های جمع‌آوری‌شده از وب یا فیلدهای فرم).
+
+    همه متن‌ها به هم چسبانده می‌شوند و فقط یک translate روی کل بافر اجرا می‌شود؛ سپس هر مقدار با همان
+    regex از پیش کامپایل‌شده بررسی می‌شود.
+
+    Args:
+        texts: دنباله‌ای از رشته‌ها (یا آرایه/ستون رشته‌ای NumPy و pandas).
+        as_decimal: مانند parse_persian_number.
+        errors: "raise" برای خطا در اولین متن نامعتبر یا "coerce" برای None (و NaN در آرایه NumPy) به جای آن.
+        use_numpy: اگر True باشد خروجی آرایه NumPy است (ImportError اگر numpy نصب نباشد): int64 اگر همه
+                   مقادیر صحیح باشند، وگرنه float64 (یا object برای Decimal و اعداد بزرگ‌تر از int64).
+
+    Returns:
+        لیست اعداد به ترتیب ورودی (یا آرایه NumPy با use_numpy=True).
+
+    Example:
+        >>> parse_persian_numbers(["۱۲٬۳۴۵", "١٢٣", "نامعلوم"], errors="coerce")
+        [12345, 123, None]
+    """
+    if errors not in ("raise", "coerce"):
+        raise ValueError("مقدار errors باید 'raise' یا 'coerce' باشد.")
+    numpy = _numpy_module(use_numpy)
+    texts = texts.tolist() if hasattr(texts, "tolist") else list(texts)
+    if not all(isinstance(text, str) for text in texts):
+        raise TypeError("همه ورودی‌ها باید از نوع رشته باشند.")
+    translated = _BATCH_SEPARATOR.join(texts).translate(_PARSE_TRANSLATOR).split(_BATCH_SEPARATOR)
+    if len(translated) != len(texts): # ورودی‌هایی که خودشان خط جدید دارند (یا لیست خالی)
+        translated = [text.translate(_PARSE_TRANSLATOR) for text in texts]
+    numbers = []
+    append = numbers.append
+    for text, original in zip(translated, texts):
+        try:
+            append(_parse_ascii_number(text, original, as_decimal))
+        except ValueError:
+            if errors == "raise":
+                raise
+            append(None)
+    return numbers if numpy is None else _numbers_to_array(numpy, numbers)
@@ -4,6 +4,7 @@ import os
 import pkgutil # برای خواندن فایل‌های داده از داخل پکیج
 from typing import Set, Dict, Tuple, Literal
 from .text_normalizer import persian_text_normalizer # برای نرمال‌سازی متن ورودی
+from .tokenizer import iter_words # توکن‌ساز مشترک (علائم چسبیده به کلمات جدا می‌شوند)
 
 # مسیر فایل‌های واژگان نسبت به این فایل
 _DATA_PATH = os.path.join(os.path.dirname(__file__), 'data')
@@ -75,8 +76,8 @@ def analyze_sentiment_simple(
     else:
         processed_text = text
     
-    # توکن‌سازی ساده بر اساس فاصله. برای دقت بیشتر می‌توان از توکن‌سازهای پیشرفته‌تر استفاده کرد.
-    words = processed_text.lower().split() # تبدیل به حروف کوچک برای یکسان‌سازی (اگرچه در فارسی کمتر کاربرد دارد)
+    # توکن‌سازی با توکن‌ساز مشترک؛ «خوب.» و «عالی» هم با واژگان تطبیق داده می‌شوند.
+    words = iter_words(processed_text.lower()) # تبدیل به حروف کوچک برای یکسان‌سازی (اگرچه در فارسی کمتر کاربرد دارد)
 
     positive_score = 0
     negative_score = 0
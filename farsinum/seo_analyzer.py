@@ -4,7 +4,8 @@ import re
 from typing import List, Dict, Optional, Any, Tuple
 from collections import Counter
 from .text_normalizer import persian_text_normalizer # برای پیش‌پردازش متن
-from .text_analyzer import count_words, count_sentences # برای معیارهای خوانایی
+from .text_analyzer import TextStats, analyze_text # برای طول متن و معیارهای خوانایی
+from .tokenizer import iter_words # توکن‌ساز مشترک برای شمارش کلمه کلیدی
 
 # برای استخراج تگ‌های عنوان و توضیحات از HTML (در صورت نیاز)
 # فعلا از آن استفاده نمی‌کنیم و روی تحلیل متن خام تمرکز داریم.
@@ -43,11 +44,18 @@ def _preprocess_text_for_seo(text: str, normalize: bool = True) -> str:
         text = persian_text_normalizer(text)
     return text.lower() # برای شمارش کلمات کلیدی بدون حساسیت به بزرگی و کوچکی (در فارسی کمتر مهم است)
 
-def check_text_length(text: str, min_word_count: int = RECOMMENDED_MIN_WORD_COUNT) -> SEOResult:
+def check_text_length(
+    text: str,
+    min_word_count: int = RECOMMENDED_MIN_WORD_COUNT,
+    stats: Optional[TextStats] = None
+) -> SEOResult:
     """
     طول متن (تعداد کلمات) را بررسی می‌کند.
+    اگر آمار متن (analyze_text) از قبل محاسبه شده باشد، با stats داده می‌شود تا متن دوباره پیمایش نشود.
     """
-    word_count = count_words(text) # از ماژول text_analyzer خودمان استفاده می‌کنیم
+    if stats is None:
+        stats = analyze_text(text)
+    word_count = stats.words
     passed = word_count >= min_word_count
     message = (
         f"تعداد کلمات متن {word_count} است. "
@@ -71,14 +79,17 @@ def check_keyword_density(
     processed_text = _preprocess_text_for_seo(text, normalize_text_and_keyword)
     processed_keyword = _preprocess_text_for_seo(keyword, normalize_text_and_keyword).strip()
 
-    words = processed_text.split()
-    total_words = len([word for word in words if word]) # شمارش دقیق کلمات پس از split
+    total_words = 0
+    keyword_occurrences = 0
+    for word in iter_words(processed_text): # علائم چسبیده (مثل «سئو.») جدا می‌شوند
+        total_words += 1
+        if word == processed_keyword:
+            keyword_occurrences += 1
 
     if total_words == 0:
         return SEOResult("Keyword Density", False, "متن خالی است یا کلمه‌ای ندارد.", value=0,
                          details={"keyword": processed_keyword, "occurrences": 0, "total_words": 0})
 
-    keyword_occurrences = words.count(processed_keyword)
     density = keyword_occurrences / total_words if total_words > 0 else 0
 
     passed = min_density <= density <= max_density
@@ -160,12 +171,19 @@ def check_headings_simple(text: str) -> SEOResult:
     return SEOResult("Headings Usage", passed, message, value=total_headings, details=headings_found)
 
 
-def check_readability_simple(text: str, max_avg_sentence_len: int = RECOMMENDED_AVG_SENTENCE_LENGTH_MAX) -> SEOResult:
+def check_readability_simple(
+    text: str,
+    max_avg_sentence_len: int = RECOMMENDED_AVG_SENTENCE_LENGTH_MAX,
+    stats: Optional[TextStats] = None
+) -> SEOResult:
     """
     بررسی ساده خوانایی متن بر اساس میانگین طول جمله.
+    اگر آمار متن (analyze_text) از قبل محاسبه شده باشد، با stats داده می‌شود تا متن دوباره پیمایش نشود.
     """
-    num_words = count_words(text)
-    num_sentences = count_sentences(text)
+    if stats is None:
+        stats = analyze_text(text)
+    num_words = stats.words
+    num_sentences = stats.sentences
 
     if num_sentences == 0:
         return SEOResult("Readability (Avg Sentence Length)", False, "جمله‌ای برای تحلیل خوانایی یافت نشد.", value=0)
@@ -225,15 +243,16 @@ def run_seo_checklist_on_text(text: str, keyword: Optional[str] = None) -> List[
     مجموعه‌ای از بررسی‌های سئو را روی متن خام اجرا می‌کند.
     """
     results: List[SEOResult] = []
+    stats = analyze_text(text) # یک گذر برای همه شمارش‌ها
 
-    results.append(check_text_length(text))
+    results.append(check_text_length(text, stats=stats))
     if keyword:
         results.append(check_keyword_density(text, keyword))
     else:
         results.append(SEOResult("Keyword Density", False, "کلمه کلیدی برای بررسی چگالی ارائه نشده است.", value=0))
         
     results.append(check_headings_simple(text))
-    results.append(check_readability_simple(text))
+    results.append(check_readability_simple(text, stats=stats))
     
     return results
 
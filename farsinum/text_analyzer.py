@@ -1,72 +1,298 @@
 # farsinum/text_analyzer.py
 
+import itertools
+import mmap
+import os
 import re
-from typing import List
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, Iterable, Optional, Tuple
+
+from .tokenizer import TOKEN_PATTERN, TOKEN_LATIN_WORD, TOKEN_NUMBER, TOKEN_PERSIAN_WORD, TOKEN_PUNCTUATION, ZWNJ
 
 # برای سادگی، از کاراکترهای پایانی جمله استاندارد استفاده می‌کنیم.
 # برای دقت بیشتر، می‌توان موارد استثنا (مانند Ph.D.) را در نظر گرفت.
-_SENTENCE_TERMINATORS = r"[.!?؟]+" # یک یا چند پایانه جمله
+# نقطه داخل اعداد (۲.۵) جزئی از توکن عدد است و پایان جمله حساب نمی‌شود.
+_SENTENCE_TERMINATORS = frozenset(".!?؟")
 _PARAGRAPH_SEPARATOR = r"\n\s*\n" # دو یا چند خط جدید، با فضای خالی احتمالی بینشان
+_RE_PARAGRAPH_SEPARATOR = re.compile(_PARAGRAPH_SEPARATOR)
+
+# شمارش فایل‌های بزرگ: فایل در پنجره‌هایی با این اندازه (بایت) خوانده و رمزگشایی می‌شود
+DEFAULT_FILE_WINDOW_SIZE = 1 << 24
+_UTF8_BOM = b"\xef\xbb\xbf"
+# مرز امن پنجره‌ها (در بایت‌های UTF-8): بعد از یک فاصله ASCII و درست قبل از شروع یک توکن، یعنی بایت
+# آغازین هر کاراکتر غیرفاصله (به جز ZWNJ). دنباله‌هایی که ممکن است فاصله یونیکد یا ZWNJ باشند (مثل
+# U+00A0، U+1680، U+2000-U+207F و U+3000-U+303F) محتاطانه کنار گذاشته می‌شوند.
+# توکن‌ها فاصله ندارند، پس هیچ توکن و هیچ کاراکتری بین دو پنجره شکسته نمی‌شود.
+_RE_SAFE_CUT = re.compile(
+    rb"[ \t\n\r](?=[\x21-\x7e\xc3-\xe0\xe4-\xf4]|\xc2[\xa1-\xbf]|\xe1[^\x9a]|\xe2[^\x80\x81]|\xe3[^\x80])"
+)
+
 
 def count_words(text: str) -> int:
     """
     تعداد کلمات در متن را شمارش می‌کند.
-    کلمات با فاصله از هم جدا می‌شوند. علائم نگارشی چسبیده به کلمات جزئی از کلمه حساب نمی‌شوند
-    (پس از جداسازی با فاصله، رشته‌های خالی فیلتر می‌شوند).
+    کلمات و اعداد با توکن‌ساز farsinum.tokenizer شمرده می‌شوند؛ علائم نگارشی (چسبیده یا جدا) کلمه حساب نمی‌شوند.
     """
-    if not isinstance(text, str):
-        raise TypeError("ورودی باید از نوع رشته باشد.")
-    if not text.strip():
-        return 0
-    
-    # حذف علائم نگارشی که ممکن است به کلمات چسبیده باشند برای شمارش دقیق‌تر "کلمه"
-    # این یک راه ساده است، برای دقت بیشتر باید لیست کامل‌تری از علائم داشت
-    # و یا از روش‌های توکن‌سازی پیشرفته‌تری استفاده کرد.
-    # فعلا بر اساس جداسازی با فاصله و فیلتر کردن رشته‌های خالی عمل می‌کنیم.
-    # یک راه بهتر: حذف علائم نگارشی و سپس split
-    # text_without_punctuation = re.sub(r'[^\w\s]', '', text, flags=re.UNICODE) # حذف هرچیزی جز حروف، اعداد و فاصله
-    # words = text_without_punctuation.split()
-    
-    # روش فعلی: split بر اساس فاصله و سپس فیلتر
-    words = re.split(r'\s+', text.strip()) # تقسیم بر اساس یک یا چند فاصله
-    return len([word for word in words if word]) # فیلتر کردن رشته‌های خالی احتمالی
+    return analyze_text(text).words
+
 
 def count_sentences(text: str) -> int:
     """
     تعداد جملات در متن را شمارش می‌کند.
     جملات با کاراکترهای پایانی استاندارد (. ! ؟) از هم جدا می‌شوند.
     """
-    if not isinstance(text, str):
-        raise TypeError("ورودی باید از نوع رشته باشد.")
-    if not text.strip():
-        return 0
-    
-    # تقسیم متن بر اساس پایان‌دهنده‌های جمله
-    # و فیلتر کردن رشته‌های خالی که ممکن است در اثر چند پایان‌دهنده پشت سر هم ایجاد شوند.
-    sentences = re.split(_SENTENCE_TERMINATORS, text)
-    # اگر متنی با نقطه تمام نشود، آخرین بخش هم یک جمله حساب می‌شود (اگر خالی نباشد).
-    # re.split اگر با جداکننده تمام شود، یک رشته خالی در انتها ایجاد می‌کند.
-    # مثال: "سلام. خوبی؟" -> ["سلام", " خوبی", ""]
-    # "سلام" -> ["سلام"]
-    
-    count = 0
-    for s in sentences:
-        if s.strip(): # اگر بخشی از متن (پس از جداسازی) محتوا داشته باشد
-            count += 1
-    return count if count > 0 else (1 if text.strip() else 0) # اگر هیچ جداکننده‌ای نبود ولی متن وجود داشت، یک جمله است
+    return analyze_text(text).sentences
+
 
 def count_paragraphs(text: str) -> int:
     """
     تعداد پاراگراف‌ها در متن را شمارش می‌کند.
     پاراگراف‌ها با یک یا چند خط خالی از هم جدا می‌شوند.
     """
+    return analyze_text(text).paragraphs
+
+
+class TextStats:
+    """
+    آمار یک متن که با analyze_text در یک گذر محاسبه می‌شود.
+
+    words (تعداد توکن‌های کلمه و عدد)، sentences و paragraphs دقیقا همان مقادیر count_words، count_sentences
+    و count_paragraphs هستند.
+    characters طول کل متن است و persian_characters، latin_characters و digits تعداد حروف فارسی/عربی،
+    حروف لاتین و ارقام (انگلیسی، فارسی و عربی) را نشان می‌دهند.
+    """
+
+    __slots__ = ("words", "sentences", "paragraphs", "characters", "persian_characters", "latin_characters", "digits")
+
+    def __init__(
+        self,
+        words: int = 0,
+        sentences: int = 0,
+        paragraphs: int = 0,
+        characters: int = 0,
+        persian_characters: int = 0,
+        latin_characters: int = 0,
+        digits: int = 0
+    ):
+        self.words = words
+        self.sentences = sentences
+        self.paragraphs = paragraphs
+        self.characters = characters
+        self.persian_characters = persian_characters
+        self.latin_characters = latin_characters
+        self.digits = digits
+
+    def __repr__(self) -> str:
+        fields = ", ".join(f"{name}={getattr(self, name)}" for name in self.__slots__)
+        return f"TextStats({fields})"
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, TextStats):
+            return NotImplemented
+        return all(getattr(self, name) == getattr(other, name) for name in self.__slots__)
+
+    def to_dict(self) -> Dict[str, int]:
+        return {name: getattr(self, name) for name in self.__slots__}
+
+
+def analyze_text(text: str) -> TextStats:
+    """
+    تعداد کلمات، جملات، پاراگراف‌ها و کاراکترهای متن را در یک گذر (بدون ساختن لیست‌های میانی) محاسبه می‌کند.
+    توکن‌ها همان توکن‌های farsinum.tokenizer.iter_tokens هستند.
+
+    Args:
+        text: متن ورودی.
+
+    Returns:
+        یک شیء TextStats.
+
+    Example:
+        >>> stats = analyze_text("سلام دنیا. Hello ۱۲۳!\\n\\nپاراگراف دوم")
+        >>> stats.words, stats.sentences, stats.paragraphs
+        (6, 3, 2)
+        >>> stats.persian_characters, stats.latin_characters, stats.digits
+        (19, 5, 3)
+    """
     if not isinstance(text, str):
         raise TypeError("ورودی باید از نوع رشته باشد.")
-    if not text.strip():
-        return 0
-        
-    # پاراگراف‌ها با دو یا چند خط جدید از هم جدا می‌شوند
-    paragraphs = re.split(_PARAGRAPH_SEPARATOR, text.strip())
-    # فیلتر کردن پاراگراف‌های خالی که ممکن است در اثر جداکننده‌های متعدد ایجاد شوند
-    count = len([p for p in paragraphs if p.strip()])
-    return count if count > 0 else (1 if text.strip() else 0)
+    return _finalize(_scan_text(text)[0])
+
+
+def _finalize(stats: TextStats) -> TextStats:
+    if stats.paragraphs and not stats.sentences: # متنی فقط از پایانه‌ها، یک جمله حساب می‌شود
+        stats.sentences = 1
+    return stats
+
+
+def _scan_text(text: str) -> Tuple[TextStats, bool, bool, bool]:
+    """
+    یک گذر روی توکن‌های متن. علاوه بر آمار (بدون قاعده «حداقل یک جمله»)، وضعیت مرزهای متن را هم
+    برمی‌گرداند تا آمار تکه‌های پشت سر هم یک متن بزرگ قابل ترکیب باشد (_merge_scans):
+    (آمار، آیا اولین توکن جمله‌ای را شروع کرد، آیا متن وسط یک جمله تمام شد، آیا بعد از آخرین توکن شکست پاراگراف هست)
+    """
+    words = sentences = paragraphs = persian = latin = digits = 0
+    in_sentence = in_paragraph = False
+    starts_sentence = False
+    previous_end = 0
+    has_zwnj = ZWNJ in text
+    for match in TOKEN_PATTERN.finditer(text):
+        kind = match.lastindex
+        start, end = match.span()
+        # بین دو توکن فقط فاصله (و ZWNJ) است؛ شکست پاراگراف فقط وقتی ممکن است که دست کم دو \n باشد
+        if start - previous_end > 1 and in_paragraph and text.count('\n', previous_end, start) > 1 \
+                and _RE_PARAGRAPH_SEPARATOR.search(text, previous_end, start):
+            in_paragraph = False
+        previous_end = end
+        if not in_paragraph:
+            if not paragraphs:
+                starts_sentence = kind != TOKEN_PUNCTUATION or text[start] not in _SENTENCE_TERMINATORS
+            paragraphs += 1
+            in_paragraph = True
+        if kind == TOKEN_PUNCTUATION:
+            if text[start] in _SENTENCE_TERMINATORS:
+                in_sentence = False
+            elif not in_sentence:
+                sentences += 1
+                in_sentence = True
+            continue
+        words += 1
+        if not in_sentence:
+            sentences += 1
+            in_sentence = True
+        if kind == TOKEN_PERSIAN_WORD:
+            persian += end - start - (text.count(ZWNJ, start, end) if has_zwnj else 0)
+        elif kind == TOKEN_LATIN_WORD:
+            latin += end - start
+        elif kind == TOKEN_NUMBER:
+            token = match.group()
+            digits += len(token) if token.isdigit() else sum(1 for character in token if character.isdigit())
+    trailing_break = paragraphs > 0 and _RE_PARAGRAPH_SEPARATOR.search(text, previous_end) is not None
+    stats = TextStats(words, sentences, paragraphs, len(text), persian, latin, digits)
+    return stats, starts_sentence, in_sentence, trailing_break
+
+
+def _merge_scans(scans: Iterable[Tuple[TextStats, bool, bool, bool]]) -> Tuple[TextStats, bool, bool, bool]:
+    """
+    نتایج _scan_text تکه‌های پشت سر هم را ترکیب می‌کند. هر تکه به جز اولی باید دقیقا با یک توکن شروع شود
+    (بدون فاصله در ابتدا) و هیچ توکنی نباید بین دو تکه شکسته شده باشد.
+    """
+    total = TextStats()
+    starts_sentence = ends_in_sentence = trailing_break = False
+    for stats, first_starts_sentence, in_sentence, breaks in scans:
+        if not stats.paragraphs: # تکه بدون توکن (فقط فاصله)
+            total.characters += stats.characters
+            continue
+        if total.paragraphs:
+            # اولین توکن این تکه در تحلیل مستقل، پاراگراف (و شاید جمله) جدیدی شروع کرده است
+            if not trailing_break:
+                stats.paragraphs -= 1
+            if ends_in_sentence and first_starts_sentence:
+                stats.sentences -= 1
+        else:
+            starts_sentence = first_starts_sentence
+        for name in TextStats.__slots__:
+            setattr(total, name, getattr(total, name) + getattr(stats, name))
+        ends_in_sentence = in_sentence
+        trailing_break = breaks
+    return total, starts_sentence, ends_in_sentence, trailing_break
+
+
+def _safe_cut(buffer: mmap.mmap, position: int, limit: int) -> int:
+    """اولین مرز امن در بازه [position, limit) یا limit اگر مرزی نباشد."""
+    if position >= limit:
+        return limit
+    match = _RE_SAFE_CUT.search(buffer, position - 1, limit)
+    return limit if match is None else match.end()
+
+
+def _token_cut(buffer: mmap.mmap, position: int, limit: int, end: int) -> int:
+    """
+    مرز پنجره برای متنی که در [position, limit) هیچ فاصله‌ای ندارد (مثلا دنباله‌ای طولانی بدون فاصله):
+    شروع آخرین توکنی که دست کم دو کاراکتر بعد از آن در پنجره هست. تصمیم پایان توکن قبلی حداکثر به
+    همین دو کاراکتر (مثلا جداکننده و رقم بعدی در ۲.۵) بستگی دارد، پس این نقطه در کل متن هم مرز توکن است.
+    اگر یک توکن از کل پنجره بلندتر باشد، پنجره بزرگ‌تر می‌شود.
+    """
+    while True:
+        boundary = limit
+        while boundary > position and boundary < end and buffer[boundary] & 0xC0 == 0x80: # وسط یک کاراکتر
+            boundary -= 1
+        text = buffer[position:boundary].decode('utf-8')
+        last_start = 0
+        latest = len(text) - 3
+        for match in TOKEN_PATTERN.finditer(text):
+            if match.start() > latest:
+                break
+            last_start = match.start()
+        if last_start:
+            return position + len(text[:last_start].encode('utf-8'))
+        if limit >= end:
+            return end
+        limit = min(end, position + 2 * (limit - position))
+
+
+def _window_end(buffer: mmap.mmap, position: int, window_size: int, end: int) -> int:
+    """انتهای پنجره‌ای که از position شروع می‌شود؛ طول پنجره (به جز توکن‌های بلندتر از آن) حداکثر ۲ * window_size است."""
+    target = position + window_size
+    if target >= end:
+        return end
+    limit = min(end, target + window_size)
+    cut = _safe_cut(buffer, target, limit)
+    return cut if cut < limit else _token_cut(buffer, position, limit, end)
+
+
+def _count_file_range(path: str, start: int, end: int, window_size: int) -> Tuple[TextStats, bool, bool, bool]:
+    """بازه بایتی [start, end) فایل را پنجره به پنجره شمارش می‌کند (در پردازه کارگر هم اجرا می‌شود)."""
+    with open(path, 'rb') as file, mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as buffer:
+
+        def scans():
+            position = start
+            while position < end:
+                cut = _window_end(buffer, position, window_size, end)
+                yield _scan_text(buffer[position:cut].decode('utf-8'))
+                position = cut
+
+        return _merge_scans(scans())
+
+
+def count_file(path: str, workers: Optional[int] = None, window_size: int = DEFAULT_FILE_WINDOW_SIZE) -> TextStats:
+    """
+    آمار یک فایل متنی UTF-8 (حتی بزرگ‌تر از حافظه) را با mmap و بدون بارگذاری کل فایل محاسبه می‌کند.
+
+    فایل در پنجره‌های حدودا window_size بایتی (حداکثر ۲ * window_size، با هر خط و زبانی) رمزگشایی می‌شود
+    که فقط در مرزهای امن (قبل از شروع یک توکن) بریده می‌شوند، و وضعیت جمله و پاراگراف بین پنجره‌ها منتقل
+    می‌شود؛ پس نتیجه دقیقا برابر analyze_text روی کل محتوای فایل است. تنها توکنی که خودش از پنجره بلندتر
+    باشد (مثلا دنباله‌ای چند مگابایتی بدون فاصله از یک خط) یکجا رمزگشایی می‌شود.
+
+    Args:
+        path: مسیر فایل.
+        workers: تعداد پردازه‌ها؛ اگر بیشتر از ۱ باشد فایل در مرزهای امن بین پردازه‌ها تقسیم می‌شود.
+        window_size: اندازه تقریبی هر پنجره به بایت.
+
+    Returns:
+        یک شیء TextStats (مثل analyze_text).
+
+    Example:
+        >>> stats = count_file("corpus.txt", workers=4)  # doctest: +SKIP
+        >>> stats.words, stats.sentences, stats.paragraphs  # doctest: +SKIP
+        (120534, 8211, 1042)
+    """
+    if window_size <= 0:
+        raise ValueError("window_size باید عددی مثبت باشد.")
+    size = os.path.getsize(path)
+    if size == 0: # mmap فایل خالی ممکن نیست
+        return TextStats()
+    with open(path, 'rb') as file, mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as buffer:
+        start = len(_UTF8_BOM) if buffer[:len(_UTF8_BOM)] == _UTF8_BOM else 0
+        if not workers or workers <= 1:
+            return _finalize(_count_file_range(path, start, size, window_size)[0])
+        bounds = [start]
+        for index in range(1, workers):
+            bounds.append(_safe_cut(buffer, max(start + (size - start) * index // workers, bounds[-1] + 1), size))
+        bounds.append(size)
+    ranges = [(low, high) for low, high in zip(bounds, bounds[1:]) if low < high]
+    with ProcessPoolExecutor(max_workers=min(workers, len(ranges))) as executor:
+        scans = executor.map(
+            _count_file_range, itertools.repeat(path), [low for low, _ in ranges], [high for _, high in ranges],
+            itertools.repeat(window_size)
+        )
+        return _finalize(_merge_scans(scans)[0])
@@ -1,7 +1,16 @@
 # farsinum/text_normalizer.py
 
+import itertools
+import pkgutil
 import re
+import sys
+import threading
 import unicodedata
+from array import array
+from collections import OrderedDict
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Pattern, TextIO, Tuple, Union
+
+from ._batching import map_in_batches
 
 # نگاشت برای کاراکترهای رایج عربی/فارسی
 _CHARACTER_MAP = {
@@ -33,16 +42,55 @@ _CHARACTER_TRANSLATOR = str.maketrans(_CHARACTER_MAP)
 # کاراکتر نیم‌فاصله
 ZWNJ = '\u200c'
 
+# الگوی یافتن کاراکترهایی که نگاشت آن‌ها تغییری ایجاد می‌کند (برای رد کردن ترجمه روی متن تمیز)
+_RE_MAPPED_CHARACTERS = re.compile(
+    '[' + ''.join(re.escape(key) for key, value in _CHARACTER_MAP.items() if key != value) + ']'
+)
+# unicodedata.is_normalized از پایتون ۳.۸ در دسترس است
+_unicodedata_is_normalized = getattr(unicodedata, 'is_normalized', None)
+
+
+def _is_nfkc(text: str) -> bool:
+    """بررسی سریع اینکه NFKC متن را تغییر نمی‌دهد (بدون ساختن رشته جدید در پایتون ۳.۸ به بعد)."""
+    if text.isascii():
+        return True
+    if _unicodedata_is_normalized is not None:
+        return _unicodedata_is_normalized('NFKC', text)
+    return unicodedata.normalize('NFKC', text) == text
+
+
+def needs_normalization(text: str) -> bool:
+    """
+    پیش‌بررسی ارزان: آیا normalize_characters این متن را تغییر می‌دهد؟
+    یعنی متن کاراکتر عربی/رقم عربی نگاشت‌شده یا کاراکتر سازگاری (مانند اشکال نمایشی عربی
+    U+FB50 تا U+FEFF) دارد. برای رد کردن کامل اسنادی که از قبل نرمال هستند مناسب است.
+
+    Example:
+        >>> needs_normalization("کتاب فارسی")
+        False
+        >>> needs_normalization("كتاب")
+        True
+        >>> needs_normalization("\ufedb\ufe98\ufe8e\ufe8f")  # ﻛﺘﺎﺏ
+        True
+    """
+    if not isinstance(text, str):
+        raise TypeError("ورودی باید از نوع رشته باشد.")
+    return _RE_MAPPED_CHARACTERS.search(text) is not None or not _is_nfkc(text)
+
+
 def normalize_characters(text: str) -> str:
     """
     نرمال‌سازی کاراکترهای عربی رایج به معادل فارسی آن‌ها.
     همچنین ارقام عربی شرقی را به فارسی تبدیل می‌کند.
+    ترجمه و NFKC فقط وقتی اجرا می‌شوند که متن واقعا به آن‌ها نیاز داشته باشد.
     """
-    text = text.translate(_CHARACTER_TRANSLATOR)
+    if _RE_MAPPED_CHARACTERS.search(text) is not None:
+        text = text.translate(_CHARACTER_TRANSLATOR)
     # استفاده از NFKC برای یکسان‌سازی بیشتر کاراکترهای ترکیبی و سازگار با کامپوزرها
     # این ممکن است برخی کاراکترهای فارسی خاص مانند تشدید را تغییر دهد، باید با دقت استفاده شود.
     # فعلا برای یکسان‌سازی کلی کاراکترها مناسب است.
-    text = unicodedata.normalize('NFKC', text)
+    if not _is_nfkc(text):
+        text = unicodedata.normalize('NFKC', text)
     return text
 
 def cleanup_spacing(text: str) -> str:
@@ -110,40 +158,760 @@ def standardize_ellipsis(text: str) -> str:
     """تبدیل سه نقطه یا بیشتر (...) به کاراکتر استاندارد سه نقطه (…)."""
     return re.sub(r'\.{3,}', '…', text)
 
+# --- نیم‌فاصله پیشوندها و پسوندها ---
+# پیشوند «می/نمی» فقط وقتی چسبانده می‌شود که کلمه بعدی یک فعل باشد: ریشه‌ای از واژگان ریشه‌های فعل
+# (data/verb_stems_fa.txt) به همراه یکی از شناسه‌ها. ریشه‌ها در یک trie نگه داشته می‌شوند که یک بار
+# در هر پردازه و در اولین استفاده ساخته می‌شود.
+_VERB_ENDINGS = frozenset(('', 'م', 'ی', 'د', 'یم', 'ید', 'ند'))
+_TRIE_TERMINAL = ''  # کلید پایان ریشه در گره‌های trie (هیچ حرفی رشته خالی نیست)
+_verb_stem_trie: Optional[Dict[str, dict]] = None
+
+# جداکننده پیشوند/پسوند: اجرایی از فاصله‌های افقی یا زیرخط (هرگز از روی \n عبور نمی‌کند).
+# شاخه اول پیشوند می/نمی و شاخه دوم پسوندهای ها/تر/ترین را پیدا می‌کند؛ هر دو در یک گذر روی متن.
+_RE_AFFIX_SEPARATOR = r'(?:[^\S\n]|_)+'
+_RE_SUFFIX_AFFIX = re.compile(r'(?:ها|ترین|تر)(?!\w)')
+_RE_ZWNJ_AFFIX_JUNCTION = re.compile(
+    rf'(?<![\w{ZWNJ}])(ن?می){_RE_AFFIX_SEPARATOR}(?=\w)'
+    rf'|(?<=[^\s_]){_RE_AFFIX_SEPARATOR}(?={_RE_SUFFIX_AFFIX.pattern})'
+)
+
+
+def _load_verb_stem_trie() -> Dict[str, dict]:
+    """واژگان ریشه‌های فعل را (فقط بار اول) خوانده و به صورت trie برمی‌گرداند."""
+    global _verb_stem_trie
+    if _verb_stem_trie is None:
+        data = pkgutil.get_data('farsinum', 'data/verb_stems_fa.txt')
+        if data is None:
+            raise FileNotFoundError("فایل واژگان ریشه‌های فعل یافت نشد.")
+        trie: Dict[str, dict] = {}
+        for line in data.decode('utf-8').splitlines():
+            stem = line.strip()
+            if stem:
+                node = trie
+                for character in stem:
+                    node = node.setdefault(character, {})
+                node[_TRIE_TERMINAL] = {}
+        _verb_stem_trie = trie
+    return _verb_stem_trie
+
+
+def _is_verb_at(text: str, position: int) -> bool:
+    """
+    بررسی می‌کند که کلمه شروع‌شده از position یک ریشه فعل (از trie) به همراه یکی از شناسه‌ها باشد.
+    """
+    end = position
+    length = len(text)
+    while end < length and text[end].isalpha():
+        end += 1
+    node = _load_verb_stem_trie()
+    for index in range(position, end):
+        node = node.get(text[index])  # type: ignore[assignment]
+        if node is None:
+            return False
+        if _TRIE_TERMINAL in node and text[index + 1:end] in _VERB_ENDINGS:
+            return True
+    return False
+
+
+def _zwnj_affix_replacement(match) -> str:
+    prefix = match.group(1)
+    if prefix is None:
+        return ZWNJ
+    if _is_verb_at(match.string, match.end()) or _RE_SUFFIX_AFFIX.match(match.string, match.end()):
+        return prefix + ZWNJ
+    return match.group()
+
+
 def add_zwnj_to_common_suffixes(text: str) -> str:
     """
-    اضافه کردن نیم‌فاصله (ZWNJ) به پسوندهای رایج مانند "ها"، "تر"، "ترین".
-    مثال: "کتاب ها" -> "کتاب‌ها", "خوب تر" -> "خوب‌تر"
-    """
-    # پسوند "ها"
-    text = re.sub(r'(\S+)[\s_]ها(\s|\b|$)', rf'\1{ZWNJ}ها\2', text) # \S+ برای کلمات غیرفاصله
-    # پسوندهای "تر" و "ترین"
-    text = re.sub(r'(\S+)[\s_](تر|ترین)(\s|\b|$)', rf'\1{ZWNJ}\2\3', text)
-    # پیشوندهای "می" و "نمی" (ساده شده)
-    # این بخش بسیار پیچیده است و نیاز به لیست افعال و بررسی دقیق دارد.
-    # فعلا یک تلاش ساده برای "می " و "نمی " که بعدشان فعل می‌آید.
-    # مثال: "می رود" -> "می‌رود"
-    # این regex ممکن است false positive زیادی داشته باشد.
-    # text = re.sub(r'\b(می|نمی)[\s_]+(?!و|که|یا|اما|اگر|چون|تا|نه|بلکه)([آابپتثجچحخدذرزژسشصضطظعغفقکگلمنوهی]+)\b', rf'\1{ZWNJ}\2', text)
-    # برای پیشوندهای می/نمی، بهتر است از یک لیست افعال استفاده شود یا فعلا صرف نظر شود.
-    return text
+    اضافه کردن نیم‌فاصله (ZWNJ) به پسوندهای رایج مانند "ها"، "تر"، "ترین" و به پیشوند فعلی "می"/"نمی".
+    همه پیشوندها و پسوندها در یک گذر روی متن بررسی می‌شوند.
+    مثال: "کتاب ها" -> "کتاب‌ها", "خوب تر" -> "خوب‌تر", "نمی رود" -> "نمی‌رود"
+    """
+    return _RE_ZWNJ_AFFIX_JUNCTION.sub(_zwnj_affix_replacement, text)
+
+# --- موتور نرمال‌سازی ترکیبی ---
+# مراحل persian_text_normalizer در این موتور با کمترین تعداد گذر روی متن اجرا می‌شوند.
+# خروجی نمونه پیش‌فرض باید دقیقا (بایت به بایت) با اجرای پشت سر هم توابع بالا یکسان باشد؛
+# بنابراین الگوهای زیر رفتار فعلی cleanup_spacing را (حتی فاصله موجود در کلاس علائم نگارشی)
+# عینا بازتولید می‌کنند.
+
+# کلاس علائم نگارشی cleanup_spacing (شامل فاصله و حروف maxit، مطابق رفتار فعلی)
+_SPACING_PUNCTUATION = '؟!?٪ maxit؛،.:'
+
+# الگوها طوری نوشته شده‌اند که با یک کلاس کاراکتر یا حرف ثابت شروع شوند (جستجوی سریع پیشوند در موتور re)
+# و تا جای ممکن جایگزین ثابت داشته باشند.
+_RE_TABS_AND_SPACE_RUNS = re.compile(r'[ \t](?:[ \t]+|(?<=\t))')
+_RE_SPACE_BEFORE_PUNCTUATION = re.compile(rf'\s\s*(?=[{_SPACING_PUNCTUATION}])')
+# کاراکتری که بعد از یک علامت نگارشی (از جمله فاصله) درج فاصله را لازم می‌کند
+_SPACE_TRIGGER = rf'[^\s\d{_SPACING_PUNCTUATION}]'
+_RE_SPACE_AFTER_SPACE = re.compile(rf' (?={_SPACE_TRIGGER})')
+_RE_SPACE_AFTER_PUNCTUATION = re.compile(rf'[{_SPACING_PUNCTUATION.replace(" ", "")}](?={_SPACE_TRIGGER})')
+_RE_BLANK_LINES = re.compile(r'\n\s*\n')
+# «فاصله‌های اطراف ZWNJ» و «ZWNJ های متوالی» در یک گذر؛ ZWNJ تنها دست نمی‌خورد.
+_RE_ZWNJ_RUNS = re.compile(rf'[\s{ZWNJ}](?:(?<={ZWNJ})[\s{ZWNJ}]+|[\s{ZWNJ}]*{ZWNJ}[\s{ZWNJ}]*)')
+# گذرهای پاک‌سازی نهایی: اجرای فاصله‌ای که بعدش حرف می‌آید دقیقا دو فاصله و بقیه یک فاصله می‌شوند
+# (همان اثر ترکیب «یکسان‌سازی فاصله‌ها» و «درج فاصله بعد از علائم» در cleanup_spacing).
+_RE_FINAL_DOUBLE_SPACES = re.compile(rf' (?<!  )(?: {{2,}})?(?={_SPACE_TRIGGER})')
+_RE_FINAL_SINGLE_SPACES = re.compile(rf'  +(?!{_SPACE_TRIGGER})')
+
+_RE_ELLIPSIS = re.compile(r'\.{3,}')
+
+# مرزهای امن برای نرمال‌سازی جریانی: یک اجرای خالص از \n بین دو کاراکتر غیر فاصله (و غیر ZWNJ).
+# کاراکتر بعد از مرز نباید جزو علائم cleanup_spacing باشد (فاصله قبلش حذف می‌شد). نیم‌فاصله پیشوندها و
+# پسوندها هرگز از روی \n عبور نمی‌کند، پس یک \n تنها هم مرز امن خطوط است.
+_RE_SAFE_PARAGRAPH_BREAK = re.compile(rf'(?<=[^\s{ZWNJ}])\n{{2,}}(?=[^\s{ZWNJ}{_SPACING_PUNCTUATION}])')
+_RE_SAFE_LINE_BREAK = re.compile(
+    rf'(?<=[^\s{ZWNJ}])\n+(?=[^\s{ZWNJ}{_SPACING_PUNCTUATION}])'
+)
+_STREAM_BOUNDARIES = {"paragraph": _RE_SAFE_PARAGRAPH_BREAK, "line": _RE_SAFE_LINE_BREAK}
+DEFAULT_STREAM_BUFFER_SIZE = 1 << 16
+
+# نرمال‌سازی دسته‌ای: زیر این تعداد متن، هزینه راه‌اندازی پردازه‌ها از خود کار بیشتر است
+DEFAULT_PARALLEL_THRESHOLD = 2000
+DEFAULT_BATCH_CHUNKSIZE = 256
+
+
+# الگوهای کمکی نرمال‌سازی همراه با نگاشت موقعیت‌ها
+_RE_CRLF = re.compile('\r\n')
+_RE_DOUBLE_QUOTE = re.compile('"')
+# NFKC دو تکه متن که دومی با یک کاراکتر ASCII شروع شود مستقل است (ASCII با کاراکتر قبلی ترکیب نمی‌شود)،
+# پس NFKC روی تکه‌هایی به این شکل اجرا می‌شود تا نگاشت موقعیت‌ها محلی بماند.
+_RE_NFKC_SEGMENT = re.compile(r'[\x00-\x7f]?[^\x00-\x7f]+')
+
+
+def _append_space(match) -> str:
+    return match.group() + ' '
+
+
+class _AlignedText:
+    """
+    متن به همراه نگاشت موقعیت هر کاراکتر آن به موقعیت متناظر در متن اصلی.
+    offsets یک array('i') با طول len(text) + 1 است؛ عضو آخر موقعیت پایان متن را نگه می‌دارد.
+    """
+
+    __slots__ = ('text', 'offsets')
+
+    def __init__(self, text: str):
+        self.text = text
+        self.offsets = array('i', range(len(text) + 1))
+
+    def sub(self, pattern: Pattern, repl: Union[str, Callable], count: int = 0) -> None:
+        """
+        معادل pattern.sub(repl, text, count) که نگاشت موقعیت‌ها را هم به‌روز می‌کند.
+        repl یا رشته‌ای بدون ارجاع به گروه‌ها است یا تابعی که Match را می‌گیرد.
+        """
+        edits = []
+        for number, match in enumerate(pattern.finditer(self.text), 1):
+            edits.append((match.start(), match.end(), repl(match) if callable(repl) else repl))
+            if number == count:
+                break
+        self._apply(edits)
+
+    def nfkc(self) -> None:
+        """
+        NFKC را اعمال می‌کند. هر تکه غیر ASCII جداگانه و در صورت امکان هر کاراکتر پایه همراه با
+        نشانه‌های ترکیبی بعدش جداگانه نرمال می‌شود تا نگاشت موقعیت‌ها تا حد ممکن دقیق بماند.
+        """
+        combining = unicodedata.combining
+        normalize = unicodedata.normalize
+        edits = []
+        for match in _RE_NFKC_SEGMENT.finditer(self.text):
+            segment = match.group()
+            if _is_nfkc(segment):
+                continue
+            start = match.start()
+            normalized = normalize('NFKC', segment)
+            clusters = []
+            cluster_start = 0
+            for index in range(1, len(segment) + 1):
+                if index == len(segment) or not combining(segment[index]):
+                    cluster = segment[cluster_start:index]
+                    clusters.append((start + cluster_start, start + index, normalize('NFKC', cluster)))
+                    cluster_start = index
+            if ''.join(cluster[2] for cluster in clusters) == normalized:
+                edits.extend(cluster for cluster in clusters if segment[cluster[0] - start:cluster[1] - start] != cluster[2])
+            else:
+                edits.append((start, match.end(), normalized))
+        self._apply(edits)
+
+    def _apply(self, edits: List[Tuple[int, int, str]]) -> None:
+        """
+        ویرایش‌های مرتب (start, end, replacement) را اعمال می‌کند. پیشوند و پسوند مشترک بخش
+        جایگزین‌شده و جایگزین آن یک‌به‌یک نگاشت می‌شوند و کاراکترهای درج‌شده به اولین
+        کاراکتر تغییر یافته نسبت داده می‌شوند.
+        """
+        if not edits:
+            return
+        text, offsets = self.text, self.offsets
+        parts: List[str] = []
+        new_offsets = array('i')
+        previous = 0
+        for start, end, replacement in edits:
+            parts.append(text[previous:start])
+            new_offsets.extend(offsets[previous:start])
+
+            old = text[start:end]
+            limit = min(len(old), len(replacement))
+            prefix = 0
+            while prefix < limit and old[prefix] == replacement[prefix]:
+                prefix += 1
+            suffix = 0
+            while suffix < limit - prefix and old[-1 - suffix] == replacement[-1 - suffix]:
+                suffix += 1
+            new_offsets.extend(offsets[start:start + prefix])
+            new_offsets.extend(array('i', (offsets[start + prefix],)) * (len(replacement) - prefix - suffix))
+            new_offsets.extend(offsets[end - suffix:end])
+
+            parts.append(replacement)
+            previous = end
+        parts.append(text[previous:])
+        new_offsets.extend(offsets[previous:])
+        self.text = ''.join(parts)
+        self.offsets = new_offsets
+
+    def strip(self) -> None:
+        text = self.text
+        stripped = text.lstrip()
+        start = len(text) - len(stripped)
+        stripped = stripped.rstrip()
+        end = start + len(stripped)
+        if start or end != len(text):
+            self.text = stripped
+            self.offsets = self.offsets[start:end + 1]
+
+
+# کش نتایج نرمال‌سازی (اختیاری): برای متن‌های کوتاه و پرتکرار مثل عنوان محصولات و دسته‌بندی‌ها
+DEFAULT_CACHE_MAX_BYTES = 32 << 20
+DEFAULT_CACHE_MAX_LENGTH = 1024
+
+
+class NormalizationCache:
+    """
+    کش LRU نتایج نرمال‌سازی که با مجموع حجم (بایت) ورودی‌ها و خروجی‌ها محدود می‌شود، نه تعداد آن‌ها.
+
+    همه عملیات thread-safe هستند. متن‌های بلندتر از max_length کش نمی‌شوند.
+    شمارنده‌های hits، misses و evictions عملکرد کش را نشان می‌دهند.
+
+    Args:
+        max_bytes: حداکثر حجم کل کش (بر اساس sys.getsizeof ورودی و خروجی هر مورد).
+        max_length: حداکثر طول متنی که کش می‌شود.
+        enabled: اگر False باشد، نرمال‌ساز فقط با use_cache=True از کش استفاده می‌کند.
+
+    Example:
+        >>> normalizer = Normalizer(cache=NormalizationCache(max_bytes=1 << 20))
+        >>> normalizer("كتاب_ها") == normalizer("كتاب_ها")
+        True
+        >>> normalizer.cache.stats()["hits"]
+        1
+    """
+
+    def __init__(
+        self,
+        max_bytes: int = DEFAULT_CACHE_MAX_BYTES,
+        max_length: int = DEFAULT_CACHE_MAX_LENGTH,
+        enabled: bool = True
+    ):
+        self._entries: "OrderedDict[str, str]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.current_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.enabled = enabled
+        self.max_length = max_length
+        self.max_bytes = max_bytes
+        self.configure(max_bytes=max_bytes, max_length=max_length)
+
+    def configure(self, max_bytes: Optional[int] = None, max_length: Optional[int] = None) -> None:
+        """محدودیت‌های کش را تغییر می‌دهد؛ در صورت کوچک شدن max_bytes قدیمی‌ترین موارد حذف می‌شوند."""
+        if max_bytes is not None and max_bytes <= 0:
+            raise ValueError("max_bytes باید عددی مثبت باشد.")
+        if max_length is not None and max_length < 0:
+            raise ValueError("max_length نمی‌تواند منفی باشد.")
+        with self._lock:
+            if max_length is not None:
+                self.max_length = max_length
+            if max_bytes is not None:
+                self.max_bytes = max_bytes
+                self._evict(0)
+
+    def get(self, text: str) -> Optional[str]:
+        """نتیجه کش‌شده متن را برمی‌گرداند (یا None) و آن را جدیدترین مورد می‌کند."""
+        with self._lock:
+            result = self._entries.get(text)
+            if result is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+                self._entries.move_to_end(text)
+            return result
+
+    def put(self, text: str, result: str) -> None:
+        """نتیجه را ذخیره می‌کند؛ مواردی که به تنهایی از max_bytes بزرگ‌ترند ذخیره نمی‌شوند."""
+        size = sys.getsizeof(text) + sys.getsizeof(result)
+        with self._lock:
+            if size > self.max_bytes or text in self._entries:
+                return
+            self._evict(size)
+            self._entries[text] = result
+            self.current_bytes += size
+
+    def _evict(self, incoming: int) -> None:
+        """قدیمی‌ترین موارد را تا جا شدن incoming بایت حذف می‌کند (قفل باید گرفته شده باشد)."""
+        entries = self._entries
+        while entries and self.current_bytes + incoming > self.max_bytes:
+            text, result = entries.popitem(last=False)
+            self.current_bytes -= sys.getsizeof(text) + sys.getsizeof(result)
+            self.evictions += 1
+
+    def clear(self) -> None:
+        """همه موارد و شمارنده‌ها را پاک می‌کند."""
+        with self._lock:
+            self._entries.clear()
+            self.current_bytes = 0
+            self.hits = self.misses = self.evictions = 0
+
+    def stats(self) -> Dict[str, int]:
+        """شمارنده‌ها و وضعیت فعلی کش."""
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "entries": len(self._entries),
+                "bytes": self.current_bytes,
+                "max_bytes": self.max_bytes,
+            }
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __getstate__(self) -> Dict[str, object]:
+        # قفل قابل pickle نیست؛ در پردازه‌های کارگر normalize_many یک کش خالی با همان تنظیمات ساخته می‌شود.
+        return {"max_bytes": self.max_bytes, "max_length": self.max_length, "enabled": self.enabled}
+
+    def __setstate__(self, state: Dict[str, object]) -> None:
+        self.__init__(**state)  # type: ignore[misc]
+
+
+class Normalizer:
+    """
+    نرمال‌ساز کامپایل‌شده متن فارسی.
+
+    تمام جداول و الگوهای لازم یک بار در زمان ساخت آماده می‌شوند و مراحل
+    persian_text_normalizer در کمترین تعداد گذر روی متن اجرا می‌شوند:
+    یک جدول ترجمه مشترک (کاراکترها و خطوط جدید)، یک NFKC، یک پاک‌سازی فاصله‌ها،
+    گیومه و سه نقطه، نیم‌فاصله پسوندها و یک گذر کوتاه نهایی به جای cleanup_spacing دوم.
+
+    Args:
+        character_map: نگاشت کاراکترهای اضافه که با _CHARACTER_MAP ادغام می‌شود.
+        quotes: تبدیل گیومه‌های انگلیسی به فارسی.
+        ellipsis: تبدیل سه نقطه به کاراکتر استاندارد.
+        zwnj_suffixes: افزودن نیم‌فاصله به پسوندهای رایج و پیشوند فعلی می/نمی.
+        cache: کش اختیاری نتایج normalize (NormalizationCache).
+
+    Example:
+        >>> normalizer = Normalizer()
+        >>> normalizer("كتاب_ها")
+        'کتاب\u200cها'
+    """
+
+    def __init__(
+        self,
+        character_map: Optional[Dict[str, str]] = None,
+        quotes: bool = True,
+        ellipsis: bool = True,
+        zwnj_suffixes: bool = True,
+        cache: Optional[NormalizationCache] = None
+    ):
+        table = dict(_CHARACTER_MAP)
+        if character_map:
+            table.update(character_map)
+        # \r\n قبل از ترجمه با replace یکی می‌شود؛ \r های تنها در همین جدول به \n تبدیل می‌شوند.
+        table.setdefault('\r', '\n')
+        self.character_map = table
+        self._translator = str.maketrans(table)
+        # str.translate روی متن غیر ASCII کاراکتر به کاراکتر کار می‌کند؛ چند replace پشت سر هم
+        # (جستجوی سریع C) بسیار سریع‌تر است، به شرطی که خروجی یک نگاشت کلید نگاشت دیگری نباشد.
+        replacements = [(key, value) for key, value in table.items() if key != value]
+        chained = any(key in value for _, value in replacements for key, _ in replacements)
+        self._replacements = None if chained else replacements
+        # یک جستجوی واحد برای رد کردن کل مرحله نگاشت روی متن تمیز
+        mapped = {key for key, _ in replacements} | {'\r'}
+        self._mapped_characters = re.compile('[' + ''.join(re.escape(key) for key in mapped) + ']')
+        self.quotes = quotes
+        self.ellipsis = ellipsis
+        self.zwnj_suffixes = zwnj_suffixes
+        self.cache = cache
+
+    def __call__(self, text: str) -> str:
+        return self.normalize(text)
+
+    def normalize(self, text: str, use_cache: Optional[bool] = None) -> str:
+        """
+        متن ورودی را نرمال‌سازی می‌کند (معادل persian_text_normalizer).
+
+        Args:
+            text: متن ورودی.
+            use_cache: استفاده از کش برای همین فراخوانی؛ None یعنی تنظیم enabled خود کش.
+        """
+        if not isinstance(text, str):
+            raise TypeError("ورودی باید از نوع رشته باشد.")
+        cache = self.cache
+        if cache is not None and (cache.enabled if use_cache is None else use_cache) \
+                and len(text) <= cache.max_length:
+            result = cache.get(text)
+            if result is None:
+                result, _ = self._normalize_prepared(self._prepare(text), False)
+                cache.put(text, result)
+            return result
+        text, _ = self._normalize_prepared(self._prepare(text), False)
+        return text
+
+    def _prepare(self, text: str) -> str:
+        """خطوط جدید و نگاشت کاراکترها با یک جدول مشترک، سپس NFKC."""
+        if self._mapped_characters.search(text) is not None:
+            text = text.replace('\r\n', '\n')
+            if self._replacements is None:
+                text = text.translate(self._translator)
+            else:
+                for key, value in self._replacements:
+                    if key in text:
+                        text = text.replace(key, value)
+        if not _is_nfkc(text):
+            text = unicodedata.normalize('NFKC', text)
+        return text
+
+    def needs_normalization(self, text: str) -> bool:
+        """آیا مرحله نگاشت کاراکترها و NFKC این نرمال‌ساز متن را تغییر می‌دهد؟"""
+        if not isinstance(text, str):
+            raise TypeError("ورودی باید از نوع رشته باشد.")
+        return self._mapped_characters.search(text) is not None or not _is_nfkc(text)
+
+    def _normalize_prepared(self, text: str, quote_seen: bool) -> Tuple[str, bool]:
+        """
+        مراحل پس از نگاشت کاراکترها را روی متن آماده‌شده اجرا می‌کند.
+        quote_seen مشخص می‌کند که آیا اولین گیومه متن (که به « تبدیل می‌شود) قبلا دیده شده است؛
+        مقدار جدید آن همراه متن برگردانده می‌شود تا نرمال‌سازی جریانی بتواند آن را ادامه دهد.
+        """
+        # پاک‌سازی فاصله‌ها (cleanup_spacing). حذف فضای خطوط خالی (^\s+$) زیرمجموعه
+        # جمع کردن خطوط خالی است و گذر جداگانه لازم ندارد.
+        text = text.strip()
+        text = _RE_TABS_AND_SPACE_RUNS.sub(' ', text)
+        text = _RE_SPACE_BEFORE_PUNCTUATION.sub('', text)
+        text = _RE_SPACE_AFTER_SPACE.sub('  ', text)
+        text = _RE_SPACE_AFTER_PUNCTUATION.sub(r'\g<0> ', text)
+        text = _RE_BLANK_LINES.sub('\n\n', text)
+        text = _RE_ZWNJ_RUNS.sub(ZWNJ, text)
+
+        if self.quotes and '"' in text:
+            # اولین " به « و بقیه به » (مطابق standardize_quotes)
+            if not quote_seen:
+                index = text.index('"')
+                text = text[:index] + '«' + text[index + 1:].replace('"', '»')
+                quote_seen = True
+            else:
+                text = text.replace('"', '»')
+        if self.ellipsis and '...' in text:
+            text = _RE_ELLIPSIS.sub('…', text)
+        if self.zwnj_suffixes and ('ها' in text or 'تر' in text or 'می' in text):
+            text = _RE_ZWNJ_AFFIX_JUNCTION.sub(_zwnj_affix_replacement, text)
+
+        # پاک‌سازی نهایی. متن یک بار پاک‌سازی شده است، پس از cleanup_spacing دوم فقط
+        # یکسان‌سازی فاصله‌ها، درج فاصله بعد از علائم و جمع کردن ZWNJ ها اثر دارد.
+        text = _RE_FINAL_DOUBLE_SPACES.sub('  ', text)
+        text = _RE_FINAL_SINGLE_SPACES.sub(' ', text)
+        text = _RE_SPACE_AFTER_PUNCTUATION.sub(r'\g<0> ', text)
+        text = _RE_ZWNJ_RUNS.sub(ZWNJ, text)
+        return text, quote_seen
+
+    def normalize_with_alignment(self, text: str) -> Tuple[str, array]:
+        """
+        متن را نرمال‌سازی کرده و نگاشت موقعیت‌های متن خروجی به متن اصلی را هم برمی‌گرداند.
+
+        همان مراحل normalize اجرا می‌شوند، اما هر مرحله نگاشت را به‌روز می‌کند.
+
+        Returns:
+            تاپل (متن نرمال‌شده، offsets). offsets یک array('i') با طول len(normalized) + 1 است؛
+            کاراکتر i متن نرمال‌شده از offsets[i] متن اصلی آمده است و بازه [start, end) متن
+            نرمال‌شده متناظر با text[offsets[start]:offsets[end]] در متن اصلی است.
+
+        Example:
+            >>> normalized, offsets = Normalizer().normalize_with_alignment("ء كتاب_ها")
+            >>> normalized
+            'کتاب\u200cها'
+            >>> list(offsets)
+            [2, 3, 4, 5, 6, 7, 8, 9]
+        """
+        if not isinstance(text, str):
+            raise TypeError("ورودی باید از نوع رشته باشد.")
+        aligned = _AlignedText(text)
+        sub = aligned.sub
+
+        if self._mapped_characters.search(text) is not None:
+            sub(_RE_CRLF, '\n')
+            character_map = self.character_map
+            sub(self._mapped_characters, lambda match: character_map[match.group()])
+        if not _is_nfkc(aligned.text):
+            aligned.nfkc()
+
+        aligned.strip()
+        sub(_RE_TABS_AND_SPACE_RUNS, ' ')
+        sub(_RE_SPACE_BEFORE_PUNCTUATION, '')
+        sub(_RE_SPACE_AFTER_SPACE, '  ')
+        sub(_RE_SPACE_AFTER_PUNCTUATION, _append_space)
+        sub(_RE_BLANK_LINES, '\n\n')
+        sub(_RE_ZWNJ_RUNS, ZWNJ)
+
+        if self.quotes:
+            sub(_RE_DOUBLE_QUOTE, '«', count=1)
+            sub(_RE_DOUBLE_QUOTE, '»')
+        if self.ellipsis:
+            sub(_RE_ELLIPSIS, '…')
+        if self.zwnj_suffixes:
+            sub(_RE_ZWNJ_AFFIX_JUNCTION, _zwnj_affix_replacement)
+
+        sub(_RE_FINAL_DOUBLE_SPACES, '  ')
+        sub(_RE_FINAL_SINGLE_SPACES, ' ')
+        sub(_RE_SPACE_AFTER_PUNCTUATION, _append_space)
+        sub(_RE_ZWNJ_RUNS, ZWNJ)
+        return aligned.text, aligned.offsets
+
+    def normalize_stream(
+        self,
+        source: Union[str, TextIO, Iterable[str]],
+        chunk: str = "paragraph",
+        buffer_size: int = DEFAULT_STREAM_BUFFER_SIZE
+    ) -> Iterator[str]:
+        """
+        متن یک جریان (فایل متنی یا هر iterable از رشته‌ها) را به صورت تکه‌تکه نرمال‌سازی می‌کند.
+
+        متن فقط در مرزهای امن (خطوط خالی بین دو پاراگراف، یا در حالت "line" هر خط جدید) برش
+        می‌خورد؛ مرزی امن است که نرمال‌سازی دو طرف آن مستقل باشد، پس حالت گیومه‌ها، خطوط خالی
+        متوالی، ZWNJ ها و سه نقطه‌هایی که بین تکه‌های ورودی شکسته شده‌اند درست ادامه پیدا می‌کنند.
+        هر تکه خروجی جداکننده قبل از خودش را دارد، بنابراین
+        ''.join(normalize_stream(parts)) == persian_text_normalizer(''.join(parts)).
+
+        Args:
+            source: فایل باز شده (خوانده شده در بلوک‌های buffer_size کاراکتری)، یک رشته یا iterable از رشته‌ها.
+            chunk: "paragraph" برای تولید یک تکه به ازای هر پاراگراف یا "line" برای هر خط.
+            buffer_size: اندازه بلوک خواندن از فایل و حداکثر متن نگه‌داشته شده (بر حسب کاراکتر)؛
+                         در حالت "paragraph" اگر پاراگرافی از این اندازه بزرگ‌تر شود، در مرز امن خطوط
+                         برش می‌خورد. یک خط بدون مرز امن همیشه به طور کامل در حافظه نگه‌داشته می‌شود.
+
+        Yields:
+            تکه‌های نرمال‌شده متن.
+        """
+        if chunk not in _STREAM_BOUNDARIES:
+            raise ValueError(f"مقدار chunk باید یکی از {tuple(_STREAM_BOUNDARIES)} باشد.")
+        if buffer_size <= 0:
+            raise ValueError("buffer_size باید عددی مثبت باشد.")
+
+        if isinstance(source, str):
+            pieces: Iterable[str] = (source,)
+        elif hasattr(source, 'read'):
+            pieces = iter(lambda: source.read(buffer_size), '')  # type: ignore[union-attr]
+        else:
+            pieces = source
+        boundary = _STREAM_BOUNDARIES[chunk]
+
+        raw = ''        # ورودی خام پس از آخرین \n (NFKC و \r\n فقط در مرز \n امن هستند)
+        pending = ''    # متن آماده‌شده‌ای که هنوز به مرز امن نرسیده است
+        separator = ''  # جداکننده‌ای که قبل از تکه بعدی می‌آید
+        quote_seen = False
+
+        # None در انتهای ورودی: باقی‌مانده ورودی خام هم آماده و برش داده می‌شود
+        for piece in itertools.chain(pieces, (None,)):
+            if piece is None:
+                pending += self._prepare(raw)
+            else:
+                if not isinstance(piece, str):
+                    raise TypeError("ورودی باید از نوع رشته باشد.")
+                raw += piece
+                cut = raw.rfind('\n') + 1
+                if not cut:
+                    continue
+                pending += self._prepare(raw[:cut])
+                raw = raw[cut:]
+
+            start = 0
+            for match in boundary.finditer(pending):
+                normalized, quote_seen = self._normalize_prepared(pending[start:match.start()], quote_seen)
+                yield separator + normalized
+                separator = '\n\n' if len(match.group()) > 1 else '\n'
+                start = match.end()
+            if chunk == "paragraph" and len(pending) - start > buffer_size:
+                # پاراگراف بیش از حد بزرگ: تا آخرین مرز امن خطوط برش می‌خورد
+                for match in _RE_SAFE_LINE_BREAK.finditer(pending, start):
+                    normalized, quote_seen = self._normalize_prepared(pending[start:match.start()], quote_seen)
+                    yield separator + normalized
+                    separator = '\n\n' if len(match.group()) > 1 else '\n'
+                    start = match.end()
+            pending = pending[start:]
+
+        normalized, _ = self._normalize_prepared(pending, quote_seen)
+        if normalized or separator:
+            yield separator + normalized
 
-def persian_text_normalizer(text: str) -> str:
+    def normalize_many(
+        self,
+        texts: Iterable[str],
+        workers: Optional[int] = None,
+        chunksize: int = DEFAULT_BATCH_CHUNKSIZE,
+        parallel_threshold: int = DEFAULT_PARALLEL_THRESHOLD
+    ) -> List[str]:
+        """
+        تعداد زیادی متن را (در صورت نیاز با چند پردازه) نرمال‌سازی می‌کند و نتایج را به ترتیب ورودی برمی‌گرداند.
+
+        ورودی به صورت تنبل خوانده می‌شود: متن‌ها در دسته‌های chunksize تایی به پردازه‌ها فرستاده
+        می‌شوند و در هر لحظه حداکثر دو دسته برای هر پردازه در جریان است.
+        اگر ورودی کمتر از parallel_threshold متن داشته باشد یا workers برابر ۱ باشد،
+        کار در همین پردازه انجام می‌شود.
+
+        Args:
+            texts: هر iterable از رشته‌ها (لیست، generator، فایل و ...).
+            workers: تعداد پردازه‌ها (پیش‌فرض: تعداد هسته‌های پردازنده).
+            chunksize: تعداد متن در هر دسته ارسالی به یک پردازه.
+            parallel_threshold: حداقل تعداد متن برای استفاده از پردازه‌های جداگانه.
+
+        Returns:
+            لیست متن‌های نرمال‌شده به همان ترتیب ورودی.
+        """
+        normalize = self.normalize
+        return map_in_batches(
+            _normalize_batch, texts, workers, chunksize, parallel_threshold,
+            local_convert_batch=lambda batch: [normalize(text) for text in batch],
+            initializer=_init_batch_worker, initargs=(self,)
+        )
+
+    def normalize_file(
+        self,
+        input_path: str,
+        output_path: str,
+        chunk: str = "paragraph",
+        buffer_size: int = DEFAULT_STREAM_BUFFER_SIZE,
+        encoding: str = "utf-8"
+    ) -> None:
+        """
+        یک فایل متنی را به صورت جریانی نرمال‌سازی کرده و در فایل دیگری می‌نویسد.
+        خطوط جدید خروجی همیشه \n هستند.
+        """
+        with open(input_path, 'r', encoding=encoding, newline='') as source, \
+                open(output_path, 'w', encoding=encoding, newline='') as target:
+            for part in self.normalize_stream(source, chunk=chunk, buffer_size=buffer_size):
+                target.write(part)
+
+
+# نرمال‌ساز هر پردازه کارگر normalize_many (یک بار در initializer تنظیم می‌شود)
+_batch_worker_normalizer: Optional[Normalizer] = None
+
+
+def _init_batch_worker(normalizer: Normalizer) -> None:
+    global _batch_worker_normalizer
+    _batch_worker_normalizer = normalizer
+
+
+def _normalize_batch(batch: List[str]) -> List[str]:
+    normalize = _batch_worker_normalizer.normalize  # type: ignore[union-attr]
+    return [normalize(text) for text in batch]
+
+
+# کش سراسری persian_text_normalizer؛ به صورت پیش‌فرض غیرفعال است (configure_normalization_cache)
+NORMALIZATION_CACHE = NormalizationCache(enabled=False)
+# نمونه پیش‌فرض که persian_text_normalizer از آن استفاده می‌کند
+DEFAULT_NORMALIZER = Normalizer(cache=NORMALIZATION_CACHE)
+
+
+def configure_normalization_cache(
+    enabled: bool = True,
+    max_bytes: Optional[int] = None,
+    max_length: Optional[int] = None
+) -> NormalizationCache:
+    """
+    کش سراسری persian_text_normalizer را فعال/غیرفعال کرده و محدودیت‌های آن را تنظیم می‌کند.
+
+    Args:
+        enabled: فعال بودن کش برای فراخوانی‌هایی که use_cache را مشخص نکرده‌اند.
+        max_bytes: حداکثر حجم کش به بایت (None: بدون تغییر).
+        max_length: طولانی‌ترین متنی که کش می‌شود (None: بدون تغییر).
+
+    Returns:
+        شیء کش سراسری (برای خواندن stats یا clear).
+
+    Example:
+        >>> cache = configure_normalization_cache(max_bytes=64 << 20, max_length=256)
+        >>> persian_text_normalizer("كتاب ها")
+        'کتاب\u200cها'
+        >>> cache.stats()["misses"]
+        1
+    """
+    NORMALIZATION_CACHE.configure(max_bytes=max_bytes, max_length=max_length)
+    NORMALIZATION_CACHE.enabled = enabled
+    return NORMALIZATION_CACHE
+
+
+def persian_text_normalizer(
+    text: str,
+    return_alignment: bool = False,
+    use_cache: Optional[bool] = None
+) -> Union[str, Tuple[str, array]]:
     """
     نرمال‌ساز جامع متن فارسی.
     شامل نرمال‌سازی کاراکترها، پاک‌سازی فاصله‌ها، استانداردسازی علائم نگارشی،
     و اضافه کردن نیم‌فاصله به موارد رایج.
+
+    اگر return_alignment برابر True باشد، تاپل (متن نرمال‌شده، offsets) برگردانده می‌شود که
+    offsets موقعیت هر کاراکتر خروجی را در متن اصلی نگه می‌دارد (Normalizer.normalize_with_alignment).
+    use_cache تنظیم سراسری کش (configure_normalization_cache) را برای همین فراخوانی تغییر می‌دهد.
     """
-    if not isinstance(text, str):
-        raise TypeError("ورودی باید از نوع رشته باشد.")
+    if return_alignment:
+        return DEFAULT_NORMALIZER.normalize_with_alignment(text)
+    return DEFAULT_NORMALIZER.normalize(text, use_cache)
 
-    text = normalize_line_breaks(text)
-    text = normalize_characters(text) # اول نرمال‌سازی کاراکترها
-    text = cleanup_spacing(text)
-    text = standardize_quotes(text) # گیومه‌ها
-    text = standardize_ellipsis(text) # سه نقطه
-    text = add_zwnj_to_common_suffixes(text) # نیم‌فاصله برای پسوندها
 
-    # پاک‌سازی نهایی فاصله‌ها پس از همه تغییرات
-    text = cleanup_spacing(text)
-    return text
+def normalize_stream(
+    source: Union[str, TextIO, Iterable[str]],
+    chunk: str = "paragraph",
+    buffer_size: int = DEFAULT_STREAM_BUFFER_SIZE
+) -> Iterator[str]:
+    """
+    نرمال‌سازی جریانی متن با حافظه محدود (نسخه جریانی persian_text_normalizer).
+    جزئیات در Normalizer.normalize_stream.
+
+    Example:
+        >>> with open("corpus.txt", encoding="utf-8") as f:
+        ...     for part in normalize_stream(f):
+        ...         out.write(part)
+    """
+    return DEFAULT_NORMALIZER.normalize_stream(source, chunk=chunk, buffer_size=buffer_size)
+
+
+def normalize_file(
+    input_path: str,
+    output_path: str,
+    chunk: str = "paragraph",
+    buffer_size: int = DEFAULT_STREAM_BUFFER_SIZE,
+    encoding: str = "utf-8"
+) -> None:
+    """یک فایل متنی را به صورت جریانی نرمال‌سازی کرده و در output_path می‌نویسد."""
+    DEFAULT_NORMALIZER.normalize_file(input_path, output_path, chunk=chunk,
+                                      buffer_size=buffer_size, encoding=encoding)
+
+
+def normalize_many(
+    texts: Iterable[str],
+    workers: Optional[int] = None,
+    chunksize: int = DEFAULT_BATCH_CHUNKSIZE,
+    parallel_threshold: int = DEFAULT_PARALLEL_THRESHOLD
+) -> List[str]:
+    """
+    نرمال‌سازی دسته‌ای متن‌ها با حفظ ترتیب (در صورت نیاز با چند پردازه).
+    جزئیات در Normalizer.normalize_many.
+
+    Example:
+        >>> normalize_many(["كتاب ها", "سلام    دنیا."], workers=1)
+        ['کتاب\u200cها', 'سلام  دنیا.']
+    """
+    return DEFAULT_NORMALIZER.normalize_many(texts, workers=workers, chunksize=chunksize,
+                                             parallel_threshold=parallel_threshold)
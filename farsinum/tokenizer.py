@@ -0,0 +1,84 @@
+# farsinum/tokenizer.py
+
+import re
+from typing import Iterator, Tuple
+
+from .text_normalizer import ZWNJ
+
+# انواع توکن
+WORD = "word"
+NUMBER = "number"
+PUNCTUATION = "punctuation"
+
+# حروف فارسی/عربی (بدون ارقام و علائم نگارشی این بلوک‌ها)، اعراب و حروف لاتین
+_PERSIAN_LETTERS = (
+    "\u0621-\u063a\u0640-\u064a\u066e\u066f\u0671-\u06d3\u06d5\u06e5\u06e6\u06ee\u06ef"
+    "\u06fa-\u06ff\ufb50-\ufdfb\ufe70-\ufefc"
+)
+_PERSIAN_MARKS = "\u064b-\u065f\u0670\u06d6-\u06dc\u06df-\u06e4\u06e7\u06e8\u06ea-\u06ed"
+_LATIN_LETTERS = "A-Za-z\u00c0-\u00d6\u00d8-\u00f6\u00f8-\u024f"
+# جداکننده‌هایی که بین دو رقم جزئی از عدد هستند (اعشار، هزارگان و /)
+_NUMBER_SEPARATORS = ".,/\u066b\u066c"
+
+# یک الگوی واحد برای همه توکن‌ها (بخشی از API عمومی برای ماژول‌هایی که به نوع دقیق‌تر توکن یا خود شیء
+# Match نیاز دارند، مثل text_analyzer). شماره گروه تطبیق‌خورده (match.lastindex) نوع توکن را مشخص می‌کند
+# و با ثابت‌های TOKEN_* مقایسه می‌شود:
+#   ۱) کلمه فارسی: حروف و اعراب، با ZWNJ داخلی (کتاب‌ها یک توکن است)
+#   ۲) کلمه لاتین  ۳) کلمه با حروف دیگر  ۴) عدد (با جداکننده اعشار/هزارگان بین ارقام)
+#   ۵) هر کاراکتر دیگر غیر فاصله (علائم نگارشی و نمادها، هر کدام یک توکن)
+# ZWNJ تنها (نه بین دو حرف) و فاصله‌ها توکن نیستند.
+TOKEN_PATTERN = re.compile(
+    rf"([{_PERSIAN_LETTERS}][{_PERSIAN_LETTERS}{_PERSIAN_MARKS}]*(?:{ZWNJ}+[{_PERSIAN_LETTERS}][{_PERSIAN_LETTERS}{_PERSIAN_MARKS}]*)*)"
+    rf"|([{_LATIN_LETTERS}]+)"
+    rf"|([^\W\d_{_PERSIAN_LETTERS}{_LATIN_LETTERS}]+)"
+    rf"|(\d+(?:[{_NUMBER_SEPARATORS}]\d+)*)"
+    rf"|([^\s{ZWNJ}])"
+)
+# شماره گروه‌های TOKEN_PATTERN
+TOKEN_PERSIAN_WORD, TOKEN_LATIN_WORD, TOKEN_OTHER_WORD, TOKEN_NUMBER, TOKEN_PUNCTUATION = 1, 2, 3, 4, 5
+_TOKEN_KINDS = (None, WORD, WORD, WORD, NUMBER, PUNCTUATION)
+
+
+def iter_tokens(text: str) -> Iterator[Tuple[int, int, str]]:
+    """
+    متن را به صورت تنبل توکن‌بندی می‌کند و برای هر توکن (start, end, kind) برمی‌گرداند.
+
+    kind یکی از WORD، NUMBER یا PUNCTUATION است. نیم‌فاصله بین حروف جزئی از کلمه است،
+    علائم نگارشی چسبیده به کلمات (مثل «خوب.» یا «عالی») توکن جداگانه هستند و اعداد
+    (فارسی، عربی یا انگلیسی، با اعشار مثل ۲.۵ یا ۱۲٫۵) یک توکن عددی‌اند. تغییر خط (فارسی/لاتین)
+    هم مرز توکن است.
+
+    Args:
+        text: متن ورودی.
+
+    Yields:
+        تاپل (start, end, kind)؛ متن توکن برابر text[start:end] است.
+
+    Example:
+        >>> text = "«کتاب‌ها» ۲.۵ OK!"
+        >>> [(text[start:end], kind) for start, end, kind in iter_tokens(text)]
+        [('«', 'punctuation'), ('کتاب‌ها', 'word'), ('»', 'punctuation'), ('۲.۵', 'number'), ('OK', 'word'), ('!', 'punctuation')]
+    """
+    if not isinstance(text, str):
+        raise TypeError("ورودی باید از نوع رشته باشد.")
+    return _iter_tokens(text)
+
+
+def _iter_tokens(text: str) -> Iterator[Tuple[int, int, str]]:
+    kinds = _TOKEN_KINDS
+    for match in TOKEN_PATTERN.finditer(text):
+        start, end = match.span()
+        yield start, end, kinds[match.lastindex]  # type: ignore[index]
+
+
+def iter_words(text: str) -> Iterator[str]:
+    """
+    کلمات و اعداد متن را (بدون علائم نگارشی) به ترتیب برمی‌گرداند.
+
+    Example:
+        >>> list(iter_words("این فیلم «عالی» بود."))
+        ['این', 'فیلم', 'عالی', 'بود']
+    """
+    if not isinstance(text, str):
+        raise TypeError("ورودی باید از نوع رشته باشد.")
+    return (match.group() for match in TOKEN_PATTERN.finditer(text) if match.lastindex != TOKEN_PUNCTUATION)
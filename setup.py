@@ -37,12 +37,13 @@ setuptools.setup(
     },
     packages=setuptools.find_packages(exclude=["tests", "tests.*"]),
     package_data={ # اضافه کردن این بخش برای شامل کردن فایل‌های داده
-        'farsinum': ['data/positive_words_fa.txt', 'data/negative_words_fa.txt'],
+        'farsinum': ['data/positive_words_fa.txt', 'data/negative_words_fa.txt', 'data/verb_stems_fa.txt'],
     },
     # include_package_data=True, # راه دیگر، اگر از MANIFEST.in استفاده می‌کنید (اینجا package_data صریح‌تر است)
-    install_requires=[
-        "jdatetime>=2.0"
-    ],
+    install_requires=[], # تبدیل و قالب‌بندی تاریخ محاسبه داخلی دارد و به jdatetime نیازی نیست
+    extras_require={ # وابستگی‌های اختیاری
+        "numpy": ["numpy>=1.17"], # تبدیل برداری تاریخ‌ها (gregorian_to_jalali_many و jalali_to_gregorian_many) و خروجی آرایه‌ای parse_persian_numbers
+    },
     classifiers=[
         "Development Status :: 4 - Beta",
         "Intended Audience :: Developers",
@@ -2,16 +2,52 @@
 
 import unittest
 import datetime
-import jdatetime
+import logging
+import subprocess
+import sys
 from farsinum.date_converter import (
     gregorian_to_jalali,
     jalali_to_gregorian,
     today_jalali,
+    gregorian_to_jalali_ymd,
+    jalali_to_gregorian_ymd,
+    gregorian_to_jalali_many,
+    jalali_to_gregorian_many,
+    DateParser,
+    sniff_date_format,
+    jalali_strftime,
+    jalali_strptime,
+    tehran_timezone,
+    gregorian_to_jalali_datetime,
+    JalaliTimestampFormatter,
+    JalaliLogFormatter,
+    jalali_add_days,
+    jalali_add_months,
+    jalali_days_between,
+    jalali_period_start,
+    jalali_period_end,
+    iter_jalali_range,
+    DateMention,
+    extract_dates,
+    convert_dates_in_text,
+    convert_dates_in_stream,
+    JALALI,
+    GREGORIAN,
     DEFAULT_JALALI_FORMAT,
     COMMON_JALALI_FORMAT_WITH_DAY_NAME
 )
 from farsinum.numeral_converter import to_english_numerals # برای تست راحت‌تر
 
+try:
+    import numpy
+except ImportError: # NumPy وابستگی اختیاری است
+    numpy = None
+
+try:
+    import jdatetime
+except ImportError: # jdatetime فقط برای مقایسه نتایج و ورودی‌های jdatetime لازم است
+    jdatetime = None
+
 class TestDateConverter(unittest.TestCase):
 
     def test_gregorian_to_jalali_string_input(self):
@@ -53,11 +89,18 @@ class TestDateConverter(unittest.TestCase):
     def test_jalali_to_gregorian_tuple_input(self):
         self.assertEqual(jalali_to_gregorian((1402, 7, 16)), "2023-10-08")
 
+    @unittest.skipUnless(jdatetime, "jdatetime نصب نیست")
     def test_jalali_to_gregorian_jdate_input(self):
         jd = jdatetime.date(1402, 1, 1)
         self.assertEqual(jalali_to_gregorian(jd), "2023-03-21")
         jdt = jdatetime.datetime(1402, 7, 16, 10, 0)
         self.assertEqual(jalali_to_gregorian(jdt), "2023-10-08")
+        self.assertEqual(
+            jalali_to_gregorian_many(["۱۴۰۲/۰۱/۰۱", jdatetime.date(1403, 12, 30)], use_numpy=False),
+            ["2023-03-21", "2025-03-20"]
+        )
+        self.assertEqual(jalali_strftime(jdatetime.date(1403, 12, 30), "%j/%w/%W", use_persian_numerals=False), "366/5/53")
+        self.assertEqual(jalali_add_days(jdatetime.date(1402, 7, 16), 366), (1403, 7, 17))
 
     def test_jalali_to_gregorian_invalid_input(self):
         with self.assertRaises(ValueError): # از تابع _parse_jalali_date_str
@@ -71,6 +114,298 @@ class TestDateConverter(unittest.TestCase):
         with self.assertRaises(ValueError): # فرمت پشتیبانی نشده توسط _parse_jalali_date_str
             jalali_to_gregorian("اول فروردین ۱۴۰۲")
 
+    @unittest.skipUnless(jdatetime, "jdatetime نصب نیست")
+    def test_ymd_core_matches_jdatetime(self):
+        # چند دوره ۳۳ ساله کامل (همه سال‌های کبیسه و مرزهای ماه) به علاوه ابتدا و انتهای بازه
+        start = datetime.date(1990, 1, 1).toordinal()
+        ordinals = list(range(start, start + 366 * 70)) + [226895, 226896, 3651772, 3651773]
+        for ordinal in ordinals:
+            g = datetime.date.fromordinal(ordinal)
+            j = jdatetime.date.fromgregorian(date=g)
+            jalali = (j.year, j.month, j.day)
+            self.assertEqual(gregorian_to_jalali_ymd(g.year, g.month, g.day), jalali)
+            self.assertEqual(jalali_to_gregorian_ymd(*jalali), (g.year, g.month, g.day))
+        self.assertEqual(jalali_to_gregorian_ymd(1403, 12, 30), (2025, 3, 20)) # ۱۴۰۳ کبیسه است
+        with self.assertRaises(ValueError):
+            jalali_to_gregorian_ymd(1402, 12, 30)
+        with self.assertRaises(ValueError):
+            gregorian_to_jalali_ymd(622, 3, 20) # قبل از ۱ فروردین سال ۱
+        with self.assertRaises(ValueError):
+            gregorian_to_jalali_ymd(2023, 2, 29)
+
+    def test_gregorian_to_jalali_formats(self):
+        d = datetime.date(2023, 10, 8)
+        self.assertEqual(gregorian_to_jalali(d, "%y-%-m-%-d %j", use_persian_numerals=False), "02-7-16 202")
+        self.assertEqual(gregorian_to_jalali(d, "{%Y} %%", use_persian_numerals=False), "{1402} %")
+        self.assertEqual(gregorian_to_jalali(d, COMMON_JALALI_FORMAT_WITH_DAY_NAME), "یک‌شنبه ۱۶ مهر ۱۴۰۲")
+
+    def test_date_parser(self):
+        self.assertEqual(sniff_date_format("2023-10-08"), "%Y-%m-%d")
+        self.assertEqual(sniff_date_format("۱۶/۰۷/۱۴۰۲"), "%d/%m/%Y")
+        self.assertEqual(sniff_date_format("20231008"), "%Y%m%d")
+        with self.assertRaises(ValueError):
+            sniff_date_format("2023.10.08")
+
+        parser = DateParser()
+        self.assertEqual(parser.parse("1402/7/16"), (1402, 7, 16))
+        self.assertEqual(parser.date_format, "%Y/%m/%d")
+        self.assertEqual(parser.parse(" ۱۴۰۲/۰۱/۰۱ "), (1402, 1, 1))
+        self.assertEqual(parser.parse("08-10-2023"), (2023, 10, 8)) # تغییر قالب منبع: تشخیص دوباره
+        self.assertEqual(parser.date_format, "%d-%m-%Y")
+
+        strict = DateParser("%d.%m.%Y")
+        self.assertTrue(strict.strict)
+        self.assertEqual(strict.parse("۱۶.۰۷.۱۴۰۲"), (1402, 7, 16))
+        with self.assertRaises(ValueError):
+            strict.parse("1402/07/16") # حالت سخت‌گیرانه قالب را تشخیص نمی‌دهد
+        with self.assertRaises(ValueError):
+            DateParser("%Y/%m") # روز ندارد
+        with self.assertRaises(ValueError):
+            DateParser("%Y/%m/%d %H")
+
+    def test_shared_date_parser_threads(self):
+        # هر رشته قالب متفاوتی می‌فرستد؛ تشخیص قالب در یک رشته نباید نتیجه رشته دیگر را خراب کند
+        import threading
+        from concurrent.futures import ThreadPoolExecutor
+        from farsinum.date_converter import _shared_date_parser
+
+        def convert(text):
+            return [jalali_to_gregorian(text, output_format=None) for _ in range(2000)]
+
+        inputs = ["1402/07/16", "16-07-1402", "14020716", "16/07/1402"]
+        with ThreadPoolExecutor(max_workers=len(inputs)) as executor:
+            for results in executor.map(convert, inputs):
+                self.assertEqual(set(results), {datetime.date(2023, 10, 8)})
+
+        jalali_to_gregorian("1402/07/16")
+        thread = threading.Thread(target=jalali_to_gregorian, args=("16-07-1402",))
+        thread.start()
+        thread.join()
+        self.assertEqual(_shared_date_parser("jalali").date_format, "%Y/%m/%d")
+
+    def test_jalali_strftime(self):
+        self.assertEqual(jalali_strftime((1402, 7, 16), "%A %d %B %Y"), "یک\u200cشنبه ۱۶ مهر ۱۴۰۲")
+        self.assertEqual(jalali_strftime("1402/07/16", "%a %-d %b %y", use_persian_numerals=False, locale="en_US"), "Sun 16 Meh 02")
+        self.assertEqual(jalali_strftime((1403, 12, 30), "%j/%w/%W", use_persian_numerals=False), "366/5/53")
+        self.assertEqual(jalali_strftime((1402, 1, 1), "{%Y} 100%% %Q"), "{۱۴۰۲} ۱۰۰% %Q") # ارقام متن ثابت هم فارسی می‌شوند
+
+    @unittest.skipUnless(jdatetime, "jdatetime نصب نیست")
+    def test_jalali_strftime_matches_jdatetime(self):
+        tehran = datetime.timezone(datetime.timedelta(hours=3, minutes=30), "IRST")
+        jdt = jdatetime.datetime(1402, 7, 16, 13, 5, 9, tzinfo=tehran)
+        self.assertEqual(jalali_strftime(jdt, "%H:%M:%S %p %z %Z", use_persian_numerals=False), "13:05:09 بعد از ظهر +0330 IRST")
+        # برابری با strftime کتابخانه jdatetime برای همه دستورها
+        for locale in ("fa_IR", "en_US"):
+            for month in range(1, 13):
+                j = jdatetime.datetime(1399, month, 29, month, 7, 30, 120, tzinfo=tehran, locale=locale)
+                output_format = "%a %A %b %B %c %d %-d %j %m %-m %w %W %Y %y %f %H %I %M %S %p %x %X %z %Z"
+                self.assertEqual(jalali_strftime(j, output_format, use_persian_numerals=False, locale=locale), j.strftime(output_format))
+
+    def test_jalali_strptime(self):
+        self.assertEqual(jalali_strptime("یکشنبه ۱۶ مهر ۱۴۰۲", "%A %d %B %Y"), (1402, 7, 16))
+        self.assertEqual(jalali_strptime("يک‌شنبه  16  مهر 1402", "%A %d %B %Y"), (1402, 7, 16)) # ی عربی و فاصله اضافه
+        self.assertEqual(jalali_strptime("sun 16 MEH 02", "%a %d %b %y"), (1402, 7, 16))
+        self.assertEqual(jalali_strptime("16 Mehr 1402", "%d %B %Y"), (1402, 7, 16))
+        self.assertEqual(jalali_strptime("۱۴۰۳-۳۶۶", "%Y-%j"), (1403, 12, 30))
+        self.assertEqual(jalali_strptime("۱۲/۰۵/۷۰", "%d/%m/%y"), (1370, 5, 12))
+        with self.assertRaises(ValueError):
+            jalali_strptime("۳۰ اسفند ۱۴۰۲", "%d %B %Y") # ۱۴۰۲ کبیسه نیست
+        with self.assertRaises(ValueError):
+            jalali_strptime("16 Mehrr 1402", "%d %B %Y")
+        with self.assertRaises(ValueError):
+            jalali_strptime("1402-366", "%Y-%j")
+        self.assertEqual(DateParser("%d %B %Y", calendar="gregorian").parse("8 october 2023"), (2023, 10, 8))
+        self.assertEqual(gregorian_to_jalali("Oct 08 2023", input_format="%b %d %Y"), "۱۴۰۲/۰۷/۱۶")
+        self.assertEqual(jalali_to_gregorian("۱۶ مهر ۱۴۰۲", input_format="%d %B %Y"), "2023-10-08")
+
+    def test_input_format(self):
+        self.assertEqual(gregorian_to_jalali("08.10.2023", input_format="%d.%m.%Y"), "۱۴۰۲/۰۷/۱۶")
+        self.assertEqual(gregorian_to_jalali("۰۸/۱۰/۲۰۲۳", use_persian_numerals=False), "1402/07/16")
+        self.assertEqual(jalali_to_gregorian("16.7.1402", input_format="%d.%m.%Y"), "2023-10-08")
+        with self.assertRaises(ValueError):
+            jalali_to_gregorian("1402/07/16", input_format="%d.%m.%Y")
+        self.assertEqual(
+            gregorian_to_jalali_many(["2023.03.21", "2024.02.29"], input_format="%Y.%m.%d", use_numpy=False),
+            ["۱۴۰۲/۰۱/۰۱", "۱۴۰۲/۱۲/۱۰"]
+        )
+        self.assertEqual(jalali_to_gregorian_many(["1402-01-01", "1402/12/10"]), ["2023-03-21", "2024-02-29"])
+
+    def test_many_pure_python(self):
+        g_dates = ["2023-03-21", datetime.date(2024, 2, 29), datetime.datetime(2023, 10, 8, 12), (2025, 3, 20)]
+        expected = [gregorian_to_jalali(d) for d in g_dates[:3]] + ["۱۴۰۳/۱۲/۳۰"]
+        self.assertEqual(gregorian_to_jalali_many(g_dates, use_numpy=False), expected)
+        self.assertEqual(
+            gregorian_to_jalali_many(iter(g_dates), output_format=None, use_numpy=False),
+            ([1402, 1402, 1402, 1403], [1, 12, 7, 12], [1, 10, 16, 30])
+        )
+        self.assertEqual(
+            jalali_to_gregorian_many(["۱۴۰۲/۰۱/۰۱", (1402, 12, 10), (1403, 12, 30)], use_numpy=False),
+            ["2023-03-21", "2024-02-29", "2025-03-20"]
+        )
+        self.assertEqual(jalali_to_gregorian_many([(1402, 7, 16)], output_format=None, use_numpy=False), ([2023], [10], [8]))
+        with self.assertRaises(ValueError):
+            jalali_to_gregorian_many([(1402, 1, 1), (1402, 12, 30)], use_numpy=False)
+        with self.assertRaises(ValueError):
+            gregorian_to_jalali_many([(2023, 2, 29)], use_numpy=False)
+
+    @unittest.skipUnless(numpy, "numpy نصب نیست")
+    def test_many_numpy_mixed_sequences(self):
+        # دنباله‌های ناهمگن (رشته و تاپل) به آرایه تبدیل نمی‌شوند و تک‌تک تبدیل می‌شوند
+        self.assertEqual(jalali_to_gregorian_many(["۱۴۰۲/۰۱/۰۱", (1402, 12, 10)]), ["2023-03-21", "2024-02-29"])
+        self.assertEqual(gregorian_to_jalali_many(["2023-03-21", (2024, 2, 29)]), ["۱۴۰۲/۰۱/۰۱", "۱۴۰۲/۱۲/۱۰"])
+        years, months, days = gregorian_to_jalali_many(
+            [datetime.date(2023, 3, 21), "2024-02-29", (2023, 10, 8)], output_format=None, use_numpy=True
+        )
+        self.assertEqual((years.tolist(), months.tolist(), days.tolist()), ([1402, 1402, 1402], [1, 12, 7], [1, 10, 16]))
+
+    @unittest.skipUnless(numpy, "numpy نصب نیست")
+    def test_many_numpy(self):
+        g_days = numpy.arange("1990-01-01", "2060-01-01", dtype="datetime64[D]")
+        g_dates = g_days.tolist()
+        # هسته اسکالر gregorian_to_jalali_ymd جداگانه با jdatetime مقایسه می‌شود
+        expected = [gregorian_to_jalali_ymd(d.year, d.month, d.day) for d in g_dates]
+        years, months, days = gregorian_to_jalali_many(g_days, output_format=None)
+        self.assertEqual(list(zip(years.tolist(), months.tolist(), days.tolist())), expected)
+        # ستون pandas با واحد نانوثانیه و آرایه عددی (n, 3)
+        self.assertEqual(gregorian_to_jalali_many(numpy.array(["2024-02-29T23:59"], dtype="datetime64[ns]")), ["۱۴۰۲/۱۲/۱۰"])
+        ymd = numpy.array([(d.year, d.month, d.day) for d in g_dates])
+        self.assertTrue(numpy.array_equal(gregorian_to_jalali_many(ymd, output_format=None)[2], days))
+
+        j_ymd = numpy.stack([years, months, days], axis=1)
+        g_years, g_months, g_days_of_month = jalali_to_gregorian_many(j_ymd, output_format=None)
+        self.assertEqual(
+            [datetime.date(*ymd) for ymd in zip(g_years.tolist(), g_months.tolist(), g_days_of_month.tolist())], g_dates
+        )
+        self.assertEqual(jalali_to_gregorian_many(j_ymd[:3]), [d.isoformat() for d in g_dates[:3]])
+        with self.assertRaises(ValueError):
+            jalali_to_gregorian_many(numpy.array([[1402, 12, 30]]))
+        with self.assertRaises(ValueError):
+            gregorian_to_jalali_many(numpy.array(["NaT"], dtype="datetime64[D]"))
+
+
+    def test_gregorian_to_jalali_datetime(self):
+        tehran = tehran_timezone()
+        utc = datetime.datetime(2023, 10, 8, 9, 30, tzinfo=datetime.timezone.utc)
+        self.assertEqual(
+            gregorian_to_jalali_datetime(utc, "%Y/%m/%d %H:%M %z", use_persian_numerals=False, tz=tehran),
+            "1402/07/16 13:00 +0330"
+        )
+        self.assertEqual(gregorian_to_jalali_datetime(utc, tz=tehran), "۱۴۰۲/۰۷/۱۶ ۱۳:۰۰:۰۰")
+        self.assertEqual(gregorian_to_jalali_datetime(utc, output_format=None), (1402, 7, 16, 9, 30, 0, 0))
+        # datetime بدون منطقه زمانی، زمان محلی tz فرض می‌شود
+        naive = datetime.datetime(2023, 10, 8, 23, 59, 59, 500)
+        self.assertEqual(gregorian_to_jalali_datetime(naive, output_format=None, tz=tehran), (1402, 7, 16, 23, 59, 59, 500))
+        # گذر از نیمه‌شب تهران در حالی که در UTC هنوز همان روز است
+        self.assertEqual(
+            gregorian_to_jalali_datetime(utc.timestamp() + 11 * 3600, "%Y/%m/%d %H:%M", False, tz=tehran),
+            "1402/07/17 00:00"
+        )
+        with self.assertRaises(TypeError):
+            gregorian_to_jalali_datetime("2023-10-08 09:30") # type: ignore
+
+    def test_jalali_timestamp_formatter(self):
+        per_second = JalaliTimestampFormatter(use_persian_numerals=False)
+        utc = datetime.datetime(2023, 10, 8, 20, 30, tzinfo=datetime.timezone.utc)
+        self.assertEqual(per_second.format(utc), "1402/07/17 00:00:00")
+        self.assertEqual(JalaliTimestampFormatter("%d %B").format(utc), "۱۷ مهر")
+
+    @unittest.skipUnless(jdatetime, "jdatetime نصب نیست")
+    def test_jalali_timestamp_formatter_matches_jdatetime(self):
+        tehran = tehran_timezone()
+        output_format = "%Y/%m/%d %H:%M:%S.%f %A %z"
+        formatter = JalaliTimestampFormatter(output_format, use_persian_numerals=False)
+        per_second = JalaliTimestampFormatter(use_persian_numerals=False)
+        # برچسب‌های پشت‌سرهم، از جمله گذر از نیمه‌شب و سال نو؛ خروجی باید با jdatetime یکی باشد
+        start = datetime.datetime(2024, 3, 19, 23, 59, 58, tzinfo=tehran).timestamp()
+        for step in range(0, 2 * 86400 + 7, 3637):
+            for offset in (0.0, 0.25, 1.5):
+                timestamp = start + step + offset
+                local = jdatetime.datetime.fromgregorian(datetime=datetime.datetime.fromtimestamp(timestamp, tehran), locale="fa_IR")
+                with self.subTest(timestamp=timestamp):
+                    self.assertEqual(formatter.format(timestamp), local.strftime(output_format))
+                    self.assertEqual(per_second.format(timestamp), local.strftime("%Y/%m/%d %H:%M:%S"))
+
+    def test_jalali_log_formatter(self):
+        record = logging.LogRecord("farsinum", logging.INFO, __file__, 1, "پیام", None, None)
+        record.created = datetime.datetime(2023, 10, 8, 9, 30, 5, 123000, tzinfo=datetime.timezone.utc).timestamp()
+        record.msecs = 123.0
+        formatter = JalaliLogFormatter("%(asctime)s %(levelname)s %(message)s")
+        self.assertEqual(formatter.format(record), "1402/07/16 13:00:05,123 INFO پیام")
+        formatter = JalaliLogFormatter("{asctime} {message}", datefmt="%d %B %H:%M", style="{", use_persian_numerals=True)
+        self.assertEqual(formatter.format(record), "۱۶ مهر ۱۳:۰۰ پیام")
+
+    def test_jalali_arithmetic(self):
+        self.assertEqual(jalali_add_days((1402, 12, 29), 1), (1403, 1, 1))
+        self.assertEqual(jalali_add_days("۱۴۰۳/۰۱/۰۱", -1), (1402, 12, 29))
+        self.assertEqual(jalali_add_days((1402, 7, 16), 366), (1403, 7, 17))
+        self.assertEqual(jalali_add_months((1402, 6, 31), 1), (1402, 7, 30))
+        self.assertEqual(jalali_add_months((1403, 12, 30), 12), (1404, 12, 29)) # ۱۴۰۴ کبیسه نیست
+        self.assertEqual(jalali_add_months((1402, 1, 31), -2), (1401, 11, 30))
+        self.assertEqual(jalali_days_between((1403, 1, 1), (1404, 1, 1)), 366)
+        self.assertEqual(jalali_days_between((1402, 7, 16), (1402, 7, 1)), -15)
+        with self.assertRaises(ValueError):
+            jalali_add_days((9377, 12, 29), 2)
+        with self.assertRaises(ValueError):
+            jalali_add_months((1, 1, 1), -1)
+        with self.assertRaises(ValueError):
+            jalali_add_days((1402, 12, 30), 1) # ۱۴۰۲ کبیسه نیست
+
+    def test_jalali_period_bounds(self):
+        date = (1402, 8, 20) # شنبه
+        self.assertEqual((jalali_period_start(date, "week"), jalali_period_end(date, "week")), ((1402, 8, 20), (1402, 8, 26)))
+        self.assertEqual(jalali_period_start((1402, 8, 26), "week"), (1402, 8, 20))
+        self.assertEqual((jalali_period_start(date), jalali_period_end(date)), ((1402, 8, 1), (1402, 8, 30)))
+        self.assertEqual((jalali_period_start(date, "quarter"), jalali_period_end(date, "quarter")), ((1402, 7, 1), (1402, 9, 30)))
+        self.assertEqual(jalali_period_end((1403, 11, 5), "quarter"), (1403, 12, 30))
+        self.assertEqual((jalali_period_start(date, "year"), jalali_period_end(date, "year")), ((1402, 1, 1), (1402, 12, 29)))
+        with self.assertRaises(ValueError):
+            jalali_period_start(date, "decade")
+
+    def test_iter_jalali_range(self):
+        self.assertEqual(list(iter_jalali_range((1402, 12, 28), (1403, 1, 2))), [(1402, 12, 28), (1402, 12, 29), (1403, 1, 1)])
+        self.assertEqual(list(iter_jalali_range((1403, 1, 2), (1402, 12, 28), -2)), [(1403, 1, 2), (1402, 12, 29)])
+        self.assertEqual(list(iter_jalali_range((1402, 1, 1), (1402, 1, 1))), [])
+        days = iter_jalali_range((1400, 1, 1), (1410, 1, 1))
+        self.assertEqual(next(days), (1400, 1, 1))
+        self.assertEqual(sum(1 for _ in days) + 1, jalali_days_between((1400, 1, 1), (1410, 1, 1)))
+        with self.assertRaises(ValueError):
+            iter_jalali_range((1402, 1, 1), (1403, 1, 1), 0)
+
+    def test_extract_dates(self):
+        text = "جلسه ۱۶ مهر ۱۴۰۲، تمدید تا 2023-11-01 و ١٤٠٢/٨/١٠؛ 8 Oct, 2023. نامعتبر: ۱۴۰۲/۱۳/۴۰ و v1402.7.16.1"
+        mentions = list(extract_dates(text))
+        self.assertEqual([m.text for m in mentions], ["۱۶ مهر ۱۴۰۲", "2023-11-01", "١٤٠٢/٨/١٠", "8 Oct, 2023"])
+        self.assertEqual([text[m.start:m.end] for m in mentions], [m.text for m in mentions])
+        self.assertEqual(
+            mentions[0], DateMention(mentions[0].start, mentions[0].end, "۱۶ مهر ۱۴۰۲", JALALI, (1402, 7, 16), (2023, 10, 8))
+        )
+        self.assertEqual((mentions[1].calendar, mentions[1].jalali), (GREGORIAN, (1402, 8, 10)))
+        self.assertEqual(mentions[3].to_dict()["jalali"], (1402, 7, 16))
+        # تکه‌های یک سند: تاریخ‌هایی که بین دو تکه شکسته شده‌اند هم پیدا می‌شوند
+        parts = [text[i:i + 5] for i in range(0, len(text), 5)]
+        self.assertEqual(list(extract_dates(parts)), mentions)
+        with self.assertRaises(TypeError):
+            list(extract_dates([text, None])) # type: ignore
+
+    def test_convert_dates_in_text(self):
+        self.assertEqual(convert_dates_in_text("مهلت: ۱۴۰۲/۰۷/۱۶"), "مهلت: ۲۰۲۳-۱۰-۰۸")
+        self.assertEqual(convert_dates_in_text("مهلت: 16 مهر 1402 و 2023-11-01"), "مهلت: 2023-10-08 و 2023-11-01")
+        self.assertEqual(
+            convert_dates_in_text("Released 2023-10-08", to="jalali", output_format="%d %B %Y"), "Released 16 مهر 1402"
+        )
+        self.assertEqual(convert_dates_in_text("8 October 2023", to=JALALI, use_persian_numerals=True), "۱۴۰۲/۰۷/۱۶")
+        self.assertEqual(convert_dates_in_text("بدون تاریخ ۱۴۰۲/۱۳/۴۰"), "بدون تاریخ ۱۴۰۲/۱۳/۴۰")
+        text = "از ۱۴۰۲/۰۷/۱۶ تا 1402/12/29.\n" * 30
+        parts = [text[i:i + 7] for i in range(0, len(text), 7)]
+        self.assertEqual("".join(convert_dates_in_stream(parts)), convert_dates_in_text(text))
+        with self.assertRaises(ValueError):
+            convert_dates_in_text("۱۴۰۲/۰۷/۱۶", to="hijri")
+
+    def test_import_does_not_load_jdatetime(self):
+        # jdatetime وابستگی اجرایی نیست؛ import farsinum نباید آن را وارد کند
+        code = "import sys, farsinum; farsinum.gregorian_to_jalali('2023-10-08'); print('jdatetime' in sys.modules)"
+        output = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True).stdout
+        self.assertEqual(output.strip(), "False")
 
     def test_today_jalali(self):
         # این تست حساس به زمان است و ممکن است در روزهای مختلف نتایج متفاوتی بدهد.
@@ -88,7 +423,8 @@ class TestDateConverter(unittest.TestCase):
         self.assertIsInstance(today_formatted, str)
         # بررسی اینکه آیا شامل نام روز و ماه است (به طور ساده)
         self.assertTrue(any(day_name in today_formatted for day_name in ["شنبه", "یکشنبه", "دوشنبه", "سه‌شنبه", "چهارشنبه", "پنجشنبه", "جمعه"]))
-        self.assertTrue(any(month_name in today_formatted for month_name in jdatetime.date.j_months_fa))
+        month_names = ["فروردین", "اردیبهشت", "خرداد", "تیر", "مرداد", "شهریور", "مهر", "آبان", "آذر", "دی", "بهمن", "اسفند"]
+        self.assertTrue(any(month_name in today_formatted for month_name in month_names))
         # print(f"\nامروز به شمسی: {today_formatted}")
 
 if __name__ == '__main__':
@@ -1,7 +1,24 @@
 # tests/test_number_to_words.py
 
+import multiprocessing
 import unittest
-from farsinum import number_to_persian_words
+from concurrent.futures import ProcessPoolExecutor
+from decimal import Decimal
+from farsinum import (
+    number_to_persian_words,
+    number_to_persian_words_many,
+    extend_persian_scales,
+    persian_words_to_number,
+    persian_words_to_number_many,
+    spell_out_numbers,
+    spell_out_numbers_stream,
+    DecimalWordsFormatter,
+    OrdinalWordsFormatter,
+    CurrencyWordsFormatter,
+    decimal_to_persian_words,
+    ordinal_to_persian_words,
+    currency_to_persian_words
+)
 
 class TestNumberToWords(unittest.TestCase):
 
@@ -38,17 +55,215 @@ class TestNumberToWords(unittest.TestCase):
         self.assertEqual(number_to_persian_words(-128), "منفی یکصد و بیست و هشت")
         self.assertEqual(number_to_persian_words(-1000000), "منفی یک میلیون")
 
+    def test_repeated_numbers(self):
+        # نتیجه اعداد کش‌شده باید با فراخوانی اول یکی باشد
+        for number in (1000, 2500000, -2500000, 123456789):
+            with self.subTest(number=number):
+                self.assertEqual(number_to_persian_words(number), number_to_persian_words(number))
+        self.assertEqual(number_to_persian_words(-2500000), "منفی دو میلیون و پانصد هزار")
+
+    def test_extend_persian_scales(self):
+        from farsinum import number_to_words
+        original = list(number_to_words._PERSIAN_SCALE)
+        try:
+            scales = extend_persian_scales(["اندسیلیون"])
+            self.assertEqual(scales[-2:], ("دسیلیون", "اندسیلیون"))
+            self.assertEqual(number_to_persian_words(10**36), "یک اندسیلیون")
+            self.assertEqual(number_to_persian_words(10**39), "یک هزار اندسیلیون")
+            with self.assertRaises(ValueError):
+                extend_persian_scales([" "])
+            with self.assertRaises(TypeError):
+                extend_persian_scales([1]) # type: ignore
+            for names in (["میلیون"], ["اندسیلیون"], ["صد"], ["سپتیلیون", "سپتیلیون"], ["ميليون"]):
+                with self.subTest(names=names):
+                    with self.assertRaises(ValueError):
+                        extend_persian_scales(names)
+            self.assertEqual(scales, extend_persian_scales([])) # ورودی نامعتبر چیزی اضافه نمی‌کند
+        finally:
+            number_to_words._set_persian_scales(original)
+
+    def test_extended_scales_reach_spawned_workers(self):
+        # پردازه‌های spawn وضعیت ماژول را به ارث نمی‌برند؛ مقیاس‌ها با initializer فرستاده می‌شوند
+        from farsinum import number_to_words
+        original = list(number_to_words._PERSIAN_SCALE)
+        try:
+            extend_persian_scales(["اندسیلیون"])
+            with ProcessPoolExecutor(
+                max_workers=1, mp_context=multiprocessing.get_context("spawn"),
+                initializer=number_to_words._init_words_worker, initargs=(tuple(number_to_words._PERSIAN_SCALE),)
+            ) as executor:
+                words = executor.submit(number_to_words._number_words_batch, [10**36]).result()
+            self.assertEqual(words, ["یک اندسیلیون"])
+        finally:
+            number_to_words._set_persian_scales(original)
+
+    def test_number_to_persian_words_many(self):
+        numbers = [0, 21, 1001, -42, 2500000, 999]
+        expected = [number_to_persian_words(number) for number in numbers]
+        self.assertEqual(number_to_persian_words_many(numbers), expected)
+        self.assertEqual(number_to_persian_words_many(iter(numbers), workers=1), expected)
+        self.assertEqual(number_to_persian_words_many([]), [])
+        numbers = list(range(-500, 4500, 7))
+        self.assertEqual(
+            number_to_persian_words_many(numbers, workers=2, chunksize=100, parallel_threshold=10),
+            [number_to_persian_words(number) for number in numbers]
+        )
+        with self.assertRaises(TypeError):
+            number_to_persian_words_many([1, "2"]) # type: ignore
+        with self.assertRaises(ValueError):
+            number_to_persian_words_many([1], chunksize=0)
+
     def test_edge_cases_and_errors(self):
         with self.assertRaises(TypeError):
             number_to_persian_words("123") # type: ignore
         
-        # تست عدد بسیار بزرگ (بسته به مقیاس‌های تعریف شده)
-        # اگر کوادریلیون آخرین مقیاس باشد، 1000^6 قابل قبول است اما 1000^7 نه.
-        # 10^18 (یک کوادریلیون)
-        number_to_persian_words(10**18) # باید کار کند
-        with self.assertRaises(ValueError): # فراتر از کوادریلیون
-             number_to_persian_words(10**21)
+        # اندازه عدد محدودیتی ندارد؛ فراتر از آخرین مقیاس نام‌دار (دسیلیون) نام‌ها ترکیبی هستند
+        self.assertEqual(number_to_persian_words(10**18), "یک کوینتیلیون")
+        self.assertEqual(number_to_persian_words(10**21), "یک سکستیلیون")
+        self.assertEqual(number_to_persian_words(2 * 10**36 + 10**33), "دو هزار دسیلیون و یک دسیلیون")
+        self.assertEqual(number_to_persian_words(-(10**66)), "منفی یک دسیلیون دسیلیون")
+
+    def test_very_large_numbers(self):
+        # بیشتر از محدودیت پیش‌فرض تبدیل int به str (۴۳۰۰ رقم)
+        number = 7 * (10**5000 - 1) // 9 # ۵۰۰۰ رقم ۷
+        words = number_to_persian_words(number)
+        self.assertTrue(words.startswith("هفتاد و هفت "))
+        self.assertEqual(words.count(" و "), 1666 * 3 + 1) # ۱۶۶۶ گروه کامل و یک گروه دورقمی
+        self.assertTrue(words.endswith(" و هفتصد و هفتاد و هفت"))
+
+    def test_persian_words_to_number_round_trip(self):
+        numbers = list(range(-1200, 1200, 7)) + [10**6, 2500000, 123456789, 10**18 + 1, 2 * 10**36 + 10**33, 10**66]
+        for number in numbers:
+            with self.subTest(number=number):
+                self.assertEqual(persian_words_to_number(number_to_persian_words(number)), number)
+
+    def test_persian_words_to_number_variants(self):
+        self.assertEqual(persian_words_to_number("یکصد و بیست و سه میلیون"), 123000000)
+        self.assertEqual(persian_words_to_number("صد"), 100)
+        self.assertEqual(persian_words_to_number("یک صد و یک"), 101)
+        self.assertEqual(persian_words_to_number("دو صد"), 200)
+        self.assertEqual(persian_words_to_number("سی‌صد"), 300)
+        self.assertEqual(persian_words_to_number("سی صد و سی هزار"), 330000)
+        self.assertEqual(persian_words_to_number("یک میلیون و هزار"), 1001000)
+        self.assertEqual(persian_words_to_number("هزار دسیلیون و دو دسیلیون"), 10**36 + 2 * 10**33)
+        self.assertEqual(persian_words_to_number("یکهزار"), 1000)
+        self.assertEqual(persian_words_to_number("هزار و یک"), 1001)
+        self.assertEqual(persian_words_to_number("بیست‌و‌یک"), 21)
+        self.assertEqual(persian_words_to_number("هيجده"), 18) # ی عربی
+        self.assertEqual(persian_words_to_number("  دو   میلیون  و  پانصد هزار "), 2500000)
+        self.assertEqual(persian_words_to_number("۲۵ هزار و 300"), 25300)
+        self.assertEqual(persian_words_to_number("منفی صفر"), 0)
+        for text in ("", "و", "بیست سی", "یک بیست", "صفر و یک", "یک منفی", "سلام", "بیست و", "صد صد", "یک ۲",
+                     "دو هزار و سه هزار", "یک میلیون هزار", "هزار هزار", "دسیلیون هزار", "بیست صد",
+                     "دو دسیلیون سه هزار دسیلیون"):
+            with self.subTest(text=text):
+                with self.assertRaises(ValueError):
+                    persian_words_to_number(text)
+        with self.assertRaises(TypeError):
+            persian_words_to_number(21) # type: ignore
+
+    def test_persian_words_to_number_many(self):
+        texts = ["بیست و یک", "یکهزار", "نامعلوم"]
+        self.assertEqual(persian_words_to_number_many(texts, errors="coerce"), [21, 1000, None])
+        with self.assertRaises(ValueError):
+            persian_words_to_number_many(texts)
+        with self.assertRaises(ValueError):
+            persian_words_to_number_many(texts, errors="ignore")
+        texts = [number_to_persian_words(number) for number in range(0, 100000, 97)]
+        self.assertEqual(
+            persian_words_to_number_many(texts, workers=2, chunksize=200, parallel_threshold=10), list(range(0, 100000, 97))
+        )
+
+    def test_spell_out_numbers(self):
+        self.assertEqual(
+            spell_out_numbers("قیمت ۱٬۲۵۰ تومان و وزن 2.5 کیلو"), "قیمت یک هزار و دویست و پنجاه تومان و وزن دو ممیز پنج کیلو"
+        )
+        self.assertEqual(spell_out_numbers("دمای -۳ درجه، صفحه ۱۰-۱۲"), "دمای منفی سه درجه، صفحه ده-دوازده")
+        self.assertEqual(spell_out_numbers("١٢٣ و 1,234,567"), "یکصد و بیست و سه و یک میلیون و دویست و سی و چهار هزار و پانصد و شصت و هفت")
+        self.assertEqual(spell_out_numbers("کد ۰۲۱ و ۰.۰۵"), "کد صفر بیست و یک و صفر ممیز صفر پنج")
+        self.assertEqual(spell_out_numbers("بدون عدد"), "بدون عدد")
+        with self.assertRaises(TypeError):
+            spell_out_numbers(123) # type: ignore
+
+    def test_spell_out_numbers_stream(self):
+        text = "در سال ۱۴۰۲ حدود 1,250,000 نفر و ۲۵٫۵ درصد (-۳)\n" * 20
+        parts = [text[i:i + 3] for i in range(0, len(text), 3)]
+        self.assertEqual("".join(spell_out_numbers_stream(parts)), spell_out_numbers(text))
+        self.assertEqual("".join(spell_out_numbers_stream(text)), spell_out_numbers(text))
+        with self.assertRaises(TypeError):
+            list(spell_out_numbers_stream(["۱۲", None])) # type: ignore
+        # متن بدون فاصله: خروجی تکه به تکه تولید می‌شود و فقط به اندازه طولانی‌ترین عدد بافر می‌شود
+        parts = ["ab۱۲,", "۳۴۵-c"] * 2000 + ["۱", "۲" * 50, "د"]
+        outputs = list(spell_out_numbers_stream(parts))
+        self.assertEqual("".join(outputs), spell_out_numbers("".join(parts)))
+        self.assertGreater(len(outputs), 2000)
+
+    def test_number_speller_memo_is_bounded(self):
+        from farsinum.number_to_words import _RE_SPELL_NUMBER, _number_speller
+        speller = _number_speller(memo_size=4)
+        text = " ".join(str(number) for number in range(20)) + " 3 19"
+        self.assertEqual(_RE_SPELL_NUMBER.sub(speller, text), spell_out_numbers(text))
+        memo = next(cell.cell_contents for cell in speller.__closure__ if isinstance(cell.cell_contents, dict))
+        self.assertLessEqual(len(memo), 4)
+
+
+    def test_decimal_to_persian_words(self):
+        self.assertEqual(decimal_to_persian_words("۱۲.۵"), "دوازده و پنج دهم")
+        self.assertEqual(decimal_to_persian_words(0.25), "بیست و پنج صدم")
+        self.assertEqual(decimal_to_persian_words(-1.05), "منفی یک و پنج صدم")
+        self.assertEqual(decimal_to_persian_words("3.0001"), "سه و یک ده\u200cهزارم")
+        self.assertEqual(
+            [decimal_to_persian_words("0." + "0" * (digits - 1) + "1") for digits in range(4, 9)],
+            ["یک ده\u200cهزارم", "یک صد\u200cهزارم", "یک میلیونم", "یک ده\u200cمیلیونم", "یک صد\u200cمیلیونم"],
+        )
+        self.assertEqual(decimal_to_persian_words(Decimal("2.50")), "دو و پنجاه صدم")
+        self.assertEqual(decimal_to_persian_words(1e-7), "یک ده\u200cمیلیونم")
+        self.assertEqual(decimal_to_persian_words("0." + "0" * 19 + "1"), "یک صد\u200cکوینتیلیونم")
+        self.assertEqual(decimal_to_persian_words(12), "دوازده")
+        self.assertEqual(decimal_to_persian_words("-0.0"), "صفر")
+        formatter = DecimalWordsFormatter()
+        self.assertEqual(formatter.format_many(["٣٫١٤", 7]), ["سه و چهارده صدم", "هفت"])
+        for value in (float("nan"), float("inf"), "abc"):
+            with self.subTest(value=value):
+                with self.assertRaises(ValueError):
+                    formatter(value)
+        with self.assertRaises(TypeError):
+            formatter(None) # type: ignore
+
+    def test_ordinal_to_persian_words(self):
+        self.assertEqual(ordinal_to_persian_words(21), "بیست و یکم")
+        self.assertEqual(
+            OrdinalWordsFormatter().format_many([0, 3, 13, 30, 33, 100, 1000, 1001, 10**9]),
+            ["صفرم", "سوم", "سیزدهم", "سی\u200cام", "سی و سوم", "یکصدم", "یک هزارم", "یک هزار و یکم", "یک میلیاردم"],
+        )
+        adjective = OrdinalWordsFormatter(adjective=True, first_as_aval=True)
+        self.assertEqual(adjective.format_many([1, 2, 3, 30]), ["اولین", "دومین", "سومین", "سی\u200cامین"])
+        self.assertEqual(OrdinalWordsFormatter(first_as_aval=True)(1), "اول")
+        with self.assertRaises(ValueError):
+            ordinal_to_persian_words(-1)
+        with self.assertRaises(TypeError):
+            ordinal_to_persian_words(1.5) # type: ignore
+        with self.assertRaises(TypeError):
+            ordinal_to_persian_words(True) # type: ignore
+
+    def test_words_formatter_base_is_abstract(self):
+        from farsinum.number_to_words import _WordsFormatter
+        with self.assertRaises(TypeError):
+            _WordsFormatter() # type: ignore
 
+    def test_currency_to_persian_words(self):
+        self.assertEqual(currency_to_persian_words(1250000), "یکصد و بیست و پنج هزار تومان")
+        self.assertEqual(currency_to_persian_words(12345), "یک هزار و دویست و سی و چهار تومان و پنج ریال")
+        self.assertEqual(currency_to_persian_words(5), "پنج ریال")
+        self.assertEqual(currency_to_persian_words(0), "صفر تومان")
+        self.assertEqual(currency_to_persian_words(-120), "منفی دوازده تومان")
+        self.assertEqual(currency_to_persian_words("۲۵٬۰۰۰", unit="rial", source_unit="toman"), "دویست و پنجاه هزار ریال")
+        formatter = CurrencyWordsFormatter(unit="rial", source_unit="toman")
+        self.assertEqual(formatter.format_many([12.5, "1,000"]), ["یکصد و بیست و پنج ریال", "ده هزار ریال"])
+        with self.assertRaises(ValueError):
+            formatter.format("12.55") # کمتر از یک ریال
+        with self.assertRaises(ValueError):
+            CurrencyWordsFormatter(unit="dollar")
 
 if __name__ == '__main__':
     unittest.main()
@@ -1,7 +1,20 @@
 # tests/test_numeral_converter.py
 
 import unittest
-from farsinum import to_persian_numerals, to_english_numerals
+from decimal import Decimal
+from farsinum import (
+    to_persian_numerals,
+    to_english_numerals,
+    format_persian_number,
+    format_persian_numbers,
+    parse_persian_number,
+    parse_persian_numbers
+)
+
+try:
+    import numpy
+except ImportError: # numpy وابستگی اختیاری است
+    numpy = None
 
 class TestNumeralConverter(unittest.TestCase):
 
@@ -23,5 +36,99 @@ class TestNumeralConverter(unittest.TestCase):
         # self.assertEqual(to_english_numerals(۱۲۳), "123") # Python int cannot be Persian numeral
         self.assertEqual(to_english_numerals("123"), "123") # Already English
 
+    def test_format_persian_number(self):
+        self.assertEqual(format_persian_number(1234567.891, precision=2), "۱٬۲۳۴٬۵۶۷٫۸۹")
+        self.assertEqual(format_persian_number(10 ** 20), "۱۰۰٬۰۰۰٬۰۰۰٬۰۰۰٬۰۰۰٬۰۰۰٬۰۰۰")
+        self.assertEqual(format_persian_number(1e20), "۱۰۰٬۰۰۰٬۰۰۰٬۰۰۰٬۰۰۰٬۰۰۰٬۰۰۰") # بدون نماد علمی
+        self.assertEqual(format_persian_number(1e-7), "۰٫۰۰۰۰۰۰۱")
+        self.assertEqual(format_persian_number(Decimal("-12.50")), "-۱۲٫۵۰")
+        self.assertEqual(format_persian_number(5, precision=3), "۵٫۰۰۰")
+        self.assertEqual(format_persian_number(-0.001, precision=2), "۰٫۰۰") # بدون صفر منفی
+        self.assertEqual(format_persian_number(-2500, negative_style="suffix"), "۲٬۵۰۰-")
+        self.assertEqual(format_persian_number(-2500, negative_style="parentheses"), "(۲٬۵۰۰)")
+        self.assertEqual(format_persian_number(1234, thousands_separator=""), "۱۲۳۴")
+        self.assertEqual(
+            format_persian_number(1234.5, thousands_separator=",", decimal_separator=".", use_persian_numerals=False),
+            "1,234.5"
+        )
+        for value in ("12", None, True):
+            with self.subTest(value=value):
+                with self.assertRaises(TypeError):
+                    format_persian_number(value) # type: ignore
+        with self.assertRaises(ValueError):
+            format_persian_number(float("nan"))
+        with self.assertRaises(ValueError):
+            format_persian_number(1, precision=-1)
+        with self.assertRaises(ValueError):
+            format_persian_number(1, negative_style="left")
+
+    def test_format_persian_numbers(self):
+        values = [1500, -20.5, 0, Decimal("0.25"), 10 ** 12]
+        expected = [format_persian_number(value, negative_style="suffix") for value in values]
+        self.assertEqual(format_persian_numbers(values, negative_style="suffix"), expected)
+        self.assertEqual(format_persian_numbers(iter([1, 2])), ["۱", "۲"])
+        self.assertEqual(format_persian_numbers([]), [])
+        with self.assertRaises(ValueError):
+            format_persian_numbers([1], thousands_separator="\n")
+
+    @unittest.skipIf(numpy is None, "numpy نصب نیست")
+    def test_format_persian_numbers_numpy(self):
+        self.assertEqual(format_persian_numbers(numpy.array([1234, -5])), ["۱٬۲۳۴", "-۵"])
+        self.assertEqual(format_persian_numbers(numpy.array([1.5, 2.25]), precision=1), ["۱٫۵", "۲٫۲"])
+        self.assertEqual(format_persian_number(numpy.int64(-7)), "-۷")
+        with self.assertRaises(ValueError):
+            format_persian_numbers(numpy.zeros((2, 2)))
+
+    def test_parse_persian_number(self):
+        self.assertEqual(parse_persian_number("۱۲٬۳۴۵٫۶۷"), 12345.67)
+        self.assertEqual(parse_persian_number("١٢٣"), 123)
+        self.assertIsInstance(parse_persian_number("١٢٣"), int)
+        self.assertEqual(parse_persian_number("1,234,567.5"), 1234567.5)
+        self.assertEqual(parse_persian_number(" \u200e-۱۲\u200f "), -12) # نشانه‌های جهت متن
+        self.assertEqual(parse_persian_number("\u2212۷"), -7)
+        self.assertEqual(parse_persian_number("۲٬۵۰۰-"), -2500)
+        self.assertEqual(parse_persian_number("(۲٬۵۰۰)"), -2500)
+        self.assertEqual(parse_persian_number("٫۵"), 0.5)
+        self.assertEqual(parse_persian_number("1e3"), 1000.0)
+        self.assertEqual(parse_persian_number("۰٫۱", as_decimal=True), Decimal("0.1"))
+        self.assertEqual(parse_persian_number("9" * 30), int("9" * 30))
+        for text in ("", "-", "۱۲۳۴٬۵۶۷", "1,23", "۱۲ ۳۴", "12.", "(-5)", "(5", "-5-", "abc"):
+            with self.subTest(text=text):
+                with self.assertRaises(ValueError):
+                    parse_persian_number(text)
+        with self.assertRaises(TypeError):
+            parse_persian_number(12) # type: ignore
+
+    def test_parse_persian_numbers(self):
+        texts = ["۱۲٬۳۴۵", "١٢٣", "نامعلوم"]
+        self.assertEqual(parse_persian_numbers(texts, errors="coerce"), [12345, 123, None])
+        with self.assertRaises(ValueError):
+            parse_persian_numbers(texts)
+        with self.assertRaises(ValueError):
+            parse_persian_numbers(texts, errors="ignore")
+        with self.assertRaises(TypeError):
+            parse_persian_numbers(["۱", 2]) # type: ignore
+        self.assertEqual(parse_persian_numbers(["۱\n", "۲"]), [1, 2])
+        self.assertEqual(parse_persian_numbers(iter([])), [])
+        self.assertEqual(parse_persian_numbers(["۱۲"]), [12]) # بدون use_numpy همیشه لیست، حتی با نصب بودن NumPy
+        # خروجی format_persian_numbers با هر سبک علامت منفی دوباره به همان اعداد تجزیه می‌شود
+        values = [0, -1, 1234567, -0.5, 98765.4321, 10 ** 15, -2.5e-5]
+        for negative_style in ("prefix", "suffix", "parentheses"):
+            with self.subTest(negative_style=negative_style):
+                texts = format_persian_numbers(values, negative_style=negative_style)
+                self.assertEqual(parse_persian_numbers(texts), values)
+
+    @unittest.skipIf(numpy is None, "numpy نصب نیست")
+    def test_parse_persian_numbers_numpy(self):
+        self.assertIsInstance(parse_persian_numbers(numpy.array(["۱۲"])), list)
+        integers = parse_persian_numbers(numpy.array(["۱۲٬۳۴۵", "-٧"]), use_numpy=True)
+        self.assertEqual(integers.dtype, numpy.int64)
+        self.assertEqual(integers.tolist(), [12345, -7])
+        floats = parse_persian_numbers(["۱۲٫۵", "x", "۳"], errors="coerce", use_numpy=True)
+        self.assertEqual(floats.dtype, numpy.float64)
+        self.assertEqual(floats[0], 12.5)
+        self.assertTrue(numpy.isnan(floats[1]))
+        self.assertEqual(parse_persian_numbers(["1", "9" * 30], use_numpy=True).tolist(), [1, int("9" * 30)])
+
 if __name__ == '__main__':
     unittest.main()
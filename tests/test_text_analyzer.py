@@ -1,7 +1,11 @@
 # tests/test_text_analyzer.py
 
+import os
+import tempfile
 import unittest
-from farsinum.text_analyzer import count_words, count_sentences, count_paragraphs
+from unittest import mock
+from farsinum import text_analyzer
+from farsinum.text_analyzer import count_words, count_sentences, count_paragraphs, analyze_text, TextStats, count_file
 
 class TestTextAnalyzer(unittest.TestCase):
 
@@ -31,6 +35,73 @@ class TestTextAnalyzer(unittest.TestCase):
         self.assertEqual(count_paragraphs("   \n   "), 0) # فقط فضای خالی
         self.assertEqual(count_paragraphs("خط اول\nخط دوم\nخط سوم"), 1) # بدون خط خالی بینشان
 
+    def test_analyze_text(self):
+        stats = analyze_text("سلام دنیا. Hello ۱۲۳!\n\nپاراگراف دوم و 45")
+        self.assertEqual(stats.words, 8)
+        self.assertEqual(stats.sentences, 3)
+        self.assertEqual(stats.paragraphs, 2)
+        self.assertEqual(stats.characters, len("سلام دنیا. Hello ۱۲۳!\n\nپاراگراف دوم و 45"))
+        self.assertEqual(stats.persian_characters, 20)
+        self.assertEqual(stats.latin_characters, 5)
+        self.assertEqual(stats.digits, 5)
+        self.assertEqual(analyze_text(""), TextStats())
+        self.assertEqual(analyze_text("   \n  ").to_dict()["words"], 0)
+        with self.assertRaises(AttributeError):
+            stats.extra = 1 # type: ignore # __slots__
+        with self.assertRaises(TypeError):
+            analyze_text(None) # type: ignore
+
+    def test_analyze_text_matches_counters(self):
+        texts = [
+            "سلام دنیا، این یک تست است.", "  سلام   دنیا  ", "یک\nکلمه\nدیگر", "سلام!!! خوبی؟؟؟", "...",
+            "پاراگراف اول.\n \nپاراگراف دوم.\n\n\nپاراگراف سوم.", "قیمت ۲.۵ دلار است.", "a.b!c\n\n\n?", "",
+        ]
+        for text in texts:
+            with self.subTest(text=text):
+                stats = analyze_text(text)
+                self.assertEqual(stats.words, count_words(text))
+                self.assertEqual(stats.sentences, count_sentences(text))
+                self.assertEqual(stats.paragraphs, count_paragraphs(text))
+
+    def test_count_file(self):
+        text = "سلام دنیا!!! این یک تست است؟\n\n \nپاراگراف دوم: ۲.۵ دلار... Hello world.\r\n\r\n" * 20 + "کتاب‌ها\n"
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "corpus.txt")
+            with open(path, "w", encoding="utf-8", newline="") as file:
+                file.write("\ufeff" + text) # BOM شمرده نمی‌شود
+            expected = analyze_text(text)
+            self.assertEqual(count_file(path), expected)
+            # پنجره‌های کوچک: جداکننده پاراگراف و علائم پایان جمله روی مرز پنجره‌ها می‌افتند
+            for window_size in (1, 5, 13, 64):
+                with self.subTest(window_size=window_size):
+                    self.assertEqual(count_file(path, window_size=window_size), expected)
+            self.assertEqual(count_file(path, workers=3, window_size=7), expected)
+
+            empty_path = os.path.join(directory, "empty.txt")
+            open(empty_path, "w").close()
+            self.assertEqual(count_file(empty_path, workers=2), TextStats())
+            with self.assertRaises(ValueError):
+                count_file(path, window_size=0)
+
+    def test_count_file_bounded_windows(self):
+        # متن غیرعربی (سیریلیک، عبری، CJK) و دنباله‌های طولانی بدون فاصله هم در پنجره‌های محدود خوانده می‌شوند
+        text = ("Привет мир. שלום! 漢字テキスト。" * 50 + "漢字。" * 300 + "x" * 40 + "۲.۵\n\n") * 3
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "corpus.txt")
+            with open(path, "w", encoding="utf-8") as file:
+                file.write(text)
+            expected = analyze_text(text)
+            windows = []
+            scan = text_analyzer._scan_text
+            with mock.patch.object(text_analyzer, "_scan_text", side_effect=lambda chunk: windows.append(chunk) or scan(chunk)):
+                self.assertEqual(count_file(path, window_size=16), expected)
+            # بلندترین توکن ("x" * 40) از پنجره بلندتر است و فقط همان پنجره از ۲ * window_size بزرگ‌تر می‌شود
+            self.assertLessEqual(max(len(chunk.encode("utf-8")) for chunk in windows), 2 * 40)
+            self.assertGreater(len(windows), len(text.encode("utf-8")) // 64)
+            for window_size in (1, 7, 64):
+                with self.subTest(window_size=window_size):
+                    self.assertEqual(count_file(path, window_size=window_size), expected)
+
     def test_input_types(self):
         with self.assertRaises(TypeError):
             count_words(123) # type: ignore
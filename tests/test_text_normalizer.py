@@ -1,5 +1,9 @@
 # tests/test_text_normalizer.py
 
+import io
+import os
+import tempfile
+import threading
 import unittest
 from farsinum.text_normalizer import (
     normalize_characters,
@@ -9,9 +13,43 @@ from farsinum.text_normalizer import (
     standardize_ellipsis,
     add_zwnj_to_common_suffixes,
     persian_text_normalizer,
+    Normalizer,
+    normalize_stream,
+    normalize_file,
+    normalize_many,
+    needs_normalization,
+    NormalizationCache,
+    configure_normalization_cache,
+    NORMALIZATION_CACHE,
     ZWNJ
 )
 
+
+def _legacy_pipeline(text):
+    # ترتیب قدیمی مراحل persian_text_normalizer برای مقایسه با موتور ترکیبی
+    text = normalize_line_breaks(text)
+    text = normalize_characters(text)
+    text = cleanup_spacing(text)
+    text = standardize_quotes(text)
+    text = standardize_ellipsis(text)
+    text = add_zwnj_to_common_suffixes(text)
+    return cleanup_spacing(text)
+
+
+_TRICKY_TEXTS = [
+    '',
+    '   ',
+    'سلام    دنیا.',
+    'كتاب_ها و دفتر\tها',
+    'خط اول\r\nخط دوم\rخط سوم\n\n\n  \n خط چهارم',
+    '"نقل قول..." و "دیگری" . . . تمام',
+    f'نیم  {ZWNJ} {ZWNJ}{ZWNJ}  فاصله {ZWNJ}',
+    'hello max world ، test.test',
+    'ﻛﺘﺎﺏ ١٢.٥ درصد٪ ؟!',
+    'ء\x0b \xa0خوب تر ترین\u2028ها',
+    '  اين يك متن تست است ، با كاراكتر هاي عربي مثل ك و ي .  همچنين ١٢٣ عدد عربي و فاصله هاي اضافي ... \n\n "نقل قول" هم داريم. كتاب ها و خوب ترين ها . ',
+]
+
 class TestTextNormalizer(unittest.TestCase):
 
     def test_normalize_characters(self):
@@ -21,6 +59,21 @@ class TestTextNormalizer(unittest.TestCase):
         self.assertEqual(normalize_characters("٠١٢٣٤٥٦٧٨٩"), "۰۱۲۳۴۵۶۷۸۹")
         self.assertEqual(normalize_characters("سلام خوبی؟ چکار میکنی"), "سلام خوبی؟ چکار میکنی") # ی و ک فارسی
 
+    def test_needs_normalization(self):
+        self.assertFalse(needs_normalization("کتاب فارسی ۱۲۳"))
+        self.assertFalse(needs_normalization("plain ascii"))
+        self.assertFalse(needs_normalization(""))
+        self.assertTrue(needs_normalization("كتاب"))
+        self.assertTrue(needs_normalization("٣"))
+        self.assertTrue(needs_normalization("\ufedb\ufe98\ufe8e\ufe8f")) # اشکال نمایشی عربی
+        self.assertTrue(needs_normalization("ﷲ"))
+        for text in ("کتاب فارسی", "\ufedb\ufe98\ufe8e\ufe8f", "ﻛ ي ١"):
+            self.assertEqual(needs_normalization(text), normalize_characters(text) != text)
+        self.assertFalse(Normalizer().needs_normalization("سلام"))
+        self.assertTrue(Normalizer().needs_normalization("سلام\r\n"))
+        with self.assertRaises(TypeError):
+            needs_normalization(None) # type: ignore
+
     def test_normalize_line_breaks(self):
         self.assertEqual(normalize_line_breaks("خط اول\r\nخط دوم\rخط سوم\nخط چهارم"),
                          "خط اول\nخط دوم\nخط سوم\nخط چهارم")
@@ -52,6 +105,17 @@ class TestTextNormalizer(unittest.TestCase):
         self.assertEqual(add_zwnj_to_common_suffixes("کلمه ترین"), f"کلمه{ZWNJ}ترین")
         self.assertEqual(add_zwnj_to_common_suffixes("کتابهای خوب"), f"کتابهای خوب") # از قبل چسبیده
 
+    def test_add_zwnj_to_verb_prefixes(self):
+        self.assertEqual(add_zwnj_to_common_suffixes("نمی رود"), f"نمی{ZWNJ}رود")
+        self.assertEqual(add_zwnj_to_common_suffixes("آنها می  گویند"), f"آنها می{ZWNJ}گویند")
+        self.assertEqual(add_zwnj_to_common_suffixes("می_خواستند"), f"می{ZWNJ}خواستند")
+        self.assertEqual(add_zwnj_to_common_suffixes("می آیم و کتاب ها را می خوانم"), f"می{ZWNJ}آیم و کتاب{ZWNJ}ها را می{ZWNJ}خوانم")
+        self.assertEqual(add_zwnj_to_common_suffixes("می و مطرب"), "می و مطرب") # کلمه بعدی فعل نیست
+        self.assertEqual(add_zwnj_to_common_suffixes("سیمی رود"), "سیمی رود") # «می» جزئی از کلمه است
+        self.assertEqual(add_zwnj_to_common_suffixes("می\nرود"), "می\nرود") # از روی شکست خط عبور نمی‌کند
+        self.assertEqual(persian_text_normalizer("نمی دانیم."), f"نمی{ZWNJ}دانیم.")
+        self.assertEqual(Normalizer(zwnj_suffixes=False)("نمی دانیم"), "نمی  دانیم")
+
     def test_persian_text_normalizer_comprehensive(self):
         text = '  اين يك متن تست است ، با كاراكتر هاي عربي مثل ك و ي .  همچنين ١٢٣ عدد عربي و فاصله هاي اضافي ... \n\n "نقل قول" هم داريم. كتاب ها و خوب ترين ها . '
         expected = f'این یک متن تست است، با کاراکتر های عربی مثل ک و ی. همچنین ۱۲۳ عدد عربی و فاصله های اضافی…\n\n«نقل قول» هم داریم. کتاب{ZWNJ}ها و خوب{ZWNJ}ترین{ZWNJ}ها.'
@@ -74,6 +138,158 @@ class TestTextNormalizer(unittest.TestCase):
         self.assertEqual(persian_text_normalizer("كتاب ها"), f"کتاب{ZWNJ}ها")
         self.assertEqual(persian_text_normalizer('"نقل قول..."'), "«نقل قول…»")
 
+    def test_normalizer_matches_legacy_pipeline(self):
+        normalizer = Normalizer()
+        for text in _TRICKY_TEXTS:
+            with self.subTest(text=text):
+                self.assertEqual(normalizer(text), _legacy_pipeline(text))
+                self.assertEqual(persian_text_normalizer(text), _legacy_pipeline(text))
+
+    def test_normalizer_options(self):
+        self.assertEqual(Normalizer(quotes=False)('"الف"'), '"الف"')
+        self.assertEqual(Normalizer(ellipsis=False)('صبر...'), 'صبر...')
+        self.assertEqual(Normalizer(zwnj_suffixes=False)('کتاب_ها'), 'کتاب_ها')
+        self.assertEqual(Normalizer(character_map={'ۀ': 'ه'})('خانۀ'), 'خانه')
+        with self.assertRaises(TypeError):
+            Normalizer()(None) # type: ignore
+
+    def test_normalize_stream_matches_whole_text(self):
+        text = 'سلام "دنیا" می\nرود...\n\n\nپاراگراف دوم' + ZWNJ + '\n \n' + ZWNJ + ' سوم. . .\r\n\r\nكتاب_ها "پایان"\nخط آخر'
+        expected = persian_text_normalizer(text)
+        for size in (1, 2, 5, 17):
+            parts = [text[i:i + size] for i in range(0, len(text), size)]
+            for chunk in ("paragraph", "line"):
+                with self.subTest(size=size, chunk=chunk):
+                    self.assertEqual("".join(normalize_stream(parts, chunk=chunk)), expected)
+                    self.assertEqual("".join(normalize_stream(io.StringIO(text), chunk=chunk, buffer_size=size)), expected)
+
+    def test_normalize_stream_chunks(self):
+        self.assertEqual(list(normalize_stream('"الف"\n\n"ب"')), ['«الف»', '\n\n»ب»'])
+        self.assertEqual(list(normalize_stream('الف\nب', chunk="line")), ['الف', '\nب'])
+        self.assertEqual(list(normalize_stream(['  ', '\n'])), [])
+        with self.assertRaises(ValueError):
+            list(normalize_stream('متن', chunk="sentence"))
+
+    def test_normalize_file(self):
+        text = 'اين يك متن است...\r\n\r\nكتاب_ها "خوب" اند'
+        with tempfile.TemporaryDirectory() as directory:
+            source = os.path.join(directory, 'in.txt')
+            target = os.path.join(directory, 'out.txt')
+            with open(source, 'w', encoding='utf-8', newline='') as f:
+                f.write(text)
+            normalize_file(source, target, buffer_size=4)
+            with open(target, encoding='utf-8', newline='') as f:
+                self.assertEqual(f.read(), persian_text_normalizer(text))
+
+    def test_normalize_many(self):
+        texts = [f'كتاب_ها شماره {i} ...' for i in range(50)] + _TRICKY_TEXTS
+        expected = [persian_text_normalizer(text) for text in texts]
+        self.assertEqual(normalize_many(texts), expected) # کمتر از آستانه: در همین پردازه
+        self.assertEqual(normalize_many(iter(texts), workers=1, parallel_threshold=0), expected)
+        self.assertEqual(normalize_many((t for t in texts), workers=2, chunksize=7, parallel_threshold=0), expected)
+        self.assertEqual(normalize_many([], workers=2, parallel_threshold=0), [])
+        with self.assertRaises(TypeError):
+            normalize_many(["متن", 123], workers=2, parallel_threshold=0) # type: ignore
+
+    def test_normalize_with_alignment(self):
+        text = '  ء كتاب_ها   "خوب" ... ﻛﺘﺎﺏ اند\r\n'
+        normalized, offsets = persian_text_normalizer(text, return_alignment=True)
+        self.assertEqual(normalized, persian_text_normalizer(text))
+        self.assertEqual(len(offsets), len(normalized) + 1)
+        self.assertEqual(list(offsets), sorted(offsets))
+        start = normalized.index('خوب')
+        self.assertEqual(text[offsets[start]:offsets[start + 3]], 'خوب')
+        start = normalized.index(f'کتاب{ZWNJ}ها')
+        self.assertEqual(text[offsets[start]:offsets[start + 7]], 'كتاب_ها')
+        start = normalized.index('\u0643\u062a\u0627\u0628') # NFKC به ك عربی می‌رسد
+        self.assertEqual(text[offsets[start]:offsets[start + 4]], '\ufedb\ufe98\ufe8e\ufe8f')
+        self.assertEqual(text[offsets[normalized.index('«')]], '"')
+
+        for normalizer in (Normalizer(), Normalizer(quotes=False, zwnj_suffixes=False)):
+            for text in _TRICKY_TEXTS:
+                with self.subTest(text=text):
+                    normalized, offsets = normalizer.normalize_with_alignment(text)
+                    self.assertEqual(normalized, normalizer.normalize(text))
+                    self.assertEqual(len(offsets), len(normalized) + 1)
+                    self.assertEqual(list(offsets), sorted(offsets))
+        self.assertEqual(list(Normalizer().normalize_with_alignment('')[1]), [0])
+        with self.assertRaises(TypeError):
+            Normalizer().normalize_with_alignment(None) # type: ignore
+
+    def test_normalization_cache(self):
+        cache = NormalizationCache(max_bytes=2000, max_length=20)
+        normalizer = Normalizer(cache=cache)
+        for text in ("كتاب ها", "الف", "كتاب ها", "x" * 30, "الف"):
+            self.assertEqual(normalizer(text), persian_text_normalizer(text))
+        self.assertEqual(cache.stats()["hits"], 2)
+        self.assertEqual(cache.stats()["misses"], 2) # متن بلندتر از max_length کش نمی‌شود
+        self.assertEqual(len(cache), 2)
+
+        for i in range(100):
+            normalizer(f"متن {i}")
+        stats = cache.stats()
+        self.assertGreater(stats["evictions"], 0)
+        self.assertLessEqual(stats["bytes"], 2000)
+        self.assertEqual(normalizer("متن 99"), "متن 99")
+        self.assertEqual(cache.stats()["hits"], stats["hits"] + 1) # جدیدترین مورد هنوز در کش است
+
+        normalizer.normalize("متن 99", use_cache=False)
+        self.assertEqual(cache.stats()["hits"], stats["hits"] + 1)
+        cache.enabled = False
+        normalizer.normalize("متن 99")
+        normalizer.normalize("متن 99", use_cache=True)
+        self.assertEqual(cache.stats()["hits"], stats["hits"] + 2)
+
+        cache.configure(max_bytes=200)
+        self.assertLessEqual(cache.stats()["bytes"], 200)
+        cache.clear()
+        self.assertEqual(cache.stats()["entries"], 0)
+        with self.assertRaises(ValueError):
+            NormalizationCache(max_bytes=0)
+
+    def test_normalization_cache_threads(self):
+        cache = NormalizationCache(max_bytes=4000)
+        normalizer = Normalizer(cache=cache)
+        texts = [f"كتاب ها {i % 40}" for i in range(400)]
+        expected = [persian_text_normalizer(text) for text in texts]
+        errors = []
+
+        def work():
+            if [normalizer(text) for text in texts] != expected:
+                errors.append(True)
+
+        threads = [threading.Thread(target=work) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(errors, [])
+        stats = cache.stats()
+        self.assertEqual(stats["hits"] + stats["misses"], 1600)
+        self.assertLessEqual(stats["bytes"], 4000)
+
+    def test_configure_normalization_cache(self):
+        # تنظیمات سراسری کش بعد از تست کامل برگردانده می‌شود تا روی تست‌های دیگر اثر نگذارد
+        previous = (NORMALIZATION_CACHE.enabled, NORMALIZATION_CACHE.max_bytes, NORMALIZATION_CACHE.max_length)
+        cache = configure_normalization_cache(max_bytes=1 << 16)
+        self.assertIs(cache, NORMALIZATION_CACHE)
+        try:
+            cache.clear()
+            persian_text_normalizer("كتاب ها")
+            persian_text_normalizer("كتاب ها")
+            persian_text_normalizer("كتاب ها", use_cache=False)
+            self.assertEqual(cache.stats()["hits"], 1)
+            self.assertEqual(cache.stats()["misses"], 1)
+            configure_normalization_cache(enabled=False)
+            cache.clear()
+            persian_text_normalizer("كتاب ها")
+            self.assertEqual(cache.stats()["misses"], 0)
+        finally:
+            enabled, max_bytes, max_length = previous
+            configure_normalization_cache(enabled=enabled, max_bytes=max_bytes, max_length=max_length)
+            cache.clear()
+        self.assertEqual((cache.enabled, cache.max_bytes, cache.max_length), previous)
+
     def test_persian_text_normalizer_error(self):
         with self.assertRaises(TypeError):
             persian_text_normalizer(123) # type: ignore
@@ -0,0 +1,71 @@
+# tests/test_tokenizer.py
+
+import types
+import unittest
+from farsinum.tokenizer import (
+    iter_tokens, iter_words, WORD, NUMBER, PUNCTUATION, ZWNJ, TOKEN_PATTERN,
+    TOKEN_PERSIAN_WORD, TOKEN_LATIN_WORD, TOKEN_OTHER_WORD, TOKEN_NUMBER, TOKEN_PUNCTUATION
+)
+
+
+def _tokens(text):
+    return [(text[start:end], kind) for start, end, kind in iter_tokens(text)]
+
+
+class TestTokenizer(unittest.TestCase):
+
+    def test_words_and_punctuation(self):
+        self.assertEqual(_tokens("این فیلم «عالی» بود."), [
+            ("این", WORD), ("فیلم", WORD), ("«", PUNCTUATION), ("عالی", WORD), ("»", PUNCTUATION),
+            ("بود", WORD), (".", PUNCTUATION),
+        ])
+        self.assertEqual(_tokens("خوب!!"), [("خوب", WORD), ("!", PUNCTUATION), ("!", PUNCTUATION)])
+        self.assertEqual(_tokens("سلام،دنیا"), [("سلام", WORD), ("،", PUNCTUATION), ("دنیا", WORD)])
+
+    def test_zwnj(self):
+        self.assertEqual(_tokens(f"کتاب{ZWNJ}ها می{ZWNJ}روند"), [(f"کتاب{ZWNJ}ها", WORD), (f"می{ZWNJ}روند", WORD)])
+        self.assertEqual(_tokens(f"کتاب{ZWNJ} ها"), [("کتاب", WORD), ("ها", WORD)]) # ZWNJ تنها توکن نیست
+        self.assertEqual(_tokens(f"{ZWNJ}{ZWNJ}"), [])
+        self.assertEqual(_tokens("کِتاب"), [("کِتاب", WORD)]) # اعراب جزئی از کلمه است
+
+    def test_numbers(self):
+        self.assertEqual(_tokens("قیمت ۲.۵ دلار"), [("قیمت", WORD), ("۲.۵", NUMBER), ("دلار", WORD)])
+        self.assertEqual(_tokens("1,000.50 و ١٢٣٫٤"), [("1,000.50", NUMBER), ("و", WORD), ("١٢٣٫٤", NUMBER)])
+        self.assertEqual(_tokens("۱۴۰۲/۰۱/۰۱."), [("۱۴۰۲/۰۱/۰۱", NUMBER), (".", PUNCTUATION)])
+        self.assertEqual(_tokens("۱۲کتاب"), [("۱۲", NUMBER), ("کتاب", WORD)])
+        self.assertEqual(_tokens("3."), [("3", NUMBER), (".", PUNCTUATION)])
+
+    def test_scripts(self):
+        self.assertEqual(_tokens("Python و پایتون"), [("Python", WORD), ("و", WORD), ("پایتون", WORD)])
+        self.assertEqual(_tokens("abcد"), [("abc", WORD), ("د", WORD)])
+        self.assertEqual(_tokens("snake_case"), [("snake", WORD), ("_", PUNCTUATION), ("case", WORD)])
+
+    def test_spans(self):
+        text = "  «سلام»\n\tدنیا ۱۲ "
+        for start, end, _ in iter_tokens(text):
+            self.assertTrue(text[start:end].strip())
+        self.assertEqual("".join(text[s:e] for s, e, _ in iter_tokens(text)), "«سلام»دنیا۱۲")
+
+    def test_iter_words(self):
+        self.assertEqual(list(iter_words("این فیلم «عالی» بود، ۱۰ از ۱۰.")), ["این", "فیلم", "عالی", "بود", "۱۰", "از", "۱۰"])
+        self.assertIsInstance(iter_tokens("متن"), types.GeneratorType) # تنبل
+        self.assertEqual(list(iter_words("")), [])
+
+    def test_token_pattern(self):
+        # نوع دقیق توکن با شماره گروه تطبیق‌خورده الگو مشخص می‌شود
+        text = "کتاب OK Привет ۲.۵!"
+        self.assertEqual([(match.group(), match.lastindex) for match in TOKEN_PATTERN.finditer(text)], [
+            ("کتاب", TOKEN_PERSIAN_WORD), ("OK", TOKEN_LATIN_WORD), ("Привет", TOKEN_OTHER_WORD),
+            ("۲.۵", TOKEN_NUMBER), ("!", TOKEN_PUNCTUATION),
+        ])
+        self.assertEqual([match.span() for match in TOKEN_PATTERN.finditer(text)], [(start, end) for start, end, _ in iter_tokens(text)])
+
+    def test_input_types(self):
+        with self.assertRaises(TypeError):
+            iter_tokens(None) # type: ignore
+        with self.assertRaises(TypeError):
+            iter_words(123) # type: ignore
+
+
+if __name__ == '__main__':
+    unittest.main()